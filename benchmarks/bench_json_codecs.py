@@ -0,0 +1,60 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+# Compares the installed JSON codecs on decoding and encoding a listing of subscriptions.
+#
+# Usage: python -m benchmarks.bench_json_codecs [number of objects]
+import sys
+
+from benchmarks.bench_models_memory import make_subscription_dict
+from benchmarks.bench_serializers import best_of
+from subscription_manager_client.json_codec import JSONCodec, OrjsonCodec, UjsonCodec
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+def main(count: int = 100_000) -> None:
+    subscription_dicts = [make_subscription_dict(index) for index in range(count)]
+    body = JSONCodec().dumps(subscription_dicts)
+
+    print(f'{"codec":<8} {"loads (ms)":>10} {"dumps (ms)":>10}  ({count} objects, {len(body) / 1e6:.1f} MB)')
+    for codec_class in (JSONCodec, UjsonCodec, OrjsonCodec):
+        try:
+            codec = codec_class()
+        except ImportError:
+            print(f'{codec_class.name:<8} {"not installed":>21}')
+            continue
+
+        loads = best_of(lambda: codec.loads(body))
+        dumps = best_of(lambda: codec.dumps(subscription_dicts))
+        print(f'{codec.name:<8} {loads * 1e3:>10.2f} {dumps * 1e3:>10.2f}')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
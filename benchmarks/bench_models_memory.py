@@ -0,0 +1,91 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+# Compares the memory footprint of the regular models against their slot based counterparts.
+#
+# Usage: python -m benchmarks.bench_models_memory [number of objects]
+import sys
+import tracemalloc
+import typing as t
+
+from subscription_manager_client.models import Topic, Subscription, CompactTopic, CompactSubscription, QOS
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+def make_subscription_dict(index: int) -> t.Dict[str, t.Any]:
+    return {
+        'queue': f'queue_{index}',
+        'topic': {
+            'name': f'topic_{index % 50}',
+            'id': index % 50
+        },
+        'active': True,
+        'qos': QOS.AT_LEAST_ONCE.value,
+        'durable': bool(index % 2),
+        'id': index
+    }
+
+
+def measure(factory: t.Callable[[t.Dict[str, t.Any]], t.Any], dicts: t.List[t.Dict[str, t.Any]]) -> float:
+    """
+    :return: the average number of bytes allocated per created object
+    """
+    tracemalloc.start()
+    snapshot_before = tracemalloc.take_snapshot()
+
+    objects = [factory(object_dict) for object_dict in dicts]
+
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in snapshot_after.compare_to(snapshot_before, 'filename'))
+    del objects
+
+    return allocated / len(dicts)
+
+
+def main(count: int = 100_000) -> None:
+    subscription_dicts = [make_subscription_dict(index) for index in range(count)]
+    topic_dicts = [object_dict['topic'] for object_dict in subscription_dicts]
+
+    rows = [
+        ('Topic', measure(Topic.from_json, topic_dicts)),
+        ('CompactTopic', measure(CompactTopic.from_json, topic_dicts)),
+        ('Subscription', measure(Subscription.from_json, subscription_dicts)),
+        ('CompactSubscription', measure(CompactSubscription.from_json, subscription_dicts)),
+    ]
+
+    print(f'{"model":<20} {"bytes/object":>12}  ({count} objects)')
+    for name, size in rows:
+        print(f'{name:<20} {size:>12.1f}')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,88 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+# Compares the generated serializers of the models against the reflective implementation they replaced.
+#
+# Usage: python -m benchmarks.bench_serializers [number of objects]
+import sys
+import timeit
+import typing as t
+
+from benchmarks.bench_models_memory import make_subscription_dict
+from subscription_manager_client.models import Subscription, QOS
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+def legacy_to_json(subscription: Subscription) -> t.Dict[str, t.Any]:
+    props = ['queue', 'topic_id', 'active', 'qos', 'durable', 'topic', 'id']
+
+    result = {}
+
+    for prop in props:
+        attr = getattr(subscription, prop)
+        if hasattr(attr, 'to_json'):
+            attr = attr.to_json()
+        if attr is not None:
+            result[prop] = attr
+
+    return result
+
+
+def legacy_validate_qos(value: t.Any) -> None:
+    if value is not None and value not in QOS.all():
+        raise ValueError(f'qos should be one of {QOS.all()}')
+
+
+def best_of(func: t.Callable[[], t.Any], repeat: int = 5) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main(count: int = 10_000) -> None:
+    subscription_dicts = [make_subscription_dict(index) for index in range(count)]
+    subscriptions = [Subscription.from_json(object_dict) for object_dict in subscription_dicts]
+    qos_values = [object_dict['qos'] for object_dict in subscription_dicts]
+
+    rows = [
+        ('to_json (reflective)', best_of(lambda: [legacy_to_json(s) for s in subscriptions])),
+        ('to_json (generated)', best_of(lambda: [s.to_json() for s in subscriptions])),
+        ('from_json (validated)', best_of(lambda: [Subscription.from_json(d) for d in subscription_dicts])),
+        ('from_json (trusted)', best_of(lambda: [Subscription.from_json(d, trusted=True)
+                                                 for d in subscription_dicts])),
+        ('qos check (list)', best_of(lambda: [legacy_validate_qos(q) for q in qos_values])),
+        ('qos check (set)', best_of(lambda: [QOS.is_valid(q) for q in qos_values])),
+    ]
+
+    print(f'{"benchmark":<24} {"total (ms)":>10} {"per object (us)":>16}  ({count} objects)')
+    for name, seconds in rows:
+        print(f'{name:<24} {seconds * 1e3:>10.2f} {seconds / count * 1e6:>16.3f}')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
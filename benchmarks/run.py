@@ -0,0 +1,224 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+# Benchmarks every SubscriptionManagerClient endpoint against an in-process fake server along with the JSON codecs
+# of the models, and stores the results in a JSON file so that they can be compared between versions.
+#
+# Usage: python -m benchmarks.run [--output results.json] [--compare baseline.json] [--requests 200]
+import argparse
+import itertools
+import json
+import platform
+import statistics
+import sys
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+
+import requests
+
+from benchmarks.bench_models_memory import make_subscription_dict
+from subscription_manager_client.models import Topic, Subscription
+from subscription_manager_client.subscription_manager import SubscriptionManagerClient
+from subscription_manager_client.testing import FakeSubscriptionManager
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+CODEC_SIZES = (10, 1_000, 100_000)
+
+
+class BaseURLSession(requests.Session):
+
+    def __init__(self, base_url: str) -> None:
+        super().__init__()
+        self.base_url = base_url
+
+    def request(self, method, url, *args, **kwargs):
+        return super().request(method, urljoin(self.base_url, url), *args, **kwargs)
+
+
+def percentile(sorted_values: t.List[float], percent: float) -> float:
+    """
+    :param sorted_values:
+    :param percent: 0 to 100
+    :return: the nearest-rank percentile
+    """
+    index = max(0, min(len(sorted_values) - 1, int(round(percent / 100 * len(sorted_values))) - 1))
+
+    return sorted_values[index]
+
+
+def measure_endpoint(func: t.Callable[[], t.Any], requests_count: int, concurrency: int) -> t.Dict[str, float]:
+    def timed_call(_):
+        start = time.perf_counter()
+        func()
+        return time.perf_counter() - start
+
+    func()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = sorted(executor.map(timed_call, range(requests_count)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        'requests': requests_count,
+        'concurrency': concurrency,
+        'throughput_rps': requests_count / elapsed,
+        'mean_ms': statistics.mean(latencies) * 1e3,
+        'p50_ms': percentile(latencies, 50) * 1e3,
+        'p99_ms': percentile(latencies, 99) * 1e3,
+    }
+
+
+def endpoint_calls(client: SubscriptionManagerClient,
+                   fake: FakeSubscriptionManager,
+                   calls_count: int) -> t.Dict[str, t.Callable[[], t.Any]]:
+    topic = fake.add_topic('benchmark')
+    subscription = fake.add_subscription(topic['id'])
+    new_subscription = Subscription(topic_id=topic['id'], qos='EXACTLY_ONCE', durable=True)
+
+    # every deletion needs an existing object of its own
+    topic_ids = iter([fake.add_topic(f'deleted_{index}')['id'] for index in range(calls_count)])
+    subscription_ids = iter([fake.add_subscription(topic['id'])['id'] for _ in range(calls_count)])
+    topic_names = map('created_{}'.format, itertools.count())
+
+    return {
+        'get_topics': client.get_topics,
+        'get_topics_own': client.get_topics_own,
+        'get_topic_by_id': lambda: client.get_topic_by_id(topic['id']),
+        'post_topic': lambda: client.post_topic(Topic(name=next(topic_names))),
+        'delete_topic_by_id': lambda: client.delete_topic_by_id(next(topic_ids)),
+        'get_subscriptions': client.get_subscriptions,
+        'get_subscription_by_id': lambda: client.get_subscription_by_id(subscription['id']),
+        'post_subscription': lambda: client.post_subscription(new_subscription),
+        'put_subscription': lambda: client.put_subscription(subscription['id'], {'active': False}),
+        'delete_subscription_by_id': lambda: client.delete_subscription_by_id(next(subscription_ids)),
+        'ping_credentials': client.ping_credentials,
+    }
+
+
+def run_endpoints(requests_count: int,
+                  concurrency: int,
+                  topics_count: int = 50,
+                  subscriptions_per_topic: int = 2) -> t.Dict[str, t.Dict[str, float]]:
+    with FakeSubscriptionManager() as fake:
+        fake.populate(topics_count=topics_count, subscriptions_per_topic=subscriptions_per_topic)
+        client = SubscriptionManagerClient(request_handler=BaseURLSession(fake.base_url))
+
+        # one extra call per endpoint warms up the connection
+        calls = endpoint_calls(client, fake, calls_count=requests_count + 1)
+
+        return {name: measure_endpoint(func, requests_count, concurrency) for name, func in calls.items()}
+
+
+def measure_codec(func: t.Callable[[], t.Any], size: int, repeat: int = 3) -> t.Dict[str, float]:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    return {
+        'items': size,
+        'total_ms': best * 1e3,
+        'items_per_second': size / best,
+    }
+
+
+def run_codecs(sizes: t.Sequence[int] = CODEC_SIZES) -> t.Dict[str, t.Dict[str, float]]:
+    results = {}
+
+    for size in sizes:
+        subscription_dicts = [make_subscription_dict(index) for index in range(size)]
+        topic_dicts = [object_dict['topic'] for object_dict in subscription_dicts]
+        subscriptions = [Subscription.from_json(object_dict) for object_dict in subscription_dicts]
+        topics = [subscription.topic for subscription in subscriptions]
+
+        results.update({
+            f'Topic.from_json[{size}]': measure_codec(lambda: [Topic.from_json(d) for d in topic_dicts], size),
+            f'Topic.to_json[{size}]': measure_codec(lambda: [topic.to_json() for topic in topics], size),
+            f'Subscription.from_json[{size}]': measure_codec(
+                lambda: [Subscription.from_json(d) for d in subscription_dicts], size),
+            f'Subscription.to_json[{size}]': measure_codec(lambda: [s.to_json() for s in subscriptions], size),
+        })
+
+    return results
+
+
+def compare(results: t.Dict[str, t.Any], baseline: t.Dict[str, t.Any]) -> None:
+    """
+    Prints the ratio of each measurement against the baseline. Ratios above 1 mean slower.
+    """
+    print(f'{"benchmark":<40} {"baseline":>10} {"current":>10} {"ratio":>7}')
+
+    for section, key in (('endpoints', 'p50_ms'), ('codecs', 'total_ms')):
+        for name, current in results[section].items():
+            previous = baseline.get(section, {}).get(name)
+            if previous is None:
+                continue
+            ratio = current[key] / previous[key]
+            print(f'{name + " " + key:<40} {previous[key]:>10.3f} {current[key]:>10.3f} {ratio:>7.2f}')
+
+
+def main(argv: t.Optional[t.List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Subscription Manager Client benchmarks')
+    parser.add_argument('--output', default='benchmark_results.json', help='the file the results are written to')
+    parser.add_argument('--compare', help='a previous results file to compare against')
+    parser.add_argument('--requests', type=int, default=200, help='the number of requests per endpoint')
+    parser.add_argument('--concurrency', type=int, default=1, help='the number of concurrent requests')
+    parser.add_argument('--codec-sizes', type=int, nargs='+', default=list(CODEC_SIZES))
+    args = parser.parse_args(argv)
+
+    results = {
+        'timestamp': time.time(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'endpoints': run_endpoints(args.requests, args.concurrency),
+        'codecs': run_codecs(args.codec_sizes),
+    }
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    for name, result in results['endpoints'].items():
+        print(f'{name:<28} {result["throughput_rps"]:>9.1f} req/s  '
+              f'p50 {result["p50_ms"]:>7.3f} ms  p99 {result["p99_ms"]:>7.3f} ms')
+    for name, result in results['codecs'].items():
+        print(f'{name:<36} {result["total_ms"]:>10.3f} ms  {result["items_per_second"]:>12.0f} items/s')
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
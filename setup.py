@@ -37,9 +37,14 @@ setup(
     description='Subscription Manager Client',
     author='EUROCONTROL (SWIM)',
     author_email='',
-    packages=find_packages(exclude=['tests']),
+    packages=find_packages(exclude=['tests', 'benchmarks']),
     url='https://github.com/eurocontrol-swim/subscription-manager-client',
     install_requires=[],
+    entry_points={
+        'console_scripts': [
+            'smc = subscription_manager_client.cli:main',
+        ],
+    },
     tests_require=[
         'pytest',
         'pytest-cov'
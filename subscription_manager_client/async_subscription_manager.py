@@ -0,0 +1,234 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import asyncio
+import inspect
+import typing as t
+
+from rest_client.errors import APIError
+
+from subscription_manager_client.models import Topic, Subscription, TOPIC_SERIALIZER, SUBSCRIPTION_SERIALIZER
+from subscription_manager_client.singleflight import request_key
+from subscription_manager_client.utils import SUCCESS_STATUS_CODES, get_error_detail, models_from_json
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+# an instance of an object whose get/post/put/delete methods are coroutines returning a response exposing
+# `status_code`, `content` and `json()`, i.e. httpx.AsyncClient()
+AsyncRequestHandler = t.Any
+
+
+async def _maybe_await(value):
+    if inspect.isawaitable(value):
+        return await value
+
+    return value
+
+
+class AsyncRequestor:
+
+    def __init__(self, request_handler: AsyncRequestHandler) -> None:
+        """
+        :param request_handler: an instance of an object capable of handling http requests asynchronously
+        """
+        self.request_handler = request_handler
+
+    async def perform_request(self,
+                              method: str,
+                              url: str,
+                              extra_params: t.Optional[t.Dict[str, t.Any]] = None,
+                              json: t.Optional[t.Any] = None,
+                              response_class: t.Optional[t.Any] = None,
+                              many: bool = False) -> t.Any:
+        """
+        The asynchronous counterpart of `rest_client.Requestor.perform_request`
+
+        :param method: the HTTP method
+        :param url: the url of the resource
+        :param extra_params: query parameters of the request
+        :param json: the body of the request
+        :param response_class: the model class the response will be converted to
+        :param many: whether the response is a list of objects
+        :return:
+        """
+        request_func = getattr(self.request_handler, method.lower())
+
+        kwargs = {'params': extra_params or {}}
+        if json is not None:
+            kwargs['json'] = json
+
+        response = await request_func(url, **kwargs)
+
+        if response.status_code not in SUCCESS_STATUS_CODES:
+            try:
+                detail = get_error_detail(await _maybe_await(response.json()))
+            except ValueError:
+                detail = None
+
+            raise APIError(detail=detail, status_code=response.status_code)
+
+        if not response.content:
+            return None
+
+        data = await _maybe_await(response.json())
+
+        return models_from_json(data, response_class=response_class, many=many)
+
+
+# resolves the followers of a leading coroutine that got cancelled, so that one of them takes over
+_ABANDONED = object()
+
+
+class AsyncSingleFlight:
+
+    def __init__(self) -> None:
+        """
+        Coalesces concurrent coroutines sharing the same key: only the first one is awaited while the rest wait for it
+        and receive the same result (or error). If the leading coroutine is cancelled, one of the waiting ones performs
+        the call instead.
+        """
+        self._futures: t.Dict[t.Hashable, asyncio.Future] = {}
+
+    async def do(self, key: t.Hashable, func: t.Callable[[], t.Awaitable[t.Any]]) -> t.Any:
+        future = self._futures.get(key)
+        while future is not None:
+            result = await asyncio.shield(future)
+            if result is not _ABANDONED:
+                return result
+            future = self._futures.get(key)
+
+        future = self._futures[key] = asyncio.get_running_loop().create_future()
+
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.set_result(_ABANDONED)
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # the leader re-raises the error, so the future should not complain when no one else awaits it
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            del self._futures[key]
+
+        return result
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+
+class AsyncSubscriptionManagerClient(AsyncRequestor):
+
+    _BASE_URL = 'subscription-manager/api/1.0/'
+
+    def __init__(self, request_handler: AsyncRequestHandler, coalesce_requests: bool = False) -> None:
+        """
+        :param request_handler: an instance of an object capable of handling http requests asynchronously,
+                                i.e. httpx.AsyncClient()
+        :param coalesce_requests: if True, concurrent identical GET requests result in a single HTTP request whose
+                                  result is shared among the callers
+        """
+        AsyncRequestor.__init__(self, request_handler)
+        self._request_handler = request_handler
+        self._single_flight = AsyncSingleFlight() if coalesce_requests else None
+
+        self._url_topics = self._BASE_URL + 'topics/'
+        self._url_topics_own = self._BASE_URL + 'topics/own'
+        self._url_topic_by_id = self._BASE_URL + 'topics/{topic_id}'
+        self._url_subscriptions = self._BASE_URL + 'subscriptions/'
+        self._url_subscription_by_id = self._BASE_URL + 'subscriptions/{subscription_id}'
+        self._url_ping_credentials = self._BASE_URL + 'ping-credentials'
+
+    async def perform_request(self, method: str, url: str, **kwargs) -> t.Any:
+        def perform():
+            return AsyncRequestor.perform_request(self, method, url, **kwargs)
+
+        if method == 'GET' and self._single_flight is not None:
+            key = request_key(method, url, kwargs.get('extra_params'), kwargs.get('response_class'),
+                              kwargs.get('many', False))
+            return await self._single_flight.do(key, perform)
+
+        return await perform()
+
+    async def get_topics(self) -> t.List[Topic]:
+        return await self.perform_request('GET', self._url_topics, response_class=TOPIC_SERIALIZER, many=True)
+
+    async def get_topics_own(self) -> t.List[Topic]:
+        return await self.perform_request('GET', self._url_topics_own, response_class=TOPIC_SERIALIZER, many=True)
+
+    async def get_topic_by_id(self, topic_id: int) -> Topic:
+        url = self._url_topic_by_id.format(topic_id=topic_id)
+
+        return await self.perform_request('GET', url, response_class=TOPIC_SERIALIZER)
+
+    async def post_topic(self, topic: Topic) -> Topic:
+        topic_data = topic.to_json()
+
+        return await self.perform_request('POST', self._url_topics, json=topic_data,
+                                          response_class=TOPIC_SERIALIZER)
+
+    async def delete_topic_by_id(self, topic_id: int):
+        url = self._url_topic_by_id.format(topic_id=topic_id)
+
+        await self.perform_request('DELETE', url)
+
+    async def get_subscriptions(self, queue: t.Optional[str] = None) -> t.List[Subscription]:
+        extra_params = {'queue': queue} if queue else {}
+
+        return await self.perform_request('GET', self._url_subscriptions, extra_params=extra_params,
+                                          response_class=SUBSCRIPTION_SERIALIZER, many=True)
+
+    async def get_subscription_by_id(self, subscription_id: int) -> Subscription:
+        url = self._url_subscription_by_id.format(subscription_id=subscription_id)
+
+        return await self.perform_request('GET', url, response_class=SUBSCRIPTION_SERIALIZER)
+
+    async def post_subscription(self, subscription: Subscription) -> Subscription:
+        subscription_data = subscription.to_json()
+
+        return await self.perform_request('POST', self._url_subscriptions, json=subscription_data,
+                                          response_class=SUBSCRIPTION_SERIALIZER)
+
+    async def put_subscription(self, subscription_id: int, update_data: t.Dict[str, bool]) -> Subscription:
+        url = self._url_subscription_by_id.format(subscription_id=subscription_id)
+
+        return await self.perform_request('PUT', url, json=update_data, response_class=SUBSCRIPTION_SERIALIZER)
+
+    async def delete_subscription_by_id(self, subscription_id: int):
+        url = self._url_subscription_by_id.format(subscription_id=subscription_id)
+
+        await self.perform_request('DELETE', url)
+
+    async def ping_credentials(self):
+
+        return await self.perform_request('GET', self._url_ping_credentials)
@@ -0,0 +1,92 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+DEFAULT_MAX_WORKERS = 10
+
+
+class BulkResult:
+
+    def __init__(self,
+                 item: t.Any,
+                 result: t.Any = None,
+                 error: t.Optional[Exception] = None,
+                 skipped: bool = False) -> None:
+        """
+        :param item: the input item the operation was performed for
+        :param result: the outcome of the operation in case of success
+        :param error: the exception raised by the operation in case of failure
+        :param skipped: whether the operation was not needed for this item and was not performed
+        """
+        self.item = item
+        self.result = result
+        self.error = error
+        self.skipped = skipped
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}(item={self.item!r}, result={self.result!r}, error={self.error!r}, '
+                f'skipped={self.skipped!r})')
+
+
+def run_bulk(func: t.Callable[[t.Any], t.Any],
+             items: t.Iterable[t.Any],
+             max_workers: int = DEFAULT_MAX_WORKERS) -> t.List[BulkResult]:
+    """
+    Applies `func` on every item using a bounded pool of threads. Failures do not interrupt the operation but are
+    reported in the corresponding result instead.
+
+    :param func: the operation to perform on each item
+    :param items:
+    :param max_workers: the maximum number of operations running concurrently
+    :return: one BulkResult per item, in the order of the input
+    """
+    if max_workers < 1:
+        raise ValueError('max_workers should be a positive integer')
+
+    def call(item):
+        try:
+            return BulkResult(item, result=func(item))
+        except Exception as e:
+            return BulkResult(item, error=e)
+
+    items = list(items)
+    if not items:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(call, items))
@@ -0,0 +1,266 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import sqlite3
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+
+from subscription_manager_client.json_codec import JSONCodec
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+_MISSING = object()
+
+
+class TTLCache:
+
+    def __init__(self,
+                 ttl: float = 300.0,
+                 maxsize: int = 1024,
+                 clock: t.Callable[[], float] = time.monotonic) -> None:
+        """
+        A thread safe, size bounded LRU cache whose entries expire after `ttl` seconds
+
+        :param ttl: the time to live of the entries in seconds
+        :param maxsize: the maximum number of entries kept. The least recently used ones are evicted first
+        :param clock: the source of time
+        """
+        if ttl <= 0:
+            raise ValueError('ttl should be a positive number')
+        if maxsize < 1:
+            raise ValueError('maxsize should be a positive integer')
+
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._clock = clock
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: t.Hashable, default: t.Any = None) -> t.Any:
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return default
+
+            self._entries.move_to_end(key)
+
+            return value
+
+    def set(self, key: t.Hashable, value: t.Any) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: t.Hashable) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key: t.Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class ValidatedEntry:
+
+    def __init__(self, value: t.Any, etag: t.Optional[str] = None, last_modified: t.Optional[str] = None) -> None:
+        """
+        Holds a decoded response along with the validators the server provided for it. The models decoded from it can
+        be kept in `models`, keyed by their response_class.
+
+        :param value: the decoded response
+        :param etag: the value of the ETag header of the response
+        :param last_modified: the value of the Last-Modified header of the response
+        """
+        self.value = value
+        self.etag = etag
+        self.last_modified = last_modified
+        self.models: t.Dict[t.Hashable, t.Any] = {}
+
+    @classmethod
+    def from_response(cls, response, value: t.Any) -> t.Optional['ValidatedEntry']:
+        """
+        :param response:
+        :param value: the decoded response
+        :return: None if the response carries no validators
+        """
+        headers = response.headers or {}
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+
+        if etag is None and last_modified is None:
+            return None
+
+        return cls(value, etag=etag, last_modified=last_modified)
+
+    def conditional_headers(self) -> t.Dict[str, str]:
+        headers = {}
+        if self.etag is not None:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified is not None:
+            headers['If-Modified-Since'] = self.last_modified
+
+        return headers
+
+
+class CatalogEntry(ValidatedEntry):
+
+    def __init__(self,
+                 value: t.Any,
+                 etag: t.Optional[str] = None,
+                 last_modified: t.Optional[str] = None,
+                 stored_at: float = 0.0) -> None:
+        """
+        A ValidatedEntry of a SQLiteCatalogCache
+
+        :param value: the decoded JSON records
+        :param etag:
+        :param last_modified:
+        :param stored_at: the time (since the epoch) the entry was stored or last revalidated
+        """
+        super().__init__(value, etag=etag, last_modified=last_modified)
+        self.stored_at = stored_at
+
+
+class SQLiteCatalogCache:
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS catalog (
+            key TEXT PRIMARY KEY,
+            body BLOB NOT NULL,
+            etag TEXT,
+            last_modified TEXT,
+            stored_at REAL NOT NULL
+        )
+    """
+
+    def __init__(self,
+                 path: str,
+                 revalidate_after: float = 60.0,
+                 codec: t.Optional[JSONCodec] = None,
+                 clock: t.Callable[[], float] = time.time) -> None:
+        """
+        A persistent cache of list responses, kept as their JSON records along with their validators in a SQLite
+        database, so that freshly started processes can serve them right away. The database can be shared among
+        processes.
+
+        :param path: the path of the database file
+        :param revalidate_after: the age in seconds after which an entry is revalidated with the server
+        :param codec: used to store the records. The standard library is used if not provided
+        :param clock: the source of time
+        """
+        if revalidate_after < 0:
+            raise ValueError('revalidate_after should not be negative')
+
+        self.path = path
+        self.revalidate_after = revalidate_after
+        self._codec = codec or JSONCodec()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+
+        with self._lock:
+            # WAL lets readers of other processes go on while an entry is written
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute(self._SCHEMA)
+
+    def get(self, key: str) -> t.Optional[CatalogEntry]:
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT body, etag, last_modified, stored_at FROM catalog WHERE key = ?', (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        body, etag, last_modified, stored_at = row
+
+        return CatalogEntry(self._codec.loads(body), etag=etag, last_modified=last_modified, stored_at=stored_at)
+
+    def set(self,
+            key: str,
+            value: t.Any,
+            etag: t.Optional[str] = None,
+            last_modified: t.Optional[str] = None) -> CatalogEntry:
+        entry = CatalogEntry(value, etag=etag, last_modified=last_modified, stored_at=self._clock())
+
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO catalog (key, body, etag, last_modified, stored_at) VALUES (?, ?, ?, ?, ?)',
+                (key, self._codec.dumps(value), etag, last_modified, entry.stored_at)
+            )
+
+        return entry
+
+    def touch(self, key: str) -> None:
+        """
+        Marks an entry as fresh, i.e. after the server confirmed it has not been modified
+        """
+        with self._lock:
+            self._connection.execute('UPDATE catalog SET stored_at = ? WHERE key = ?', (self._clock(), key))
+
+    def is_stale(self, entry: CatalogEntry) -> bool:
+        return self._clock() - entry.stored_at >= self.revalidate_after
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            self._connection.executemany('DELETE FROM catalog WHERE key = ?', [(key,) for key in keys])
+
+    def clear(self, prefix: str = '') -> None:
+        """
+        :param prefix: if provided, only the entries whose key starts with it are deleted
+        """
+        with self._lock:
+            self._connection.execute('DELETE FROM catalog WHERE substr(key, 1, ?) = ?', (len(prefix), prefix))
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM catalog').fetchone()[0]
@@ -0,0 +1,269 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+# The command line interface of the client, installed as `smc`.
+#
+# Only the standard library is imported at module level so that the tool starts fast. The client, along with
+# requests and the rest of its dependencies, is imported by the commands that talk to the server.
+import argparse
+import json
+import os
+import sys
+import typing as t
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+DEFAULT_MAX_WORKERS = 10
+
+QOS_CHOICES = ['AT_LEAST_ONCE', 'AT_MOST_ONCE', 'EXACTLY_ONCE']
+
+
+def _write_line(obj: t.Any, out: t.TextIO) -> None:
+    out.write(json.dumps(obj, separators=(',', ':')))
+    out.write('\n')
+    out.flush()
+
+
+def _create_client(args: argparse.Namespace):
+    from subscription_manager_client.subscription_manager import SubscriptionManagerClient
+
+    if not args.host:
+        raise SystemExit('smc: the host of the Subscription Manager is required (--host or SMC_HOST)')
+
+    verify = args.ca_bundle or not args.no_verify
+
+    return SubscriptionManagerClient.create_pooled(host=args.host, https=not args.http, verify=verify,
+                                                   username=args.username, password=args.password,
+                                                   timeout=args.timeout, pool_maxsize=args.max_workers)
+
+
+def _list_topics(client, args: argparse.Namespace, out: t.TextIO) -> int:
+    for topic in client.iter_topics():
+        _write_line(topic.to_json(), out)
+
+    return 0
+
+
+def _list_subscriptions(client, args: argparse.Namespace, out: t.TextIO) -> int:
+    for subscription in client.iter_subscriptions(queue=args.queue):
+        _write_line(subscription.to_json(), out)
+
+    return 0
+
+
+def _perform(client, operation: t.Dict[str, t.Any]) -> t.Any:
+    op = operation.get('op')
+
+    if op == 'create':
+        from subscription_manager_client.models import Subscription
+
+        topic_id = operation.get('topic_id')
+        if topic_id is None and operation.get('topic') is not None:
+            topic_id = client.resolve_topic(operation['topic'])
+        subscription = Subscription(topic_id=topic_id, qos=operation.get('qos'), durable=operation.get('durable'),
+                                    active=operation.get('active'))
+        return client.post_subscription(subscription).to_json()
+    if op in ('pause', 'resume'):
+        return client.put_subscription(operation['id'], {'active': op == 'resume'}).to_json()
+    if op == 'delete':
+        client.delete_subscription_by_id(operation['id'])
+        return None
+
+    raise ValueError(f"unknown operation '{op}'. Choose among create, pause, resume, delete")
+
+
+def _run_operations(client, operations: t.Iterable[t.Dict[str, t.Any]], max_workers: int, out: t.TextIO) -> int:
+    """
+    Performs the operations concurrently and writes their outcome as soon as it is known, in the input order. At most
+    max_workers operations are read ahead, so that an invalid operation further down stops the run after the outcome
+    of the ones before it has been written.
+
+    :return: the exit code: 1 if any operation failed, else 0
+    """
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+
+    def perform(operation):
+        try:
+            return {**operation, 'ok': True, 'result': _perform(client, operation)}
+        except Exception as e:
+            return {**operation, 'ok': False, 'error': str(e) or type(e).__name__}
+
+    failed = False
+    pending: t.Deque = deque()
+
+    def write_oldest():
+        nonlocal failed
+        outcome = pending.popleft().result()
+        _write_line(outcome, out)
+        failed = failed or not outcome['ok']
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for operation in operations:
+                pending.append(executor.submit(perform, operation))
+                while pending and (len(pending) >= max_workers or pending[0].done()):
+                    write_oldest()
+        finally:
+            while pending:
+                write_oldest()
+
+    return 1 if failed else 0
+
+
+def _read_operations(path: str) -> t.Iterator[t.Dict[str, t.Any]]:
+    """
+    :param path: a file of one JSON object per line, or - for the standard input
+    """
+    lines = sys.stdin if path == '-' else open(path)
+
+    try:
+        for number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                operation = json.loads(line)
+            except ValueError as e:
+                raise SystemExit(f'smc: {path}:{number}: invalid JSON: {e}')
+            if not isinstance(operation, dict):
+                raise SystemExit(f'smc: {path}:{number}: expected a JSON object')
+            yield operation
+    finally:
+        if lines is not sys.stdin:
+            lines.close()
+
+
+def _create_subscription(client, args: argparse.Namespace, out: t.TextIO) -> int:
+    operation = {'op': 'create', 'qos': args.qos, 'durable': args.durable, 'active': not args.inactive}
+    if args.topic_id is not None:
+        operation['topic_id'] = args.topic_id
+    else:
+        operation['topic'] = args.topic
+
+    return _run_operations(client, [operation], 1, out)
+
+
+def _update_subscriptions(op: str) -> t.Callable[[t.Any, argparse.Namespace, t.TextIO], int]:
+    def command(client, args: argparse.Namespace, out: t.TextIO) -> int:
+        return _run_operations(client, [{'op': op, 'id': id} for id in args.ids], args.max_workers, out)
+
+    return command
+
+
+def _bulk(client, args: argparse.Namespace, out: t.TextIO) -> int:
+    return _run_operations(client, _read_operations(args.file), args.max_workers, out)
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError('should be a positive integer')
+
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='smc',
+        description='Manages the topics and subscriptions of a Subscription Manager. '
+                    'Results are written as JSON lines as soon as they arrive.'
+    )
+    parser.add_argument('--host', default=os.environ.get('SMC_HOST'),
+                        help='the host of the Subscription Manager, including the port [env: SMC_HOST]')
+    parser.add_argument('--username', default=os.environ.get('SMC_USERNAME'), help='[env: SMC_USERNAME]')
+    parser.add_argument('--password', default=os.environ.get('SMC_PASSWORD'), help='[env: SMC_PASSWORD]')
+    parser.add_argument('--http', action='store_true', help='use plain HTTP instead of HTTPS')
+    parser.add_argument('--no-verify', action='store_true', help='do not verify the certificate of the server')
+    parser.add_argument('--ca-bundle', help='the CA bundle used to verify the certificate of the server')
+    parser.add_argument('--timeout', type=float, default=30.0, help='the timeout of the requests in seconds')
+    parser.add_argument('--max-workers', type=_positive_int, default=DEFAULT_MAX_WORKERS,
+                        help='the maximum number of requests in flight for bulk operations')
+
+    resources = parser.add_subparsers(dest='resource', metavar='{topics,subscriptions}')
+    resources.required = True
+
+    topics = resources.add_parser('topics', help='manage topics').add_subparsers(dest='command')
+    topics.required = True
+    topics.add_parser('list', help='list the topics').set_defaults(func=_list_topics)
+
+    subscriptions = resources.add_parser('subscriptions', help='manage subscriptions').add_subparsers(dest='command')
+    subscriptions.required = True
+
+    list_parser = subscriptions.add_parser('list', help='list the subscriptions')
+    list_parser.add_argument('--queue', help='only list the subscription of this queue')
+    list_parser.set_defaults(func=_list_subscriptions)
+
+    create_parser = subscriptions.add_parser('create', help='create a subscription')
+    topic_group = create_parser.add_mutually_exclusive_group(required=True)
+    topic_group.add_argument('--topic-id', type=int, help='the id of the topic')
+    topic_group.add_argument('--topic', help='the name of the topic')
+    create_parser.add_argument('--qos', choices=QOS_CHOICES)
+    create_parser.add_argument('--durable', action='store_true')
+    create_parser.add_argument('--inactive', action='store_true', help='create the subscription paused')
+    create_parser.set_defaults(func=_create_subscription)
+
+    for op, help in [('pause', 'pause subscriptions'), ('resume', 'resume subscriptions'),
+                     ('delete', 'delete subscriptions')]:
+        op_parser = subscriptions.add_parser(op, help=help)
+        op_parser.add_argument('ids', metavar='ID', type=int, nargs='+', help='the id of a subscription')
+        op_parser.set_defaults(func=_update_subscriptions(op))
+
+    bulk_parser = subscriptions.add_parser(
+        'bulk',
+        help='perform the operations of a file',
+        description='Performs concurrently the operations of a file of JSON lines, i.e. '
+                    '{"op": "create", "topic_id": 1, "qos": "EXACTLY_ONCE", "durable": true}, '
+                    '{"op": "create", "topic": "name"}, {"op": "pause", "id": 1}, {"op": "resume", "id": 1} or '
+                    '{"op": "delete", "id": 1}'
+    )
+    bulk_parser.add_argument('file', help='the path of the file or - for the standard input')
+    bulk_parser.set_defaults(func=_bulk)
+
+    return parser
+
+
+def main(argv: t.Optional[t.Sequence[str]] = None, out: t.TextIO = sys.stdout) -> int:
+    args = build_parser().parse_args(argv)
+    client = _create_client(args)
+
+    try:
+        return args.func(client, args, out)
+    except BrokenPipeError:
+        # i.e. piped into head
+        return 0
+    except KeyboardInterrupt:
+        return 130
+    except Exception as e:
+        sys.stderr.write(f'smc: {str(e) or type(e).__name__}\n')
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,289 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import typing as t
+from array import array
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+# stands for None in the integer and flag columns
+NULL = -1
+
+
+class DictionaryColumn:
+
+    def __init__(self) -> None:
+        """
+        A dictionary encoded column: each distinct value is kept once and the rows hold integer codes pointing to it
+        """
+        self.codes = array('i')
+        self.values: t.List[t.Any] = []
+        self._index: t.Dict[t.Any, int] = {}
+
+    def append(self, value: t.Any) -> None:
+        if value is None:
+            self.codes.append(NULL)
+            return
+
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+
+        self.codes.append(code)
+
+    def code_of(self, value: t.Any) -> t.Optional[int]:
+        """
+        :return: the code of the value or None if no row holds it
+        """
+        return NULL if value is None else self._index.get(value)
+
+    def __getitem__(self, row: int) -> t.Any:
+        code = self.codes[row]
+
+        return self.values[code] if code != NULL else None
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+def _to_int(value: t.Optional[int]) -> int:
+    return NULL if value is None else value
+
+
+def _to_flag(value: t.Optional[bool]) -> int:
+    return NULL if value is None else int(value)
+
+
+def _from_int(value: int) -> t.Optional[int]:
+    return None if value == NULL else value
+
+
+def _from_flag(value: int) -> t.Optional[bool]:
+    return None if value == NULL else bool(value)
+
+
+class SubscriptionColumns:
+
+    _INT_COLUMNS = ('id', 'topic_id')
+    _FLAG_COLUMNS = ('active', 'durable')
+    _DICTIONARY_COLUMNS = ('qos', 'queue', 'topic_name')
+
+    def __init__(self) -> None:
+        """
+        A column oriented snapshot of subscriptions meant for analysing large amounts of them: the ids and the topic
+        ids are kept in typed arrays, the active/durable flags in byte arrays and the qos, queue and topic names are
+        dictionary encoded. Missing values are stored as NULL (-1).
+        """
+        self.id = array('q')
+        self.topic_id = array('q')
+        self.active = array('b')
+        self.durable = array('b')
+        self.qos = DictionaryColumn()
+        self.queue = DictionaryColumn()
+        self.topic_name = DictionaryColumn()
+
+    def _append(self,
+                id: t.Optional[int],
+                topic_id: t.Optional[int],
+                active: t.Optional[bool],
+                durable: t.Optional[bool],
+                qos: t.Optional[str],
+                queue: t.Optional[str],
+                topic_name: t.Optional[str]) -> None:
+        self.id.append(_to_int(id))
+        self.topic_id.append(_to_int(topic_id))
+        self.active.append(_to_flag(active))
+        self.durable.append(_to_flag(durable))
+        self.qos.append(qos)
+        self.queue.append(queue)
+        self.topic_name.append(topic_name)
+
+    @classmethod
+    def from_records(cls, records: t.Iterable[t.Dict[str, t.Any]]) -> 'SubscriptionColumns':
+        """
+        :param records: subscriptions as decoded from JSON, so that no model has to be built
+        :return: SubscriptionColumns
+        """
+        columns = cls()
+
+        for record in records:
+            topic = record.get('topic') or {}
+            columns._append(
+                id=record.get('id'),
+                topic_id=topic.get('id', record.get('topic_id')),
+                active=record.get('active'),
+                durable=record.get('durable'),
+                qos=record.get('qos'),
+                queue=record.get('queue'),
+                topic_name=topic.get('name'),
+            )
+
+        return columns
+
+    @classmethod
+    def from_subscriptions(cls, subscriptions: t.Iterable[t.Any]) -> 'SubscriptionColumns':
+        """
+        :param subscriptions: Subscription or CompactSubscription instances
+        :return: SubscriptionColumns
+        """
+        columns = cls()
+
+        for subscription in subscriptions:
+            topic = subscription.topic
+            columns._append(
+                id=subscription.id,
+                topic_id=topic.id if topic is not None else subscription.topic_id,
+                active=subscription.active,
+                durable=subscription.durable,
+                qos=subscription.qos,
+                queue=subscription.queue,
+                topic_name=topic.name if topic is not None else None,
+            )
+
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def row(self, index: int) -> t.Dict[str, t.Any]:
+        return {
+            'id': _from_int(self.id[index]),
+            'topic_id': _from_int(self.topic_id[index]),
+            'active': _from_flag(self.active[index]),
+            'durable': _from_flag(self.durable[index]),
+            'qos': self.qos[index],
+            'queue': self.queue[index],
+            'topic_name': self.topic_name[index],
+        }
+
+    def _criterion(self, name: str, value: t.Any) -> t.Tuple[t.Sequence[int], t.Optional[int]]:
+        """
+        :return: the column of the criterion along with the code its values should equal, or None if no row can match
+        """
+        if name in self._INT_COLUMNS:
+            return getattr(self, name), _to_int(value)
+        if name in self._FLAG_COLUMNS:
+            return getattr(self, name), _to_flag(value)
+        if name in self._DICTIONARY_COLUMNS:
+            column = getattr(self, name)
+            return column.codes, column.code_of(value)
+
+        raise ValueError(f"cannot filter by '{name}'. Choose among "
+                         f"{list(self._INT_COLUMNS + self._FLAG_COLUMNS + self._DICTIONARY_COLUMNS)}")
+
+    def where(self, **criteria) -> array:
+        """
+        Finds the rows whose columns equal all the given values, i.e. where(active=False, durable=True, topic_id=1).
+        The comparisons run on the integer codes of the columns, over NumPy if it is installed.
+
+        :param criteria: column names and the values they should equal
+        :return: the indexes of the matching rows
+        :raises ValueError: if a column cannot be filtered by
+        """
+        criteria = [self._criterion(name, value) for name, value in criteria.items()]
+
+        if any(code is None for _, code in criteria):
+            return array('q')
+
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+
+        if numpy is not None and criteria:
+            mask = numpy.ones(len(self), dtype=bool)
+            for column, code in criteria:
+                mask &= numpy.frombuffer(column, dtype=_numpy_dtype(column)) == code
+            return array('q', numpy.flatnonzero(mask).tolist())
+
+        rows: t.Iterable[int] = range(len(self))
+        for column, code in criteria:
+            rows = [row for row in rows if column[row] == code]
+
+        return array('q', rows)
+
+    def take(self, rows: t.Iterable[int]) -> 'SubscriptionColumns':
+        """
+        :param rows: the indexes of the rows to keep, i.e. as returned by where
+        :return: a new SubscriptionColumns with only the given rows
+        """
+        columns = SubscriptionColumns()
+        for row in rows:
+            columns._append(**self.row(row))
+
+        return columns
+
+    def to_numpy(self) -> t.Dict[str, t.Any]:
+        """
+        :return: a NumPy array per column. The integer and flag columns are views over the underlying arrays, where
+                 NULL stands for missing values, while the dictionary encoded ones are decoded into object arrays
+        :raises ImportError: if NumPy is not installed
+        """
+        import numpy
+
+        result = {name: numpy.frombuffer(getattr(self, name), dtype=_numpy_dtype(getattr(self, name)))
+                  for name in self._INT_COLUMNS + self._FLAG_COLUMNS}
+
+        for name in self._DICTIONARY_COLUMNS:
+            column = getattr(self, name)
+            # NULL (-1) codes point to the trailing None
+            values = numpy.array(column.values + [None], dtype=object)
+            result[name] = values[numpy.frombuffer(column.codes, dtype=_numpy_dtype(column.codes))]
+
+        return result
+
+    def to_arrow(self) -> t.Any:
+        """
+        :return: a pyarrow.Table where the qos, queue and topic names are dictionary arrays
+        :raises ImportError: if pyarrow is not installed
+        """
+        import pyarrow
+
+        data = {}
+        for name in self._INT_COLUMNS:
+            data[name] = pyarrow.array([_from_int(value) for value in getattr(self, name)], type=pyarrow.int64())
+        for name in self._FLAG_COLUMNS:
+            data[name] = pyarrow.array([_from_flag(value) for value in getattr(self, name)], type=pyarrow.bool_())
+        for name in self._DICTIONARY_COLUMNS:
+            column = getattr(self, name)
+            data[name] = pyarrow.DictionaryArray.from_arrays(
+                pyarrow.array([_from_int(code) for code in column.codes], type=pyarrow.int32()),
+                pyarrow.array(column.values, type=pyarrow.string())
+            )
+
+        return pyarrow.table(data)
+
+    def __repr__(self) -> str:
+        return f'<SubscriptionColumns of {len(self)} rows>'
+
+
+def _numpy_dtype(column: array) -> str:
+    return f'i{column.itemsize}'
@@ -0,0 +1,164 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import json
+import typing as t
+
+from subscription_manager_client.tracing import phase, SERIALIZE, DESERIALIZE
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+class JSONCodec:
+    """
+    Encodes and decodes JSON documents. The standard library is used by default.
+    """
+
+    name = 'json'
+
+    def dumps(self, obj: t.Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    def loads(self, data: t.Union[bytes, str]) -> t.Any:
+        return json.loads(data)
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} {self.name}>'
+
+
+class OrjsonCodec(JSONCodec):
+
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, obj: t.Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+    def loads(self, data: t.Union[bytes, str]) -> t.Any:
+        return self._orjson.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+
+    name = 'ujson'
+
+    def __init__(self) -> None:
+        import ujson
+
+        self._ujson = ujson
+
+    def dumps(self, obj: t.Any) -> bytes:
+        return self._ujson.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+    def loads(self, data: t.Union[bytes, str]) -> t.Any:
+        return self._ujson.loads(data)
+
+
+_CODECS = {
+    'orjson': OrjsonCodec,
+    'ujson': UjsonCodec,
+    'json': JSONCodec,
+}
+
+
+def get_codec(name: t.Optional[str] = None) -> JSONCodec:
+    """
+    :param name: one of 'orjson', 'ujson' or 'json'. If not provided, the fastest one installed is picked
+    :return: JSONCodec
+    :raises ValueError: if the name is unknown
+    :raises ImportError: if the library of the named codec is not installed
+    """
+    if name is not None:
+        try:
+            codec_class = _CODECS[name]
+        except KeyError:
+            raise ValueError(f"unknown JSON codec '{name}'. Choose one of {list(_CODECS)}")
+        return codec_class()
+
+    for codec_class in _CODECS.values():
+        try:
+            return codec_class()
+        except ImportError:
+            continue
+
+    return JSONCodec()
+
+
+class _CodecResponse:
+
+    def __init__(self, response: t.Any, codec: JSONCodec) -> None:
+        self._response = response
+        self._codec = codec
+
+    def json(self, **kwargs) -> t.Any:
+        with phase(DESERIALIZE):
+            return self._codec.loads(self._response.content)
+
+    def __getattr__(self, name: str) -> t.Any:
+        return getattr(self._response, name)
+
+
+class CodecRequestHandler:
+
+    def __init__(self, request_handler: t.Any, codec: JSONCodec) -> None:
+        """
+        Wraps a request handler so that the JSON bodies of the requests are encoded and the responses are decoded
+        with the given codec, straight from their raw bytes, instead of the ones of the handler.
+
+        :param request_handler: i.e. requests.session()
+        :param codec:
+        """
+        self.request_handler = request_handler
+        self.codec = codec
+
+    def __getattr__(self, name: str) -> t.Any:
+        attr = getattr(self.request_handler, name)
+        if name not in ('get', 'post', 'put', 'delete', 'patch'):
+            return attr
+
+        def request(url, *args, **kwargs):
+            body = kwargs.pop('json', None)
+            if body is not None:
+                with phase(SERIALIZE):
+                    kwargs['data'] = self.codec.dumps(body)
+                kwargs['headers'] = {**(kwargs.get('headers') or {}), 'Content-Type': 'application/json'}
+
+            response = attr(url, *args, **kwargs)
+
+            # streamed responses are decoded incrementally instead
+            if kwargs.get('stream'):
+                return response
+
+            return _CodecResponse(response, self.codec)
+
+        return request
@@ -0,0 +1,161 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import typing as t
+from collections.abc import Sequence
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+class RawRecord:
+    """
+    Can be used as response_class in order to keep the decoded JSON records as they are
+    """
+
+    @staticmethod
+    def from_json(object_dict: t.Any) -> t.Any:
+        return object_dict
+
+
+_MISSING = object()
+
+
+def _lookup(record: t.Dict[str, t.Any], path: t.Tuple[str, ...]) -> t.Any:
+    for key in path:
+        if not isinstance(record, dict):
+            return None
+        record = record.get(key)
+
+    return record
+
+
+class LazyModelList(Sequence):
+
+    # the paths within the records of the fields that can be filtered by
+    field_paths: t.Dict[str, t.Tuple[str, ...]] = {'id': ('id',)}
+
+    def __init__(self, records: t.List[t.Dict[str, t.Any]], response_class: t.Any) -> None:
+        """
+        A read only sequence over decoded JSON records which builds each model only once it is accessed. Counting,
+        slicing and filtering do not build any model.
+
+        :param records: the decoded JSON records
+        :param response_class: an object with a from_json method used to build the models
+        """
+        self._records = records
+        self._response_class = response_class
+        self._models: t.List[t.Any] = [_MISSING] * len(records)
+
+    @property
+    def records(self) -> t.List[t.Dict[str, t.Any]]:
+        return self._records
+
+    def _hydrate(self, index: int) -> t.Any:
+        model = self._models[index]
+        if model is _MISSING:
+            model = self._models[index] = self._response_class.from_json(self._records[index])
+
+        return model
+
+    def _select(self, indexes: t.Iterable[int]) -> 'LazyModelList':
+        result = self.__class__.__new__(self.__class__)
+        result._records = [self._records[index] for index in indexes]
+        result._response_class = self._response_class
+        result._models = [self._models[index] for index in indexes]
+
+        return result
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._select(range(*index.indices(len(self._records))))
+
+        if index < 0:
+            index += len(self._records)
+        if not 0 <= index < len(self._records):
+            raise IndexError('list index out of range')
+
+        return self._hydrate(index)
+
+    def __iter__(self) -> t.Iterator[t.Any]:
+        for index in range(len(self._records)):
+            yield self._hydrate(index)
+
+    def __eq__(self, other: t.Any) -> bool:
+        if not isinstance(other, (list, LazyModelList)):
+            return NotImplemented
+
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def filter(self, **fields) -> 'LazyModelList':
+        """
+        Filters the records without building their models, i.e. subscriptions.filter(queue='my_queue')
+
+        :param fields: the values the fields of the matching records should have
+        :return: a LazyModelList of the matching records
+        :raises ValueError: if a field cannot be filtered by
+        """
+        unknown = set(fields) - set(self.field_paths)
+        if unknown:
+            raise ValueError(f'cannot filter by {sorted(unknown)}. Choose among {sorted(self.field_paths)}')
+
+        criteria = [(self.field_paths[name], value) for name, value in fields.items()]
+
+        return self._select([index for index, record in enumerate(self._records)
+                             if all(_lookup(record, path) == value for path, value in criteria)])
+
+    def to_list(self) -> t.List[t.Any]:
+        return list(self)
+
+    def __repr__(self) -> str:
+        hydrated = sum(model is not _MISSING for model in self._models)
+
+        return f'<{self.__class__.__name__} of {len(self)} records, {hydrated} built>'
+
+
+class LazyTopicList(LazyModelList):
+
+    field_paths = {'id': ('id',), 'name': ('name',)}
+
+
+class LazySubscriptionList(LazyModelList):
+
+    field_paths = {
+        'id': ('id',),
+        'queue': ('queue',),
+        'topic_id': ('topic', 'id'),
+        'topic_name': ('topic', 'name'),
+        'active': ('active',),
+        'durable': ('durable',),
+        'qos': ('qos',),
+    }
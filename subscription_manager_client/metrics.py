@@ -0,0 +1,257 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import abc
+import bisect
+import math
+import threading
+import time
+import typing as t
+from contextlib import contextmanager
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+# the default buckets of the Prometheus clients, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
+DEFAULT_PREFIX = 'subscription_manager_client'
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels: t.Iterable[t.Tuple[str, str]]) -> str:
+    labels = ','.join(f'{name}="{_escape_label_value(value)}"' for name, value in labels)
+
+    return '{' + labels + '}' if labels else ''
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+
+    return repr(value)
+
+
+class _Metric(abc.ABC):
+
+    type_name = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: t.Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: t.Dict[t.Tuple[str, ...], t.Any] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: t.Dict[str, t.Any]) -> t.Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f'{self.name} expects the labels {self.labelnames}, got {tuple(labels)}')
+
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: t.Tuple[str, ...], *extra: t.Tuple[str, str]) -> str:
+        return _format_labels(tuple(zip(self.labelnames, key)) + extra)
+
+    @abc.abstractmethod
+    def _samples(self) -> t.Iterator[str]:
+        pass
+
+    def render(self) -> str:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.type_name}']
+        with self._lock:
+            lines.extend(self._samples())
+
+        return '\n'.join(lines) + '\n'
+
+
+class Counter(_Metric):
+
+    type_name = 'counter'
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        if amount < 0:
+            raise ValueError('counters can only be increased')
+
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> t.Iterator[str]:
+        for key, value in sorted(self._values.items()):
+            yield f'{self.name}{self._labels(key)} {_format_value(value)}'
+
+
+class Gauge(Counter):
+
+    type_name = 'gauge'
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+
+    type_name = 'histogram'
+
+    def __init__(self,
+                 name: str,
+                 documentation: str,
+                 labelnames: t.Sequence[str] = (),
+                 buckets: t.Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """
+        :param buckets: the upper bounds of the buckets. A +Inf bucket is always added
+        """
+        super().__init__(name, documentation, labelnames)
+
+        buckets = sorted(float(bucket) for bucket in buckets)
+        if not buckets or buckets[-1] != math.inf:
+            buckets.append(math.inf)
+        self.buckets = tuple(buckets)
+
+    def observe(self, amount: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, amount)
+
+        with self._lock:
+            counts, total = self._values.get(key) or ([0] * len(self.buckets), 0.0)
+            counts[index] += 1
+            self._values[key] = counts, total + amount
+
+    def count(self, **labels) -> int:
+        counts, _ = self._values.get(self._key(labels)) or ((), 0.0)
+
+        return sum(counts)
+
+    def sum(self, **labels) -> float:
+        _, total = self._values.get(self._key(labels)) or ((), 0.0)
+
+        return total
+
+    def _samples(self) -> t.Iterator[str]:
+        for key, (counts, total) in sorted(self._values.items()):
+            cumulative = 0
+            for bucket, count in zip(self.buckets, counts):
+                cumulative += count
+                yield f'{self.name}_bucket{self._labels(key, ("le", _format_value(bucket)))} {cumulative}'
+            yield f'{self.name}_sum{self._labels(key)} {_format_value(total)}'
+            yield f'{self.name}_count{self._labels(key)} {cumulative}'
+
+
+class MetricsRegistry:
+
+    def __init__(self) -> None:
+        """
+        Holds metrics and renders them in the Prometheus text exposition format
+        """
+        self._metrics: t.Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"a metric named '{metric.name}' is already registered")
+            self._metrics[metric.name] = metric
+
+        return metric
+
+    def get(self, name: str) -> t.Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        return ''.join(metric.render() for metric in list(self._metrics.values()))
+
+
+def error_label(error: BaseException) -> str:
+    """
+    :return: the HTTP status of the error if it carries one, or else the name of its class
+    """
+    status_code = getattr(error, 'status_code', None)
+
+    return str(status_code) if status_code is not None else type(error).__name__
+
+
+class ClientMetrics:
+
+    def __init__(self,
+                 registry: t.Optional[MetricsRegistry] = None,
+                 prefix: str = DEFAULT_PREFIX,
+                 buckets: t.Sequence[float] = DEFAULT_BUCKETS,
+                 clock: t.Callable[[], float] = time.perf_counter) -> None:
+        """
+        The per endpoint metrics of a client: the number of requests, the number of errors by HTTP status, the number
+        of requests in flight and a histogram of the latencies in seconds.
+
+        :param registry: where the metrics are registered. A new one is created if not provided
+        :param prefix: the prefix of the metric names
+        :param buckets: the upper bounds in seconds of the latency histogram buckets
+        :param clock: the source of time
+        """
+        self.registry = registry if registry is not None else MetricsRegistry()
+        self._clock = clock
+
+        self.requests = self.registry.register(
+            Counter(f'{prefix}_requests_total', 'Total number of requests.', ('endpoint',)))
+        self.errors = self.registry.register(
+            Counter(f'{prefix}_errors_total', 'Total number of failed requests.', ('endpoint', 'status')))
+        self.in_flight = self.registry.register(
+            Gauge(f'{prefix}_requests_in_flight', 'Number of requests in flight.', ('endpoint',)))
+        self.latency = self.registry.register(
+            Histogram(f'{prefix}_request_duration_seconds', 'Request latency in seconds.', ('endpoint',),
+                      buckets=buckets))
+
+    @contextmanager
+    def track(self, endpoint: str) -> t.Iterator[None]:
+        self.requests.inc(endpoint=endpoint)
+        self.in_flight.inc(endpoint=endpoint)
+        start = self._clock()
+
+        try:
+            yield
+        except Exception as e:
+            self.errors.inc(endpoint=endpoint, status=error_label(e))
+            raise
+        finally:
+            self.latency.observe(self._clock() - start, endpoint=endpoint)
+            self.in_flight.dec(endpoint=endpoint)
+
+    def render(self) -> str:
+        return self.registry.render()
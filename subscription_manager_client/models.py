@@ -28,11 +28,15 @@ http://opensource.org/licenses/BSD-3-Clause
 Details on EUROCONTROL: http://www.eurocontrol.int
 """
 import enum
+import threading
 import typing as t
+from collections import OrderedDict
 
 from rest_client import BaseModel
 from rest_client.typing import JSONType
 
+from subscription_manager_client.serializers import ModelSerializer, Field
+
 __author__ = "EUROCONTROL (SWIM)"
 
 
@@ -48,6 +52,16 @@ class QOS(enum.Enum):
     def all(cls):
         return [e.value for e in cls]
 
+    @classmethod
+    def is_valid(cls, value) -> bool:
+        try:
+            return value in _QOS_VALUES
+        except TypeError:
+            return False
+
+
+_QOS_VALUES = frozenset(QOS.all())
+
 
 class Topic(BaseModel):
 
@@ -60,24 +74,23 @@ class Topic(BaseModel):
         self.id: int = id
 
     @classmethod
-    def from_json(cls, object_dict: JSONType):
+    def from_json(cls, object_dict: JSONType, trusted: bool = False):
         """
 
         :param object_dict:
+        :param trusted: if True, the data is considered valid (i.e. it comes from the server) and is loaded directly
         :return: Topic
         """
+        if trusted:
+            return TOPIC_SERIALIZER.load_trusted(object_dict)
+
         return cls(
             name=object_dict.get('name'),
             id=object_dict.get('id')
         )
 
     def to_json(self) -> JSONType:
-        result = {
-            'name': self.name
-        }
-        _update_if_not_none(result, 'id', self.id)
-
-        return result
+        return TOPIC_SERIALIZER.dump(self)
 
 
 class Subscription(BaseModel):
@@ -117,41 +130,254 @@ class Subscription(BaseModel):
 
     @qos.setter
     def qos(self, value):
-        if value is not None and value not in QOS.all():
+        if value is not None and not QOS.is_valid(value):
             raise ValueError(f'qos should be one of {QOS.all()}')
 
         self._qos = value
 
     @classmethod
-    def from_json(cls, object_dict: JSONType):
+    def from_json(cls,
+                  object_dict: JSONType,
+                  topic_interner: t.Optional['TopicInterner'] = None,
+                  trusted: bool = False):
         """
 
         :param object_dict:
+        :param topic_interner: if provided, the nested topic is shared with the rest of the subscriptions decoded
+                               through it
+        :param trusted: if True, the data is considered valid (i.e. it comes from the server) and is loaded directly
         :return: Subscription
         """
+        if trusted:
+            if topic_interner is not None:
+                return SUBSCRIPTION_SERIALIZER.load_trusted(object_dict, topic=topic_interner.intern)
+            return SUBSCRIPTION_SERIALIZER.load_trusted(object_dict)
+
+        topic_dict = object_dict['topic']
+
         return cls(
             queue=object_dict['queue'],
             active=object_dict['active'],
             qos=object_dict['qos'],
             durable=object_dict['durable'],
-            topic=Topic.from_json(object_dict['topic']),
+            topic=topic_interner.intern(topic_dict) if topic_interner is not None else Topic.from_json(topic_dict),
             id=object_dict['id'],
         )
 
     def to_json(self):
-        props = ['queue', 'topic_id', 'active', 'qos', 'durable', 'topic', 'id']
+        return SUBSCRIPTION_SERIALIZER.dump(self)
+
+
+class TopicInterner:
+
+    def __init__(self, maxsize: int = 1024, topic_class: t.Type = Topic) -> None:
+        """
+        Hands out a single shared topic instance per (id, name) pair instead of creating a new one for each decoded
+        subscription. The interned topics are shared, hence they should not be modified.
+
+        :param maxsize: the maximum number of topics kept. The least recently used ones are dropped first
+        :param topic_class: the class of the interned topics
+        """
+        if maxsize < 1:
+            raise ValueError('maxsize should be a positive integer')
+
+        self.maxsize = maxsize
+        self._topic_class = topic_class
+        self._topics: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def intern(self, topic_dict: JSONType):
+        """
+
+        :param topic_dict:
+        :return: Topic
+        """
+        key = (topic_dict.get('id'), topic_dict.get('name'))
+
+        with self._lock:
+            topic = self._topics.get(key)
+
+            if topic is None:
+                topic = self._topic_class.from_json(topic_dict)
+                self._topics[key] = topic
+                if len(self._topics) > self.maxsize:
+                    self._topics.popitem(last=False)
+            else:
+                self._topics.move_to_end(key)
+
+            return topic
+
+    def __len__(self) -> int:
+        return len(self._topics)
+
+
+def _subscription_fields(topic_serializer: ModelSerializer) -> t.List[Field]:
+    return [
+        Field('queue', required=True),
+        Field('topic_id', load=False),
+        Field('active', required=True),
+        Field('qos', attr='_qos', required=True),
+        Field('durable', required=True),
+        Field('topic', nested=topic_serializer, required=True),
+        Field('id', required=True),
+    ]
+
+
+TOPIC_SERIALIZER = ModelSerializer(Topic, [Field('name', omit_none=False), Field('id')])
+SUBSCRIPTION_SERIALIZER = ModelSerializer(Subscription, _subscription_fields(TOPIC_SERIALIZER))
+
+
+class _CompactModel:
+    """
+    Base of the slot based counterparts of the models, meant for keeping large amounts of objects in memory
+    """
+    __slots__ = ()
+
+    def _values(self) -> t.Tuple:
+        return tuple(getattr(self, slot) for slot in self.__slots__)
+
+    def __eq__(self, other):
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+
+        return self._values() == other._values()
+
+    __hash__ = None
+
+    def __repr__(self):
+        values = ', '.join(f'{slot.lstrip("_")}={getattr(self, slot)!r}' for slot in self.__slots__)
+
+        return f'{self.__class__.__name__}({values})'
+
+
+class CompactTopic(_CompactModel):
+    __slots__ = ('name', 'id')
+
+    def __init__(self, name: str, id: int = None) -> None:
+        """
+        :param name: the name of the topic
+        :param id: the DB id of the topic
+        """
+        self.name: str = name
+        self.id: int = id
+
+    @classmethod
+    def from_json(cls, object_dict: JSONType, trusted: bool = False):
+        """
+
+        :param object_dict:
+        :param trusted: if True, the data is considered valid (i.e. it comes from the server) and is loaded directly
+        :return: CompactTopic
+        """
+        if trusted:
+            return COMPACT_TOPIC_SERIALIZER.load_trusted(object_dict)
+
+        return cls(
+            name=object_dict.get('name'),
+            id=object_dict.get('id')
+        )
+
+    def to_json(self) -> JSONType:
+        return COMPACT_TOPIC_SERIALIZER.dump(self)
+
+    @classmethod
+    def from_model(cls, topic: Topic):
+        return cls(name=topic.name, id=topic.id)
+
+    def to_model(self) -> Topic:
+        return Topic(name=self.name, id=self.id)
 
-        result = {}
 
-        for prop in props:
-            attr = getattr(self, prop)
-            if hasattr(attr, 'to_json'):
-                attr = attr.to_json()
-            _update_if_not_none(result, prop, attr)
+class CompactSubscription(_CompactModel):
+    __slots__ = ('queue', 'topic_id', 'active', '_qos', 'durable', 'topic', 'id')
 
-        return result
+    def __init__(self,
+                 queue: t.Optional[str] = None,
+                 topic_id: t.Optional[int] = None,
+                 active: t.Optional[bool] = None,
+                 qos: t.Optional[QOS] = None,
+                 durable: t.Optional[bool] = None,
+                 topic: t.Optional[CompactTopic] = None,
+                 id: t.Optional[int] = None) -> None:
+        """
+        :param queue: the unique name of the created queue upon a subscription request
+        :param topic_id: the DB id of the desired topic
+        :param active: indicates whether the subscription is active or not
+        :param qos: the Quality of Service handled by the broker for the specific subscription
+        :param durable: expresses the durability of the subscription (if the messages will be kept while subscribers
+                        are offline
+        :param topic: the full topic structure associated with this subscription
+        :param id: the DB id of the subsription
+        """
+        self.queue: str = queue
+        self.topic_id: int = topic_id
+        self.active: bool = active
+        self.durable: bool = durable
+        self.topic: CompactTopic = topic
+        self.id: int = id
+
+        self._qos = None
+        self.qos = qos
+
+    qos = Subscription.qos
+
+    @classmethod
+    def from_json(cls,
+                  object_dict: JSONType,
+                  topic_interner: t.Optional['TopicInterner'] = None,
+                  trusted: bool = False):
+        """
+
+        :param object_dict:
+        :param topic_interner: if provided, the nested topic is shared with the rest of the subscriptions decoded
+                               through it. It should be created with topic_class=CompactTopic
+        :param trusted: if True, the data is considered valid (i.e. it comes from the server) and is loaded directly
+        :return: CompactSubscription
+        """
+        if trusted:
+            if topic_interner is not None:
+                return COMPACT_SUBSCRIPTION_SERIALIZER.load_trusted(object_dict, topic=topic_interner.intern)
+            return COMPACT_SUBSCRIPTION_SERIALIZER.load_trusted(object_dict)
+
+        topic_dict = object_dict['topic']
+
+        return cls(
+            queue=object_dict['queue'],
+            active=object_dict['active'],
+            qos=object_dict['qos'],
+            durable=object_dict['durable'],
+            topic=(topic_interner.intern(topic_dict) if topic_interner is not None
+                   else CompactTopic.from_json(topic_dict)),
+            id=object_dict['id'],
+        )
+
+    def to_json(self) -> JSONType:
+        return COMPACT_SUBSCRIPTION_SERIALIZER.dump(self)
+
+    @classmethod
+    def from_model(cls, subscription: Subscription):
+        return cls(
+            queue=subscription.queue,
+            topic_id=subscription.topic_id,
+            active=subscription.active,
+            qos=subscription.qos,
+            durable=subscription.durable,
+            topic=CompactTopic.from_model(subscription.topic) if subscription.topic is not None else None,
+            id=subscription.id,
+        )
+
+    def to_model(self) -> Subscription:
+        return Subscription(
+            queue=self.queue,
+            topic_id=self.topic_id,
+            active=self.active,
+            qos=self.qos,
+            durable=self.durable,
+            topic=self.topic.to_model() if self.topic is not None else None,
+            id=self.id,
+        )
 
 
-def _update_if_not_none(d, prop, value):
-    if value is not None:
-        d[prop] = value
+COMPACT_TOPIC_SERIALIZER = ModelSerializer(CompactTopic, [Field('name', omit_none=False), Field('id')])
+COMPACT_SUBSCRIPTION_SERIALIZER = ModelSerializer(CompactSubscription,
+                                                  _subscription_fields(COMPACT_TOPIC_SERIALIZER))
@@ -0,0 +1,77 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+DEFAULT_PAGE_SIZE = 100
+FIRST_PAGE = 1
+
+
+def iter_pages(fetch_page: t.Callable[[int], t.List[t.Any]],
+               limit: int = DEFAULT_PAGE_SIZE,
+               first_page: int = FIRST_PAGE) -> t.Iterator[t.Any]:
+    """
+    Yields the items of consecutive pages. While the items of a page are being consumed the next page is fetched in
+    the background.
+
+    Iteration stops upon an empty or partial page. A page larger than `limit` or identical to the previous one means
+    that the server does not paginate, in which case its items are yielded only once.
+
+    :param fetch_page: retrieves the items of the given page
+    :param limit: the maximum number of items per page
+    :param first_page: the number of the first page
+    :return:
+    """
+    if limit < 1:
+        raise ValueError('limit should be a positive integer')
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        page = first_page
+        future = executor.submit(fetch_page, page)
+        previous_items = None
+
+        while future is not None:
+            items = future.result()
+
+            if not items or items == previous_items:
+                return
+
+            if len(items) == limit:
+                page += 1
+                future = executor.submit(fetch_page, page)
+            else:
+                future = None
+
+            yield from items
+
+            previous_items = items
@@ -0,0 +1,163 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import typing as t
+from collections import defaultdict
+
+from subscription_manager_client.bulk import BulkResult
+from subscription_manager_client.models import Subscription
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+CREATE = 'create'
+UPDATE = 'update'
+DELETE = 'delete'
+
+
+class ReconcileReport:
+
+    def __init__(self) -> None:
+        """
+        The outcome of a reconciliation. Each list holds the resulting subscriptions of the corresponding action,
+        except for `deleted` which holds the deleted ones as they were.
+        """
+        self.created: t.List[Subscription] = []
+        self.updated: t.List[Subscription] = []
+        self.deleted: t.List[Subscription] = []
+        self.unchanged: t.List[Subscription] = []
+        self.failed: t.List[BulkResult] = []
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.created or self.updated or self.deleted)
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}(created={len(self.created)}, updated={len(self.updated)}, '
+                f'deleted={len(self.deleted)}, unchanged={len(self.unchanged)}, failed={len(self.failed)})')
+
+
+def _topic_id(subscription: Subscription) -> t.Optional[int]:
+    if subscription.topic_id is not None:
+        return subscription.topic_id
+
+    return subscription.topic.id if subscription.topic is not None else None
+
+
+def _is_compatible(current: Subscription, desired: Subscription) -> bool:
+    """
+    Checks whether the current subscription can be turned to the desired one without being recreated. Unset
+    attributes of the desired subscription are not taken into account.
+    """
+    return (_topic_id(current) == _topic_id(desired) and
+            desired.qos in (None, current.qos) and
+            desired.durable in (None, current.durable))
+
+
+def _without_queue(subscription: Subscription) -> Subscription:
+    if subscription.queue is None:
+        return subscription
+
+    return Subscription(topic_id=_topic_id(subscription), active=subscription.active, qos=subscription.qos,
+                        durable=subscription.durable, topic=subscription.topic)
+
+
+def plan(current: t.Iterable[Subscription],
+         desired: t.Iterable[Subscription],
+         delete_unmatched: bool = True) -> t.Tuple[t.List[t.Tuple[str, Subscription]], t.List[Subscription]]:
+    """
+    Matches each desired subscription with a current one by topic, qos and durability, i.e. the attributes a
+    subscription is created with, and computes the minimal actions that turn the current state to the desired one.
+
+    The queue of a subscription is assigned by the server upon its creation, hence it only identifies an existing
+    subscription: a desired subscription defining the queue of a current one is matched with it first. If their qos or
+    durability differ, the current subscription is replaced, i.e. it is deleted even if delete_unmatched is False and
+    the desired one is matched with another current subscription or else created. Created subscriptions never carry
+    the desired queue.
+
+    :param current: the existing subscriptions
+    :param desired: the subscriptions that should exist
+    :param delete_unmatched: whether the current subscriptions not matching any of the desired ones are deleted
+    :return: the actions to perform as (action, subscription) pairs along with the unchanged subscriptions
+    """
+    current = list(current)
+    desired = list(desired)
+    by_queue = {subscription.queue: subscription for subscription in current}
+    by_topic_id = defaultdict(list)
+    for subscription in current:
+        by_topic_id[_topic_id(subscription)].append(subscription)
+
+    matched_ids = set()
+    matches: t.List[t.Optional[Subscription]] = [None] * len(desired)
+    actions = []
+    unchanged = []
+
+    def take(subscription: Subscription) -> None:
+        matched_ids.add(subscription.id)
+        # taken subscriptions are not candidates anymore
+        by_topic_id[_topic_id(subscription)].remove(subscription)
+
+    # the subscriptions identified by their queue are resolved first, so that they are not matched with another
+    # desired subscription by their attributes
+    for index, desired_subscription in enumerate(desired):
+        candidate = by_queue.get(desired_subscription.queue) if desired_subscription.queue is not None else None
+        if candidate is None or candidate.id in matched_ids:
+            continue
+
+        take(candidate)
+        if _is_compatible(candidate, desired_subscription):
+            matches[index] = candidate
+        else:
+            actions.append((DELETE, candidate))
+
+    for index, desired_subscription in enumerate(desired):
+        match = matches[index]
+
+        if match is None:
+            for candidate in by_topic_id[_topic_id(desired_subscription)]:
+                if _is_compatible(candidate, desired_subscription):
+                    match = candidate
+                    take(match)
+                    break
+
+        if match is None:
+            actions.append((CREATE, _without_queue(desired_subscription)))
+            continue
+
+        if desired_subscription.active is not None and desired_subscription.active != match.active:
+            actions.append((UPDATE, Subscription(queue=match.queue, topic=match.topic, qos=match.qos,
+                                                 durable=match.durable, active=desired_subscription.active,
+                                                 id=match.id)))
+        else:
+            unchanged.append(match)
+
+    if delete_unmatched:
+        actions.extend((DELETE, subscription) for subscription in current if subscription.id not in matched_ids)
+
+    return actions, unchanged
@@ -0,0 +1,232 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import random
+import threading
+import time
+import typing as t
+
+from rest_client.errors import APIError
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+IDEMPOTENT_METHODS = frozenset(['GET', 'PUT', 'DELETE'])
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of performing a request while the server is considered unhealthy
+    """
+
+
+def is_transient_error(error: Exception) -> bool:
+    """
+    :param error:
+    :return: True for server side (5xx) errors and connection errors, i.e. requests.ConnectionError or Timeout
+    """
+    if isinstance(error, APIError):
+        status_code = getattr(error, 'status_code', None)
+        return isinstance(status_code, int) and status_code >= 500
+
+    return isinstance(error, OSError)
+
+
+class RetryPolicy:
+
+    def __init__(self,
+                 max_attempts: int = 3,
+                 backoff_base: float = 0.1,
+                 backoff_max: float = 10.0,
+                 jitter: bool = True,
+                 retry_methods: t.Iterable[str] = IDEMPOTENT_METHODS,
+                 sleep: t.Callable[[float], None] = time.sleep,
+                 random_uniform: t.Callable[[float, float], float] = random.uniform) -> None:
+        """
+        :param max_attempts: the maximum number of attempts, including the first one
+        :param backoff_base: the delay in seconds before the first retry. It is doubled on every next retry
+        :param backoff_max: the upper bound of the delay in seconds
+        :param jitter: if True, the delay is picked randomly between 0 and the computed backoff ("full jitter") so
+                       that clients failing at the same time do not retry at the same time
+        :param retry_methods: the HTTP methods which are safe to retry
+        :param sleep:
+        :param random_uniform:
+        """
+        if max_attempts < 1:
+            raise ValueError('max_attempts should be a positive integer')
+
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self._sleep = sleep
+        self._random_uniform = random_uniform
+
+    def backoff(self, retry: int) -> float:
+        """
+        :param retry: the number of the retry, starting from 1
+        :return: the delay in seconds before the retry
+        """
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (retry - 1))
+
+        return self._random_uniform(0, delay) if self.jitter else delay
+
+    def should_retry(self, method: str, error: Exception, attempt: int) -> bool:
+        return attempt < self.max_attempts and method.upper() in self.retry_methods and is_transient_error(error)
+
+    def wait(self, retry: int) -> None:
+        self._sleep(self.backoff(retry))
+
+
+class CircuitBreaker:
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self,
+                 failure_threshold: int = 5,
+                 recovery_timeout: float = 30.0,
+                 clock: t.Callable[[], float] = time.monotonic) -> None:
+        """
+        Stops requests from reaching the server after `failure_threshold` consecutive transient failures. Once
+        `recovery_timeout` seconds have passed a single probe is let through; the circuit closes again if it succeeds.
+
+        :param failure_threshold: the number of consecutive failures opening the circuit
+        :param recovery_timeout: the seconds the circuit stays open before probing the server
+        :param clock:
+        """
+        if failure_threshold < 1:
+            raise ValueError('failure_threshold should be a positive integer')
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def before_request(self, probe: t.Optional[t.Callable[[], t.Any]] = None) -> None:
+        """
+        :param probe: checks whether the server has recovered, once the recovery timeout has elapsed
+        :raises CircuitOpenError: if the request should not be performed
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return
+
+            if self._state == self.HALF_OPEN or self._clock() - self._opened_at < self.recovery_timeout:
+                raise CircuitOpenError('the Subscription Manager is considered unavailable')
+
+            self._state = self.HALF_OPEN
+
+        if probe is None:
+            # the request itself is the probe
+            return
+
+        try:
+            probe()
+        except Exception as e:
+            self.record_failure(e)
+            raise CircuitOpenError('the Subscription Manager is still unavailable') from e
+
+        self.record_success()
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+
+    def record_failure(self, error: Exception) -> None:
+        with self._lock:
+            if not is_transient_error(error):
+                # the server responded, hence it is up
+                self._state = self.CLOSED
+                self._failures = 0
+                return
+
+            self._failures += 1
+
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+
+
+class ResiliencePolicy:
+
+    def __init__(self,
+                 retry: t.Optional[RetryPolicy] = None,
+                 circuit_breaker: t.Optional[CircuitBreaker] = None) -> None:
+        """
+        :param retry: retries the transient failures of idempotent requests
+        :param circuit_breaker: fails fast while the server is unhealthy
+        """
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+
+    def call(self,
+             method: str,
+             func: t.Callable[[], t.Any],
+             probe: t.Optional[t.Callable[[], t.Any]] = None) -> t.Any:
+        """
+        :param method: the HTTP method of the request performed by func
+        :param func: performs the request
+        :param probe: checks whether the server has recovered while the circuit is open, i.e. ping_credentials
+        :return: the result of func
+        """
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.before_request(probe)
+
+            try:
+                result = func()
+            except Exception as e:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure(e)
+
+                if self.retry is None or not self.retry.should_retry(method, e, attempt):
+                    raise
+
+                self.retry.wait(attempt)
+                continue
+
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_success()
+
+            return result
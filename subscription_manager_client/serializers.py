@@ -0,0 +1,134 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import typing as t
+
+from rest_client.typing import JSONType
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+class Field:
+
+    def __init__(self,
+                 name: str,
+                 attr: t.Optional[str] = None,
+                 nested: t.Optional['ModelSerializer'] = None,
+                 required: bool = False,
+                 omit_none: bool = True,
+                 load: bool = True) -> None:
+        """
+        :param name: the key of the field in the JSON representation
+        :param attr: the attribute the field is stored in, if other than name
+        :param nested: the serializer of the field in case it holds another model
+        :param required: whether the key is mandatory in the JSON representation
+        :param omit_none: whether the key is left out of the JSON representation when its value is None
+        :param load: whether the field is read from the JSON representation. If not, it is set to None
+        """
+        self.name = name
+        self.attr = attr or name
+        self.nested = nested
+        self.required = required
+        self.omit_none = omit_none
+        self.load = load
+
+
+class ModelSerializer:
+
+    def __init__(self, model_class: t.Type, fields: t.Sequence[Field]) -> None:
+        """
+        Converts instances of `model_class` from and to JSON through functions generated once upon creation out of
+        the provided fields, instead of inspecting the instances on every call.
+
+        The serializer can be used wherever a response_class is expected. Its `from_json` skips validation, hence it
+        is meant for data originating from the server only.
+
+        :param model_class:
+        :param fields:
+        """
+        self.model_class = model_class
+        self.fields = tuple(fields)
+
+        self.dump = self._compile_dump()
+        self.load_trusted = self._compile_load_trusted()
+
+    def from_json(self, object_dict: JSONType):
+        return self.load_trusted(object_dict)
+
+    def _compile_dump(self) -> t.Callable[[t.Any], JSONType]:
+        lines = ['def dump(obj):', '    result = {}']
+
+        for field in self.fields:
+            value = 'value.to_json()' if field.nested is not None else 'value'
+            lines.append(f'    value = obj.{field.attr}')
+            if field.omit_none:
+                lines.append('    if value is not None:')
+                lines.append(f'        result[{field.name!r}] = {value}')
+            elif field.nested is not None:
+                lines.append(f'    result[{field.name!r}] = {value} if value is not None else None')
+            else:
+                lines.append(f'    result[{field.name!r}] = value')
+
+        lines.append('    return result')
+
+        return _compile('dump', lines, {})
+
+    def _compile_load_trusted(self) -> t.Callable[..., t.Any]:
+        namespace = {'new': self.model_class.__new__, 'model_class': self.model_class}
+        # the nested loaders are keyword arguments defaulting to the nested serializers so that callers can override
+        # them, i.e. in order to intern nested models
+        nested_args = ''.join(f', {field.name}=_nested_{field.name}'
+                              for field in self.fields if field.load and field.nested is not None)
+
+        lines = [f'def load_trusted(object_dict{nested_args}):', '    obj = new(model_class)']
+
+        for field in self.fields:
+            if not field.load:
+                lines.append(f'    obj.{field.attr} = None')
+                continue
+
+            value = f'object_dict[{field.name!r}]' if field.required else f'object_dict.get({field.name!r})'
+
+            if field.nested is not None:
+                namespace[f'_nested_{field.name}'] = field.nested.load_trusted
+                lines.append(f'    value = {value}')
+                value = f'{field.name}(value) if value is not None else None'
+
+            lines.append(f'    obj.{field.attr} = {value}')
+
+        lines.append('    return obj')
+
+        return _compile('load_trusted', lines, namespace)
+
+
+def _compile(name: str, lines: t.List[str], namespace: t.Dict[str, t.Any]) -> t.Callable:
+    source = '\n'.join(lines)
+    exec(compile(source, f'<serializer {name}>', 'exec'), namespace)
+
+    return namespace[name]
@@ -0,0 +1,145 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import socket
+import typing as t
+from urllib.parse import urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+
+def keepalive_socket_options(idle: int = 60, interval: int = 10, count: int = 6) -> t.List[t.Tuple[int, int, int]]:
+    """
+    :param idle: the seconds of inactivity before the first keep-alive probe is sent
+    :param interval: the seconds between keep-alive probes
+    :param count: the number of unanswered probes before the connection is dropped
+    :return: the socket options enabling TCP keep-alive, on top of the default ones of urllib3
+    """
+    options = list(HTTPConnection.default_socket_options) + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+    # not all the platforms support tuning the keep-alive probes
+    for name, value in (('TCP_KEEPIDLE', idle), ('TCP_KEEPINTVL', interval), ('TCP_KEEPCNT', count)):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+
+    return options
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+
+    def __init__(self, socket_options: t.Optional[t.List[t.Tuple[int, int, int]]] = None, **kwargs) -> None:
+        """
+        :param socket_options: the options applied on every new socket of the pool
+        :param kwargs: passed to HTTPAdapter, i.e. pool_connections, pool_maxsize, pool_block, max_retries
+        """
+        self.socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.socket_options is not None:
+            kwargs['socket_options'] = self.socket_options
+
+        super().init_poolmanager(*args, **kwargs)
+
+
+class PooledSession(requests.Session):
+
+    def __init__(self,
+                 host: str,
+                 https: bool = True,
+                 timeout: t.Optional[float] = None,
+                 pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 pool_block: bool = False,
+                 keepalive: bool = True,
+                 max_retries: int = 0) -> None:
+        """
+        A requests session prefixing the urls with the host and keeping its connections, along with their TLS
+        sessions, open in a pool sized for concurrent use.
+
+        :param host: the host of the server, including the port if needed
+        :param https: whether the connections are secure
+        :param timeout: the default timeout of the requests in seconds
+        :param pool_connections: the number of hosts a connection pool is kept for
+        :param pool_maxsize: the maximum number of connections kept open per host. It should be at least equal to
+                             the number of threads using the session
+        :param pool_block: whether to wait for a free connection instead of opening a throwaway one when the pool is
+                           exhausted
+        :param keepalive: whether TCP keep-alive probes are sent on idle connections
+        :param max_retries: the number of retries upon connection failures
+        """
+        super().__init__()
+
+        self.base_url = f"{'https' if https else 'http'}://{host}/"
+        self.timeout = timeout
+
+        adapter = PooledHTTPAdapter(socket_options=keepalive_socket_options() if keepalive else None,
+                                    pool_connections=pool_connections,
+                                    pool_maxsize=pool_maxsize,
+                                    pool_block=pool_block,
+                                    max_retries=max_retries)
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+    def request(self, method, url, *args, **kwargs):
+        if self.timeout is not None:
+            kwargs.setdefault('timeout', self.timeout)
+
+        return super().request(method, urljoin(self.base_url, url), *args, **kwargs)
+
+
+def create_session(host: str,
+                   https: bool = True,
+                   verify: t.Union[bool, str] = True,
+                   username: t.Optional[str] = None,
+                   password: t.Optional[str] = None,
+                   **kwargs) -> PooledSession:
+    """
+    :param host: the host of the server, including the port if needed
+    :param https: whether the connections are secure
+    :param verify: whether to verify the certificate of the server or the path to a CA bundle
+    :param username: used along with password for basic authentication
+    :param password:
+    :param kwargs: passed to PooledSession
+    :return: PooledSession
+    """
+    session = PooledSession(host, https=https, **kwargs)
+    session.verify = verify
+    if username is not None:
+        session.auth = (username, password)
+
+    return session
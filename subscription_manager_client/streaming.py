@@ -0,0 +1,143 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import codecs
+import json
+import typing as t
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = ' \t\n\r'
+
+# parser states
+_START, _FIRST_ITEM, _ITEM, _SEPARATOR = range(4)
+
+
+class _ChunkBuffer:
+
+    def __init__(self, chunks: t.Iterable[t.Union[bytes, str]]) -> None:
+        self._chunks = iter(chunks)
+        self._utf8_decoder = codecs.getincrementaldecoder('utf-8')()
+        self.text = ''
+        self.position = 0
+        self.exhausted = False
+
+    def read_more(self) -> bool:
+        """
+        Appends the next chunk to the buffer dropping the already consumed text
+
+        :return: False if there are no more chunks
+        """
+        if self.exhausted:
+            return False
+
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            chunk = b''
+            self.exhausted = True
+
+        if isinstance(chunk, bytes):
+            chunk = self._utf8_decoder.decode(chunk, final=self.exhausted)
+
+        self.text = self.text[self.position:] + chunk
+        self.position = 0
+
+        return True
+
+    def skip_whitespace(self) -> bool:
+        """
+        :return: False if the end of the input was reached
+        """
+        while True:
+            while self.position < len(self.text) and self.text[self.position] in _WHITESPACE:
+                self.position += 1
+
+            if self.position < len(self.text):
+                return True
+
+            if not self.read_more():
+                return False
+
+
+def _is_delimited(text: str, position: int) -> bool:
+    return position < len(text) and text[position] in _WHITESPACE + ',]'
+
+
+def iter_json_array(chunks: t.Iterable[t.Union[bytes, str]]) -> t.Iterator[t.Any]:
+    """
+    Incrementally decodes a JSON array whose text arrives in chunks and yields its items one at a time, so that
+    neither the whole document nor the whole list of items has to be held in memory.
+
+    :param chunks: the (utf-8 encoded) text of the JSON array
+    :return:
+    :raises ValueError: if the text is not a valid JSON array
+    """
+    decoder = json.JSONDecoder()
+    buffer = _ChunkBuffer(chunks)
+    state = _START
+
+    while True:
+        if not buffer.skip_whitespace():
+            raise ValueError('unexpected end of JSON array')
+
+        char = buffer.text[buffer.position]
+
+        if state == _START:
+            if char != '[':
+                raise ValueError('expected a JSON array')
+            buffer.position += 1
+            state = _FIRST_ITEM
+        elif char == ']' and state in (_FIRST_ITEM, _SEPARATOR):
+            return
+        elif state == _SEPARATOR:
+            if char != ',':
+                raise ValueError(f'unexpected character {char!r} in JSON array')
+            buffer.position += 1
+            state = _ITEM
+        else:
+            try:
+                item, end = decoder.raw_decode(buffer.text, buffer.position)
+            except json.JSONDecodeError:
+                # the item is not complete yet
+                if not buffer.read_more():
+                    raise
+                continue
+
+            # a number cut at the chunk boundary is decoded partially, so it is accepted only when it is delimited
+            if isinstance(item, (int, float)) and not _is_delimited(buffer.text, end) and buffer.read_more():
+                continue
+
+            buffer.position = end
+            state = _SEPARATOR
+
+            yield item
@@ -27,26 +27,169 @@ http://opensource.org/licenses/BSD-3-Clause
 
 Details on EUROCONTROL: http://www.eurocontrol.int
 """
+import contextlib
+import functools
+import threading
 import typing as t
+from urllib.parse import urlencode
 
 from rest_client import Requestor, ClientFactory
 from rest_client.typing import RequestHandler
 
-from subscription_manager_client.models import Topic, Subscription
+from subscription_manager_client.bulk import BulkResult, run_bulk, DEFAULT_MAX_WORKERS
+from subscription_manager_client.cache import TTLCache, ValidatedEntry, SQLiteCatalogCache, CatalogEntry
+from subscription_manager_client.columnar import SubscriptionColumns
+from subscription_manager_client.json_codec import JSONCodec, CodecRequestHandler
+from subscription_manager_client.lazy import RawRecord, LazyTopicList, LazySubscriptionList
+from subscription_manager_client.metrics import ClientMetrics
+from subscription_manager_client.models import Topic, Subscription, TopicInterner, TOPIC_SERIALIZER, \
+    SUBSCRIPTION_SERIALIZER
+from subscription_manager_client.pagination import iter_pages, DEFAULT_PAGE_SIZE
+from subscription_manager_client.reconcile import ReconcileReport, plan, CREATE, UPDATE, DELETE
+from subscription_manager_client.resilience import ResiliencePolicy
+from subscription_manager_client.singleflight import SingleFlight, request_key
+from subscription_manager_client.streaming import iter_json_array, DEFAULT_CHUNK_SIZE
+from subscription_manager_client.topic_index import TopicIndex
+from subscription_manager_client.tracing import Tracer, TracedRequestHandler, traced, phase, \
+    SERIALIZE, DESERIALIZE
+from subscription_manager_client.utils import raise_for_status, models_from_json
+from subscription_manager_client.watch import SubscriptionWatcher, SubscriptionEvent, AdaptiveInterval
 
 __author__ = "EUROCONTROL (SWIM)"
 
 
+class _SubscriptionDecoder:
+
+    def __init__(self, topic_interner: TopicInterner) -> None:
+        """
+        Decodes subscriptions through the provided TopicInterner. It can be used as response_class.
+
+        :param topic_interner:
+        """
+        self._topic_interner = topic_interner
+
+    def from_json(self, object_dict):
+        return Subscription.from_json(object_dict, topic_interner=self._topic_interner, trusted=True)
+
+    def __eq__(self, other: t.Any) -> bool:
+        return isinstance(other, _SubscriptionDecoder) and self._topic_interner is other._topic_interner
+
+    def __hash__(self) -> int:
+        return hash(id(self._topic_interner))
+
+
+def _subscription_response_class(topic_interner: t.Optional[TopicInterner]) -> t.Any:
+    return _SubscriptionDecoder(topic_interner) if topic_interner is not None else SUBSCRIPTION_SERIALIZER
+
+
+def _catalog_namespace(request_handler: RequestHandler) -> str:
+    """
+    :return: the base url of the handler along with its username, so that catalogs of different servers or accounts
+             are kept apart
+    :raises ValueError: if the handler has no base_url
+    """
+    base_url = getattr(request_handler, 'base_url', None)
+    if not isinstance(base_url, str):
+        raise ValueError('the base url of the request handler cannot be determined. Provide a catalog_namespace')
+
+    auth = getattr(request_handler, 'auth', None)
+    username = auth[0] if isinstance(auth, tuple) and auth else ''
+
+    return f'{base_url}|{username}|'
+
+
+def _instrumented(method):
+    """
+    Tracks the calls of a client method in the metrics and the tracer of the client, if any, under the name of the
+    method
+    """
+    endpoint = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._metrics is None and self._tracer is None:
+            return method(self, *args, **kwargs)
+
+        with contextlib.ExitStack() as stack:
+            if self._metrics is not None:
+                stack.enter_context(self._metrics.track(endpoint))
+            span = stack.enter_context(traced(self._tracer, endpoint)) if self._tracer is not None else None
+
+            result = method(self, *args, **kwargs)
+
+            if span is not None:
+                self._tracer.after_decode(span, result)
+
+            return result
+
+    return wrapper
+
+
 class SubscriptionManagerClient(Requestor, ClientFactory):
 
     _BASE_URL = 'subscription-manager/api/1.0/'
 
-    def __init__(self, request_handler: RequestHandler) -> None:
+    _CACHE_KEY_TOPICS = 'topics'
+    _CACHE_KEY_TOPICS_OWN = 'topics_own'
+    _CACHE_KEY_TOPIC_RECORDS = 'topic_records'
+
+    def __init__(self,
+                 request_handler: RequestHandler,
+                 topic_cache: t.Optional[TTLCache] = None,
+                 conditional_requests: bool = False,
+                 resilience: t.Optional[ResiliencePolicy] = None,
+                 coalesce_requests: bool = False,
+                 metrics: t.Optional[ClientMetrics] = None,
+                 tracer: t.Optional[Tracer] = None,
+                 json_codec: t.Optional[JSONCodec] = None,
+                 catalog_cache: t.Optional[SQLiteCatalogCache] = None,
+                 catalog_namespace: t.Optional[str] = None) -> None:
         """
         :param request_handler: an instance of an object capable of handling http requests, i.e. requests.session()
+        :param topic_cache: if provided, the topics retrieved from the server will be cached there
+        :param conditional_requests: if True, the lists of topics and subscriptions are requested conditionally based
+                                     on the ETag/Last-Modified validators of the previous response and are reused
+                                     as they are upon a 304 (Not Modified) response
+        :param resilience: if provided, requests are retried and/or short-circuited according to it while the server
+                           is unhealthy. ping_credentials is used to probe whether the server has recovered
+        :param coalesce_requests: if True, concurrent identical GET requests result in a single HTTP request whose
+                                  result is shared among the callers
+        :param metrics: if provided, the requests, errors, requests in flight and latencies of each endpoint are
+                        tracked there
+        :param tracer: if provided, each call is traced in a span which breaks down the time spent serializing the
+                       request, on the wire and deserializing the response. The trace context is propagated via the
+                       headers of the requests
+        :param json_codec: if provided, it is used instead of the request handler in order to encode the request
+                           bodies and decode the responses, i.e. json_codec.get_codec('orjson')
+        :param catalog_cache: if provided, the lists of topics and subscriptions are served from it as soon as they
+                              have been stored there, even by another process, and are revalidated with the server in
+                              the background once they get stale. It is cleared upon any change made via the client
+        :param catalog_namespace: keeps the entries of the client apart from those of other servers or accounts in a
+                                  shared catalog_cache. It defaults to the base url and the username of the request
+                                  handler, i.e. of a session created via create_pooled
         """
+        if catalog_cache is not None and catalog_namespace is None:
+            catalog_namespace = _catalog_namespace(request_handler)
+
+        if tracer is not None:
+            request_handler = TracedRequestHandler(request_handler, tracer)
+        if json_codec is not None:
+            request_handler = CodecRequestHandler(request_handler, json_codec)
+
         Requestor.__init__(self, request_handler)
         self._request_handler = request_handler
+        self._topic_cache = topic_cache
+        self._topic_index = TopicIndex()
+        self._conditional_requests = conditional_requests
+        self._validated_entries: t.Dict[t.Hashable, ValidatedEntry] = {}
+        self._resilience = resilience
+        self._single_flight = SingleFlight() if coalesce_requests else None
+        self._metrics = metrics
+        self._tracer = tracer
+        self._catalog_cache = catalog_cache
+        self._catalog_namespace = catalog_namespace
+        self._revalidations: t.Dict[str, threading.Thread] = {}
+        self._revalidations_lock = threading.Lock()
 
         self._url_topics = self._BASE_URL + 'topics/'
         self._url_topics_own = self._BASE_URL + 'topics/own'
@@ -55,21 +198,357 @@ class SubscriptionManagerClient(Requestor, ClientFactory):
         self._url_subscription_by_id = self._BASE_URL + 'subscriptions/{subscription_id}'
         self._url_ping_credentials = self._BASE_URL + 'ping-credentials'
 
-    def get_topics(self) -> t.List[Topic]:
-        return self.perform_request('GET', self._url_topics, response_class=Topic, many=True)
+    @classmethod
+    def create_pooled(cls,
+                      host: str,
+                      https: bool = True,
+                      verify: t.Union[bool, str] = True,
+                      username: t.Optional[str] = None,
+                      password: t.Optional[str] = None,
+                      timeout: t.Optional[float] = None,
+                      pool_connections: int = 10,
+                      pool_maxsize: int = 10,
+                      pool_block: bool = False,
+                      keepalive: bool = True,
+                      **kwargs) -> 'SubscriptionManagerClient':
+        """
+        Creates a client over a session whose connection pool is sized for concurrent use and whose connections are
+        kept alive, so that TCP/TLS handshakes are not repeated on every request.
+
+        :param host: the host of the server, including the port if needed
+        :param https: whether the connections are secure
+        :param verify: whether to verify the certificate of the server or the path to a CA bundle
+        :param username: used along with password for basic authentication
+        :param password:
+        :param timeout: the default timeout of the requests in seconds
+        :param pool_connections: the number of hosts a connection pool is kept for
+        :param pool_maxsize: the maximum number of connections kept open. It should be at least equal to the number
+                             of threads using the client
+        :param pool_block: whether to wait for a free connection instead of opening a throwaway one when the pool is
+                           exhausted
+        :param keepalive: whether TCP keep-alive probes are sent on idle connections
+        :param kwargs: passed to the client, i.e. topic_cache
+        :return: SubscriptionManagerClient
+        """
+        from subscription_manager_client.session import create_session
+
+        request_handler = create_session(host, https=https, verify=verify, username=username, password=password,
+                                         timeout=timeout, pool_connections=pool_connections,
+                                         pool_maxsize=pool_maxsize, pool_block=pool_block, keepalive=keepalive)
 
+        return cls(request_handler=request_handler, **kwargs)
+
+    def perform_request(self, method: str, url: str, *args, **kwargs):
+        if self._tracer is not None and kwargs.get('response_class') is not None:
+            request = functools.partial(self._perform_traced_request, method, url, *args, **kwargs)
+        else:
+            request = functools.partial(Requestor.perform_request, self, method, url, *args, **kwargs)
+
+        def perform():
+            return self._resilient(method, request)
+
+        if method == 'GET' and self._single_flight is not None and not args:
+            key = request_key(method, url, kwargs.get('extra_params'), kwargs.get('response_class'),
+                              kwargs.get('many', False))
+            return self._single_flight.do(key, perform)
+
+        if method != 'GET' and self._catalog_cache is not None:
+            try:
+                return perform()
+            finally:
+                self._catalog_cache.clear(prefix=self._catalog_namespace)
+
+        return perform()
+
+    def _perform_traced_request(self, method: str, url: str, *args, response_class: t.Any, many: bool = False,
+                                **kwargs) -> t.Any:
+        # the models are decoded as a whole in a single deserialize phase rather than in one phase per model
+        data = Requestor.perform_request(self, method, url, *args, many=many, **kwargs)
+        if data is None:
+            return None
+
+        with phase(DESERIALIZE):
+            return models_from_json(data, response_class=response_class, many=many)
+
+    def _resilient(self, method: str, func: t.Callable[[], t.Any]) -> t.Any:
+        if self._resilience is None:
+            return func()
+
+        return self._resilience.call(method, func, probe=self._probe)
+
+    def _probe(self):
+        return Requestor.perform_request(self, 'GET', self._url_ping_credentials)
+
+    def _get_list(self,
+                  url: str,
+                  response_class: t.Any,
+                  extra_params: t.Optional[t.Dict[str, t.Any]] = None) -> t.List[t.Any]:
+        if self._catalog_cache is not None:
+            return self._get_list_from_catalog(url, response_class, extra_params or {})
+
+        if not self._conditional_requests:
+            return self.perform_request('GET', url, extra_params=extra_params, response_class=response_class,
+                                        many=True)
+
+        def get_conditionally():
+            return self._resilient('GET', lambda: self._get_list_conditionally(url, response_class, extra_params or {}))
+
+        if self._single_flight is not None:
+            return self._single_flight.do(request_key('GET', url, extra_params, response_class, 'conditional'),
+                                          get_conditionally)
+
+        return get_conditionally()
+
+    def _get_list_conditionally(self,
+                                url: str,
+                                response_class: t.Any,
+                                extra_params: t.Dict[str, t.Any]) -> t.List[t.Any]:
+        key = (url, tuple(sorted(extra_params.items())))
+        entry = self._validated_entries.get(key)
+        headers = entry.conditional_headers() if entry is not None else {}
+
+        response = self._request_handler.get(url, params=extra_params, headers=headers)
+
+        if response.status_code == 304 and entry is not None:
+            models = entry.models.get(response_class)
+            if models is not None:
+                return list(models)
+            records = entry.value
+        else:
+            raise_for_status(response)
+
+            with phase(DESERIALIZE):
+                records = response.json()
+
+            # the records are kept along with the models since the same list can be requested as different models,
+            # i.e. lazily
+            entry = ValidatedEntry.from_response(response, records)
+            if entry is not None:
+                self._validated_entries[key] = entry
+            else:
+                self._validated_entries.pop(key, None)
+
+        with phase(DESERIALIZE):
+            models = models_from_json(records, response_class=response_class, many=True)
+
+        if entry is not None:
+            entry.models[response_class] = models
+
+        return list(models)
+
+    def _get_list_from_catalog(self,
+                               url: str,
+                               response_class: t.Any,
+                               extra_params: t.Dict[str, t.Any]) -> t.List[t.Any]:
+        key = self._catalog_namespace + url + '?' + urlencode(sorted(extra_params.items()))
+        entry = self._catalog_cache.get(key)
+
+        if entry is None:
+            entry = self._resilient('GET', lambda: self._revalidate_catalog_entry(key, url, extra_params, None))
+        elif self._catalog_cache.is_stale(entry):
+            self._revalidate_in_background(
+                key, lambda: self._revalidate_catalog_entry(key, url, extra_params, entry))
+
+        with phase(DESERIALIZE):
+            return list(models_from_json(entry.value, response_class=response_class, many=True))
+
+    def _revalidate_catalog_entry(self,
+                                  key: str,
+                                  url: str,
+                                  extra_params: t.Dict[str, t.Any],
+                                  entry: t.Optional[CatalogEntry]) -> CatalogEntry:
+        headers = entry.conditional_headers() if entry is not None else {}
+
+        response = self._request_handler.get(url, params=extra_params, headers=headers)
+
+        if response.status_code == 304 and entry is not None:
+            self._catalog_cache.touch(key)
+            return entry
+
+        raise_for_status(response)
+
+        headers = response.headers or {}
+
+        return self._catalog_cache.set(key, response.json(), etag=headers.get('ETag'),
+                                       last_modified=headers.get('Last-Modified'))
+
+    def _revalidate_in_background(self, key: str, revalidate: t.Callable[[], t.Any]) -> None:
+        def run():
+            try:
+                self._resilient('GET', revalidate)
+            except Exception:
+                # the stale entry keeps being served until a later revalidation succeeds
+                pass
+            finally:
+                with self._revalidations_lock:
+                    del self._revalidations[key]
+
+        with self._revalidations_lock:
+            if key in self._revalidations:
+                return
+            thread = self._revalidations[key] = threading.Thread(target=run, name=f'revalidate {key}', daemon=True)
+
+        thread.start()
+
+    def _open_stream(self, url: str, extra_params: t.Dict[str, t.Any]):
+        response = self._request_handler.get(url, params=extra_params, stream=True)
+
+        try:
+            raise_for_status(response)
+        except Exception:
+            response.close()
+            raise
+
+        return response
+
+    def _iter_list(self,
+                   url: str,
+                   response_class: t.Any,
+                   extra_params: t.Optional[t.Dict[str, t.Any]] = None,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE) -> t.Iterator[t.Any]:
+        response = self._resilient('GET', lambda: self._open_stream(url, extra_params or {}))
+
+        try:
+            for object_dict in iter_json_array(response.iter_content(chunk_size=chunk_size)):
+                yield response_class.from_json(object_dict)
+        finally:
+            response.close()
+
+    def _cached(self, key: t.Hashable, fetch: t.Callable[[], t.Any]) -> t.Any:
+        if self._topic_cache is None:
+            return fetch()
+
+        result = self._topic_cache.get(key)
+        if result is None:
+            result = fetch()
+            self._topic_cache.set(key, result)
+
+        # lists are copied so that callers cannot alter the cached ones
+        return list(result) if isinstance(result, list) else result
+
+    def _invalidate_topic(self, topic_id: t.Optional[int] = None, topic: t.Optional[Topic] = None) -> None:
+        if self._topic_cache is None:
+            return
+
+        self._topic_cache.delete(self._CACHE_KEY_TOPICS, self._CACHE_KEY_TOPICS_OWN, self._CACHE_KEY_TOPIC_RECORDS,
+                                 ('topic', topic_id))
+
+        if topic is not None:
+            self._topic_cache.set(('topic', topic.id), topic)
+
+    @staticmethod
+    def _pagination_params(page: t.Optional[int], limit: t.Optional[int]) -> t.Dict[str, int]:
+        params = {}
+        if page is not None:
+            params['page'] = page
+        if limit is not None:
+            params['limit'] = limit
+
+        return params
+
+    @_instrumented
+    def get_topics(self,
+                   page: t.Optional[int] = None,
+                   limit: t.Optional[int] = None,
+                   lazy: bool = False) -> t.Union[t.List[Topic], LazyTopicList]:
+        """
+        :param page: the page to retrieve, if the server paginates the topics
+        :param limit: the maximum number of topics per page
+        :param lazy: if True, a LazyTopicList is returned instead which builds each topic only once it is accessed
+        :return:
+        """
+        if lazy:
+            if page is not None or limit is not None:
+                records = self._get_list(self._url_topics, response_class=RawRecord,
+                                         extra_params=self._pagination_params(page, limit))
+            else:
+                records = self._cached(
+                    self._CACHE_KEY_TOPIC_RECORDS,
+                    lambda: self._get_list(self._url_topics, response_class=RawRecord)
+                )
+            return LazyTopicList(records, response_class=TOPIC_SERIALIZER)
+
+        if page is not None or limit is not None:
+            return self._get_list(self._url_topics, response_class=TOPIC_SERIALIZER,
+                                  extra_params=self._pagination_params(page, limit))
+
+        return self._cached(
+            self._CACHE_KEY_TOPICS,
+            lambda: self._get_list(self._url_topics, response_class=TOPIC_SERIALIZER)
+        )
+
+    @_instrumented
     def get_topics_own(self) -> t.List[Topic]:
-        return self.perform_request('GET', self._url_topics_own, response_class=Topic, many=True)
+        return self._cached(
+            self._CACHE_KEY_TOPICS_OWN,
+            lambda: self._get_list(self._url_topics_own, response_class=TOPIC_SERIALIZER)
+        )
+
+    def paginate_topics(self, limit: int = DEFAULT_PAGE_SIZE) -> t.Iterator[Topic]:
+        """
+        Iterates over all the topics page by page, fetching the next page while the current one is consumed
+
+        :param limit: the number of topics per page
+        :return:
+        """
+        return iter_pages(lambda page: self.get_topics(page=page, limit=limit), limit=limit)
 
+    def iter_topics(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> t.Iterator[Topic]:
+        """
+        Streams the topics, decoding the response body incrementally
+
+        :param chunk_size: the size in bytes of the chunks the response body is read in
+        :return:
+        """
+        return self._iter_list(self._url_topics, response_class=TOPIC_SERIALIZER, chunk_size=chunk_size)
+
+    @_instrumented
     def get_topic_by_id(self, topic_id: int) -> Topic:
         url = self._url_topic_by_id.format(topic_id=topic_id)
 
-        return self.perform_request('GET', url, response_class=Topic)
+        return self._cached(('topic', topic_id),
+                            lambda: self.perform_request('GET', url, response_class=TOPIC_SERIALIZER))
 
+    @_instrumented
     def post_topic(self, topic: Topic) -> Topic:
-        topic_data = topic.to_json()
+        with phase(SERIALIZE):
+            topic_data = topic.to_json()
+
+        result = self.perform_request('POST', self._url_topics, json=topic_data, response_class=TOPIC_SERIALIZER)
+        self._invalidate_topic(topic_id=result.id, topic=result)
+        self._topic_index.add(result)
+
+        return result
+
+    def get_topic_by_name(self, name: str) -> Topic:
+        """
+        Looks up a topic by its name in a local index. The index is (re)built from the topics list upon a miss or once
+        the indexed topic has expired, unless the same name was not found by a recent rebuild either.
+
+        :param name: the name of the topic
+        :return: Topic
+        :raises ValueError: if no topic with such name exists
+        """
+        topic = self._topic_index.get(name)
 
-        return self.perform_request('POST', self._url_topics, json=topic_data, response_class=Topic)
+        if topic is None and not self._topic_index.is_recent_miss(name):
+            self._topic_index.rebuild(self.get_topics())
+            topic = self._topic_index.get(name)
+            if topic is None:
+                self._topic_index.record_miss(name)
+
+        if topic is None:
+            raise ValueError(f"no topic named '{name}'")
+
+        return topic
+
+    def resolve_topic(self, name: str) -> int:
+        """
+        :param name: the name of the topic
+        :return: the DB id of the topic
+        :raises ValueError: if no topic with such name exists
+        """
+        return self.get_topic_by_name(name).id
 
     # def put_topic(self, topic_id: int, topic: Topic) -> Topic:
     #     url = self._url_topic_by_id.format(topic_id=topic_id)
@@ -78,38 +557,258 @@ class SubscriptionManagerClient(Requestor, ClientFactory):
     #
     #     return self.perform_request('PUT', url, json=topic_data, response_class=Topic)
 
+    @_instrumented
     def delete_topic_by_id(self, topic_id: int):
         url = self._url_topic_by_id.format(topic_id=topic_id)
 
         self.perform_request('DELETE', url)
+        self._invalidate_topic(topic_id=topic_id)
+        self._topic_index.remove(topic_id)
+
+    @_instrumented
+    def get_subscriptions(self,
+                          queue: t.Optional[str] = None,
+                          page: t.Optional[int] = None,
+                          limit: t.Optional[int] = None,
+                          topic_interner: t.Optional[TopicInterner] = None,
+                          lazy: bool = False) -> t.Union[t.List[Subscription], LazySubscriptionList]:
+        """
+        :param queue: if provided, only the subscription of this queue is returned
+        :param page: the page to retrieve, if the server paginates the subscriptions
+        :param limit: the maximum number of subscriptions per page
+        :param topic_interner: if provided, subscriptions of the same topic will share a single Topic instance
+        :param lazy: if True, a LazySubscriptionList is returned instead which builds each subscription only once it
+                     is accessed and can be counted, sliced and filtered without building any
+        :return:
+        """
+        extra_params = {'queue': queue} if queue else {}
+        extra_params.update(self._pagination_params(page, limit))
+
+        if lazy:
+            records = self._get_list(self._url_subscriptions, response_class=RawRecord, extra_params=extra_params)
+            return LazySubscriptionList(records, response_class=_subscription_response_class(topic_interner))
+
+        return self._get_list(self._url_subscriptions, response_class=_subscription_response_class(topic_interner),
+                              extra_params=extra_params)
+
+    def paginate_subscriptions(self,
+                               queue: t.Optional[str] = None,
+                               limit: int = DEFAULT_PAGE_SIZE) -> t.Iterator[Subscription]:
+        """
+        Iterates over all the subscriptions page by page, fetching the next page while the current one is consumed
+
+        :param queue: if provided, only the subscription of this queue is returned
+        :param limit: the number of subscriptions per page
+        :return:
+        """
+        return iter_pages(lambda page: self.get_subscriptions(queue=queue, page=page, limit=limit), limit=limit)
 
-    def get_subscriptions(self, queue: t.Optional[str] = None) -> t.List[Subscription]:
+    def iter_subscriptions(self,
+                           queue: t.Optional[str] = None,
+                           chunk_size: int = DEFAULT_CHUNK_SIZE,
+                           topic_interner: t.Optional[TopicInterner] = None) -> t.Iterator[Subscription]:
+        """
+        Streams the subscriptions, decoding the response body incrementally
+
+        :param queue: if provided, only the subscription of this queue is returned
+        :param chunk_size: the size in bytes of the chunks the response body is read in
+        :param topic_interner: if provided, subscriptions of the same topic will share a single Topic instance
+        :return:
+        """
         extra_params = {'queue': queue} if queue else {}
 
-        return self.perform_request('GET', self._url_subscriptions, extra_params=extra_params,
-                                    response_class=Subscription, many=True)
+        return self._iter_list(self._url_subscriptions, response_class=_subscription_response_class(topic_interner),
+                               extra_params=extra_params, chunk_size=chunk_size)
+
+    def watch_subscriptions(self,
+                            queue: t.Optional[str] = None,
+                            callback: t.Optional[t.Callable[[SubscriptionEvent], t.Any]] = None,
+                            min_interval: float = 1.0,
+                            max_interval: float = 60.0,
+                            emit_initial: bool = False,
+                            on_error: t.Optional[t.Callable[[Exception], None]] = None,
+                            topic_interner: t.Optional[TopicInterner] = None) -> SubscriptionWatcher:
+        """
+        Watches the subscriptions for changes by polling them on an interval which doubles while nothing changes and
+        falls back to min_interval after a change. Successive snapshots are compared by id and only the subscriptions
+        involved in a change are built. Combined with conditional_requests, unchanged snapshots cost a 304 response.
+
+        The returned watcher can be iterated over in order to receive the events or, if a callback is provided, it
+        passes them to it from a background thread. In both cases it stops upon watcher.stop().
+
+        :param queue: if provided, only the subscription of this queue is watched
+        :param callback: if provided, it is called with every SubscriptionEvent from a background thread
+        :param min_interval: the polling interval in seconds right after a change
+        :param max_interval: the maximum polling interval in seconds
+        :param emit_initial: if True, the subscriptions existing when the watch starts are emitted as created
+        :param on_error: if provided, it is called with the errors of the polls and polling goes on. Otherwise the
+                         errors stop the watcher
+        :param topic_interner: if provided, subscriptions of the same topic will share a single Topic instance
+        :return: SubscriptionWatcher
+        """
+        watcher = SubscriptionWatcher(
+            lambda: self.get_subscriptions(queue=queue, topic_interner=topic_interner, lazy=True),
+            interval=AdaptiveInterval(min_interval=min_interval, max_interval=max_interval),
+            emit_initial=emit_initial,
+            on_error=on_error,
+        )
+
+        return watcher.start(callback) if callback is not None else watcher
+
+    @_instrumented
+    def get_subscription_columns(self, queue: t.Optional[str] = None) -> SubscriptionColumns:
+        """
+        Retrieves the subscriptions straight into a column oriented snapshot, without building any model
 
+        :param queue: if provided, only the subscription of this queue is returned
+        :return: SubscriptionColumns
+        """
+        extra_params = {'queue': queue} if queue else {}
+
+        return SubscriptionColumns.from_records(
+            self._get_list(self._url_subscriptions, response_class=RawRecord, extra_params=extra_params)
+        )
+
+    @_instrumented
     def get_subscription_by_id(self, subscription_id: int) -> Subscription:
         url = self._url_subscription_by_id.format(subscription_id=subscription_id)
 
-        return self.perform_request('GET', url, response_class=Subscription)
+        return self.perform_request('GET', url, response_class=SUBSCRIPTION_SERIALIZER)
 
+    @_instrumented
     def post_subscription(self, subscription: Subscription) -> Subscription:
-        subscription_data = subscription.to_json()
+        with phase(SERIALIZE):
+            subscription_data = subscription.to_json()
 
         return self.perform_request('POST', self._url_subscriptions, json=subscription_data,
-                                    response_class=Subscription)
+                                    response_class=SUBSCRIPTION_SERIALIZER)
+
+    def post_subscriptions(self,
+                           subscriptions: t.Iterable[Subscription],
+                           max_workers: int = DEFAULT_MAX_WORKERS) -> t.List[BulkResult]:
+        """
+        Creates the provided subscriptions concurrently. A failing subscription does not affect the rest of them.
 
+        :param subscriptions:
+        :param max_workers: the maximum number of requests in flight
+        :return: one BulkResult per subscription holding the created Subscription or the raised error
+        """
+        return run_bulk(self.post_subscription, subscriptions, max_workers=max_workers)
+
+    @_instrumented
     def put_subscription(self, subscription_id: int, update_data: t.Dict[str, bool]) -> Subscription:
         url = self._url_subscription_by_id.format(subscription_id=subscription_id)
 
-        return self.perform_request('PUT', url, json=update_data, response_class=Subscription)
+        return self.perform_request('PUT', url, json=update_data, response_class=SUBSCRIPTION_SERIALIZER)
 
+    @_instrumented
     def delete_subscription_by_id(self, subscription_id: int):
         url = self._url_subscription_by_id.format(subscription_id=subscription_id)
 
         self.perform_request('DELETE', url)
 
+    def set_subscriptions_active(self,
+                                 subscriptions: t.Iterable[t.Union[int, Subscription]],
+                                 active: bool,
+                                 max_workers: int = DEFAULT_MAX_WORKERS) -> t.List[BulkResult]:
+        """
+        Pauses or resumes the provided subscriptions concurrently. Subscription objects whose active flag already
+        matches are skipped without contacting the server.
+
+        :param subscriptions: subscription ids or Subscription objects
+        :param active: whether the subscriptions should be active (resumed) or not (paused)
+        :param max_workers: the maximum number of requests in flight
+        :return: one BulkResult per subscription holding the updated Subscription or the raised error. For the
+                 skipped ones, the provided Subscription object is the result
+        """
+        items = list(subscriptions)
+        results: t.List[t.Optional[BulkResult]] = [None] * len(items)
+        pending = []
+
+        for index, item in enumerate(items):
+            if not isinstance(item, int) and item.active == active:
+                results[index] = BulkResult(item, result=item, skipped=True)
+            else:
+                pending.append(index)
+
+        def update(item):
+            subscription_id = item if isinstance(item, int) else item.id
+            return self.put_subscription(subscription_id, {'active': active})
+
+        bulk_results = run_bulk(update, [items[index] for index in pending], max_workers=max_workers)
+        for index, result in zip(pending, bulk_results):
+            results[index] = result
+
+        return results
+
+    def delete_subscriptions(self,
+                             subscription_ids: t.Iterable[int],
+                             max_workers: int = DEFAULT_MAX_WORKERS) -> t.List[BulkResult]:
+        """
+        Deletes the provided subscriptions concurrently. A failing deletion does not affect the rest of them.
+
+        :param subscription_ids:
+        :param max_workers: the maximum number of requests in flight
+        :return: one BulkResult per subscription id holding the raised error, if any
+        """
+        return run_bulk(self.delete_subscription_by_id, subscription_ids, max_workers=max_workers)
+
+    def reconcile(self,
+                  desired: t.Iterable[Subscription],
+                  delete_unmatched: bool = True,
+                  dry_run: bool = False,
+                  max_workers: int = DEFAULT_MAX_WORKERS) -> ReconcileReport:
+        """
+        Brings the subscriptions of the server to the desired state with the minimum number of requests: the current
+        subscriptions are retrieved once and only the missing ones are created, the ones whose active flag differs
+        are updated and the ones not desired are deleted, concurrently.
+
+        Desired subscriptions are matched by topic, qos and durability, and by queue as well if they define the queue
+        of an existing subscription (see `reconcile.plan`). A subscription whose qos or durability changes is
+        recreated, under a new queue, since only its active flag can be updated. The deletions are performed first.
+
+        :param desired: the subscriptions that should exist
+        :param delete_unmatched: whether the existing subscriptions not matching any of the desired ones are deleted
+        :param dry_run: if True, the report of the planned changes is returned without applying them
+        :param max_workers: the maximum number of requests in flight
+        :return: ReconcileReport
+        """
+        actions, unchanged = plan(self.get_subscriptions(), desired, delete_unmatched=delete_unmatched)
+
+        report = ReconcileReport()
+        report.unchanged = unchanged
+        report_lists = {CREATE: report.created, UPDATE: report.updated, DELETE: report.deleted}
+
+        if dry_run:
+            for action, subscription in actions:
+                report_lists[action].append(subscription)
+            return report
+
+        def perform(action_subscription):
+            action, subscription = action_subscription
+            if action == CREATE:
+                return self.post_subscription(subscription)
+            if action == UPDATE:
+                return self.put_subscription(subscription.id, {'active': subscription.active})
+            self.delete_subscription_by_id(subscription.id)
+            return subscription
+
+        # the replaced subscriptions are deleted before their replacements are created
+        deletions = [action for action in actions if action[0] == DELETE]
+        others = [action for action in actions if action[0] != DELETE]
+
+        results = run_bulk(perform, deletions, max_workers=max_workers)
+        results.extend(run_bulk(perform, others, max_workers=max_workers))
+
+        for result in results:
+            if result.ok:
+                report_lists[result.item[0]].append(result.result)
+            else:
+                report.failed.append(result)
+
+        return report
+
+    @_instrumented
     def ping_credentials(self):
 
         return self.perform_request('GET', self._url_ping_credentials)
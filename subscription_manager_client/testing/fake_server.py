@@ -0,0 +1,319 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import json
+import random
+import re
+import threading
+import time
+import typing as t
+import uuid
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+BASE_PATH = '/subscription-manager/api/1.0/'
+
+QOS_VALUES = ('AT_LEAST_ONCE', 'AT_MOST_ONCE', 'EXACTLY_ONCE')
+
+
+class FakeSubscriptionManager:
+
+    def __init__(self,
+                 latency: t.Union[float, t.Tuple[float, float]] = 0.0,
+                 error_rate: float = 0.0,
+                 error_status: int = 500,
+                 seed: t.Optional[int] = None,
+                 host: str = '127.0.0.1',
+                 port: int = 0) -> None:
+        """
+        An in-memory stand-in of the Subscription Manager REST API served over HTTP from a background thread.
+
+        :param latency: the delay in seconds added to each response, either fixed or a (min, max) range
+        :param error_rate: the probability (0 to 1) of a request failing with `error_status`
+        :param error_status: the status code of the injected failures
+        :param seed: the seed of the random generator driving latencies and failures
+        :param host: the interface to listen to
+        :param port: the port to listen to. By default a free one is picked
+        """
+        if not 0 <= error_rate <= 1:
+            raise ValueError('error_rate should be between 0 and 1')
+
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+
+        self.topics: t.Dict[int, t.Dict[str, t.Any]] = {}
+        self.own_topic_ids: t.Set[int] = set()
+        self.subscriptions: t.Dict[int, t.Dict[str, t.Any]] = {}
+        self.requests_count = 0
+
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._next_topic_id = 1
+        self._next_subscription_id = 1
+
+        self._routes = [
+            ('GET', re.compile(r'topics/$'), self._get_topics),
+            ('GET', re.compile(r'topics/own$'), self._get_topics_own),
+            ('GET', re.compile(r'topics/(?P<topic_id>\d+)$'), self._get_topic),
+            ('POST', re.compile(r'topics/$'), self._post_topic),
+            ('DELETE', re.compile(r'topics/(?P<topic_id>\d+)$'), self._delete_topic),
+            ('GET', re.compile(r'subscriptions/$'), self._get_subscriptions),
+            ('GET', re.compile(r'subscriptions/(?P<subscription_id>\d+)$'), self._get_subscription),
+            ('POST', re.compile(r'subscriptions/$'), self._post_subscription),
+            ('PUT', re.compile(r'subscriptions/(?P<subscription_id>\d+)$'), self._put_subscription),
+            ('DELETE', re.compile(r'subscriptions/(?P<subscription_id>\d+)$'), self._delete_subscription),
+            ('GET', re.compile(r'ping-credentials$'), self._ping_credentials),
+        ]
+
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: t.Optional[threading.Thread] = None
+
+    @property
+    def host(self) -> str:
+        return '{}:{}'.format(*self._server.server_address)
+
+    @property
+    def base_url(self) -> str:
+        return f'http://{self.host}/'
+
+    def start(self) -> 'FakeSubscriptionManager':
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={'poll_interval': 0.05},
+                                        daemon=True)
+        self._thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def add_topic(self, name: str, own: bool = True) -> t.Dict[str, t.Any]:
+        with self._lock:
+            topic = {'name': name, 'id': self._next_topic_id}
+            self._next_topic_id += 1
+            self.topics[topic['id']] = topic
+            if own:
+                self.own_topic_ids.add(topic['id'])
+
+            return topic
+
+    def add_subscription(self,
+                         topic_id: int,
+                         qos: str = 'AT_LEAST_ONCE',
+                         durable: bool = False,
+                         active: bool = True,
+                         queue: t.Optional[str] = None) -> t.Dict[str, t.Any]:
+        with self._lock:
+            subscription = {
+                'queue': queue or uuid.uuid4().hex,
+                'topic': dict(self.topics[topic_id]),
+                'active': active,
+                'qos': qos,
+                'durable': durable,
+                'id': self._next_subscription_id,
+            }
+            self._next_subscription_id += 1
+            self.subscriptions[subscription['id']] = subscription
+
+            return subscription
+
+    def populate(self, topics_count: int, subscriptions_per_topic: int = 0) -> None:
+        """
+        Creates topics and subscriptions in bulk, i.e. in order to control the size of the listings
+
+        :param topics_count:
+        :param subscriptions_per_topic:
+        """
+        for index in range(topics_count):
+            topic = self.add_topic(f'topic_{self._next_topic_id}')
+            for _ in range(subscriptions_per_topic):
+                self.add_subscription(topic['id'], qos=QOS_VALUES[index % len(QOS_VALUES)], durable=bool(index % 2))
+
+    def _get_topics(self, params, body):
+        return 200, list(self.topics.values())
+
+    def _get_topics_own(self, params, body):
+        return 200, [topic for topic_id, topic in self.topics.items() if topic_id in self.own_topic_ids]
+
+    def _get_topic(self, params, body, topic_id):
+        topic = self.topics.get(int(topic_id))
+        if topic is None:
+            return 404, {'detail': 'Topic not found'}
+
+        return 200, topic
+
+    def _post_topic(self, params, body):
+        name = (body or {}).get('name')
+        if not name:
+            return 400, {'detail': "'name' is a required property"}
+        if any(topic['name'] == name for topic in self.topics.values()):
+            return 409, {'detail': 'Topic with the same name already exists'}
+
+        return 201, self.add_topic(name)
+
+    def _delete_topic(self, params, body, topic_id):
+        topic_id = int(topic_id)
+        with self._lock:
+            if self.topics.pop(topic_id, None) is None:
+                return 404, {'detail': 'Topic not found'}
+            self.own_topic_ids.discard(topic_id)
+            for subscription_id, subscription in list(self.subscriptions.items()):
+                if subscription['topic']['id'] == topic_id:
+                    del self.subscriptions[subscription_id]
+
+        return 204, None
+
+    def _get_subscriptions(self, params, body):
+        queue = params.get('queue', [None])[0]
+        subscriptions = list(self.subscriptions.values())
+        if queue:
+            subscriptions = [subscription for subscription in subscriptions if subscription['queue'] == queue]
+
+        return 200, subscriptions
+
+    def _get_subscription(self, params, body, subscription_id):
+        subscription = self.subscriptions.get(int(subscription_id))
+        if subscription is None:
+            return 404, {'detail': 'Subscription not found'}
+
+        return 200, subscription
+
+    def _post_subscription(self, params, body):
+        body = body or {}
+        topic_id = body.get('topic_id')
+        if topic_id not in self.topics:
+            return 404, {'detail': 'Topic not found'}
+        qos = body.get('qos', 'AT_LEAST_ONCE')
+        if qos not in QOS_VALUES:
+            return 400, {'detail': f'qos should be one of {list(QOS_VALUES)}'}
+
+        return 201, self.add_subscription(topic_id, qos=qos, durable=body.get('durable', False),
+                                          active=body.get('active', True))
+
+    def _put_subscription(self, params, body, subscription_id):
+        subscription = self.subscriptions.get(int(subscription_id))
+        if subscription is None:
+            return 404, {'detail': 'Subscription not found'}
+        if not isinstance((body or {}).get('active'), bool):
+            return 400, {'detail': "'active' is a required property"}
+
+        subscription = dict(subscription, active=body['active'])
+        self.subscriptions[subscription['id']] = subscription
+
+        return 200, subscription
+
+    def _delete_subscription(self, params, body, subscription_id):
+        if self.subscriptions.pop(int(subscription_id), None) is None:
+            return 404, {'detail': 'Subscription not found'}
+
+        return 204, None
+
+    def _ping_credentials(self, params, body):
+        return 200, None
+
+    def _delay(self) -> float:
+        if isinstance(self.latency, tuple):
+            return self._random.uniform(*self.latency)
+
+        return self.latency
+
+    def handle(self, method: str, path: str, query: str, body: t.Optional[bytes]) -> t.Tuple[int, bytes]:
+        """
+        Dispatches a request to the corresponding endpoint
+
+        :return: the status code and the body of the response
+        """
+        with self._lock:
+            self.requests_count += 1
+            delay = self._delay()
+            fail = self._random.random() < self.error_rate
+
+        if delay:
+            time.sleep(delay)
+
+        if fail:
+            return self.error_status, json.dumps({'detail': 'Injected failure'}).encode()
+
+        if not path.startswith(BASE_PATH):
+            return 404, json.dumps({'detail': 'Not found'}).encode()
+
+        for route_method, pattern, endpoint in self._routes:
+            match = pattern.match(path[len(BASE_PATH):])
+            if match and route_method == method:
+                try:
+                    data = json.loads(body) if body else None
+                except ValueError:
+                    return 400, json.dumps({'detail': 'Invalid JSON'}).encode()
+
+                with self._lock:
+                    status, result = endpoint(parse_qs(query), data, **match.groupdict())
+
+                # the stored records are replaced rather than updated in place, so they can be dumped unlocked
+                return status, json.dumps(result).encode() if result is not None else b''
+
+        return 404, json.dumps({'detail': 'Not found'}).encode()
+
+    def _make_handler(self) -> t.Type[BaseHTTPRequestHandler]:
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # the headers and the body are written separately, which would otherwise wait for a delayed ACK
+            disable_nagle_algorithm = True
+
+            def _handle(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else None
+                url = urlsplit(self.path)
+
+                status, payload = fake.handle(self.command, url.path, url.query, body)
+
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,105 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import threading
+import time
+import typing as t
+
+from subscription_manager_client.models import Topic
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+class TopicIndex:
+
+    def __init__(self,
+                 ttl: float = 300.0,
+                 miss_ttl: float = 30.0,
+                 clock: t.Callable[[], float] = time.monotonic) -> None:
+        """
+        A thread safe index of topics keyed by their name. Indexed topics expire after a while, so that topics deleted
+        or renamed by other clients stop resolving. It also remembers for a while the names which were not found, so
+        that looking them up repeatedly does not trigger a rebuild every time.
+
+        :param ttl: how long in seconds an indexed topic is considered valid
+        :param miss_ttl: how long in seconds a name which was not found is remembered
+        :param clock: the source of time
+        """
+        self._entries: t.Dict[str, t.Tuple[float, Topic]] = {}
+        self._misses: t.Dict[str, float] = {}
+        self._ttl = ttl
+        self._miss_ttl = miss_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def rebuild(self, topics: t.Iterable[Topic]) -> None:
+        expires_at = self._clock() + self._ttl
+        entries = {topic.name: (expires_at, topic) for topic in topics}
+
+        with self._lock:
+            self._entries = entries
+
+    def add(self, topic: Topic) -> None:
+        with self._lock:
+            self._entries[topic.name] = (self._clock() + self._ttl, topic)
+            self._misses.pop(topic.name, None)
+
+    def remove(self, topic_id: int) -> None:
+        with self._lock:
+            self._entries = {name: entry for name, entry in self._entries.items() if entry[1].id != topic_id}
+
+    def get(self, name: str) -> t.Optional[Topic]:
+        """
+        :return: the indexed topic or None if the name is not indexed or its topic has expired
+        """
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+
+        expires_at, topic = entry
+
+        return topic if expires_at > self._clock() else None
+
+    def record_miss(self, name: str) -> None:
+        now = self._clock()
+
+        with self._lock:
+            self._misses = {miss: expires_at for miss, expires_at in self._misses.items() if expires_at > now}
+            self._misses[name] = now + self._miss_ttl
+
+    def is_recent_miss(self, name: str) -> bool:
+        """
+        :return: True if the name was not found by a rebuild less than miss_ttl seconds ago
+        """
+        expires_at = self._misses.get(name)
+
+        return expires_at is not None and expires_at > self._clock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,238 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import os
+import time
+import typing as t
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+SERIALIZE = 'serialize'
+NETWORK = 'network'
+DESERIALIZE = 'deserialize'
+
+_HTTP_METHODS = frozenset(['get', 'post', 'put', 'delete', 'patch', 'head', 'options'])
+
+_current_span: ContextVar[t.Optional['Span']] = ContextVar('subscription_manager_client_span', default=None)
+
+
+class Span:
+
+    def __init__(self,
+                 name: str,
+                 trace_id: t.Optional[str] = None,
+                 parent_id: t.Optional[str] = None,
+                 clock: t.Callable[[], float] = time.perf_counter) -> None:
+        """
+        The trace of a single client call, along with the time spent in each of its phases
+
+        :param name: the name of the call, i.e. get_subscriptions
+        :param trace_id: the id of the trace the span belongs to. A new one is generated if not provided
+        :param parent_id: the id of the parent span, if any
+        :param clock: the source of time
+        """
+        self.name = name
+        self.trace_id = trace_id or os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.attributes: t.Dict[str, t.Any] = {}
+        self.timings: t.Dict[str, float] = {SERIALIZE: 0.0, NETWORK: 0.0, DESERIALIZE: 0.0}
+        self.error: t.Optional[BaseException] = None
+        self._clock = clock
+        self._active_phases: t.Set[str] = set()
+        self.start = clock()
+        self.end: t.Optional[float] = None
+
+    @property
+    def duration(self) -> t.Optional[float]:
+        return self.end - self.start if self.end is not None else None
+
+    @property
+    def traceparent(self) -> str:
+        """
+        :return: the span context in the W3C Trace Context format
+        """
+        return f'00-{self.trace_id}-{self.span_id}-01'
+
+    def __repr__(self) -> str:
+        timings = ', '.join(f'{phase}={seconds:.6f}' for phase, seconds in self.timings.items())
+        return f'<Span {self.name} duration={self.duration} {timings}>'
+
+
+class Tracer:
+    """
+    Receives the lifecycle hooks of the client calls. Subclasses can override the hooks in order to emit the spans to
+    a tracing backend, i.e. OpenTelemetry or the logs.
+    """
+
+    trace_header = 'traceparent'
+
+    def __init__(self, clock: t.Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+
+    def start_span(self, name: str, parent: t.Optional[Span] = None) -> Span:
+        if parent is None:
+            return Span(name, clock=self._clock)
+
+        return Span(name, trace_id=parent.trace_id, parent_id=parent.span_id, clock=self._clock)
+
+    def before_request(self, span: Span, method: str, url: str, headers: t.Dict[str, str]) -> None:
+        """
+        Called right before a request is sent. The trace context is propagated by default via the headers.
+        """
+        headers[self.trace_header] = span.traceparent
+
+    def after_response(self, span: Span, response: t.Any) -> None:
+        """
+        Called as soon as a response is received, before it is decoded
+        """
+
+    def after_decode(self, span: Span, result: t.Any) -> None:
+        """
+        Called with the result of the call once the response has been decoded
+        """
+
+    def end_span(self, span: Span) -> None:
+        """
+        Called once the call is over, successfully or not
+        """
+
+
+class RecordingTracer(Tracer):
+
+    def __init__(self, maxsize: int = 1000, clock: t.Callable[[], float] = time.perf_counter) -> None:
+        """
+        Keeps the most recent finished spans in memory
+
+        :param maxsize: the maximum number of spans kept
+        :param clock: the source of time
+        """
+        super().__init__(clock=clock)
+        self.spans: t.Deque[Span] = deque(maxlen=maxsize)
+
+    def end_span(self, span: Span) -> None:
+        self.spans.append(span)
+
+
+def current_span() -> t.Optional[Span]:
+    return _current_span.get()
+
+
+@contextmanager
+def traced(tracer: Tracer, name: str) -> t.Iterator[Span]:
+    """
+    Makes a new span the current one for the duration of the block
+    """
+    span = tracer.start_span(name, parent=current_span())
+    token = _current_span.set(span)
+
+    try:
+        yield span
+    except BaseException as e:
+        span.error = e
+        raise
+    finally:
+        span.end = span._clock()
+        _current_span.reset(token)
+        tracer.end_span(span)
+
+
+@contextmanager
+def phase(name: str) -> t.Iterator[None]:
+    """
+    Adds the time spent in the block to the given phase of the current span, if any. Nested blocks of the same phase
+    are only counted once.
+    """
+    span = current_span()
+    if span is None or name in span._active_phases:
+        yield
+        return
+
+    span._active_phases.add(name)
+    start = span._clock()
+    try:
+        yield
+    finally:
+        span.timings[name] += span._clock() - start
+        span._active_phases.discard(name)
+
+
+class _TracedResponse:
+
+    def __init__(self, response: t.Any) -> None:
+        self._response = response
+
+    def json(self, *args, **kwargs) -> t.Any:
+        with phase(DESERIALIZE):
+            return self._response.json(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> t.Any:
+        return getattr(self._response, name)
+
+
+class TracedRequestHandler:
+
+    def __init__(self, request_handler: t.Any, tracer: Tracer) -> None:
+        """
+        Wraps a request handler so that, within a span, the trace context is propagated via the headers of the
+        requests, the time spent on the wire is accounted for in the network phase and the parsing of the responses in
+        the deserialize phase.
+
+        :param request_handler: i.e. requests.session()
+        :param tracer:
+        """
+        self.request_handler = request_handler
+        self.tracer = tracer
+
+    def __getattr__(self, name: str) -> t.Any:
+        attr = getattr(self.request_handler, name)
+        if name not in _HTTP_METHODS:
+            return attr
+
+        def request(url, *args, **kwargs):
+            span = current_span()
+            if span is None:
+                return attr(url, *args, **kwargs)
+
+            headers = dict(kwargs.get('headers') or {})
+            self.tracer.before_request(span, name.upper(), url, headers)
+            kwargs['headers'] = headers
+
+            with phase(NETWORK):
+                response = attr(url, *args, **kwargs)
+
+            self.tracer.after_response(span, response)
+
+            return _TracedResponse(response)
+
+        return request
@@ -0,0 +1,86 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import typing as t
+
+from rest_client.errors import APIError
+from rest_client.typing import JSONType
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+SUCCESS_STATUS_CODES = (200, 201, 204)
+
+
+def get_error_detail(data: t.Any) -> t.Any:
+    """
+    Extracts the error detail out of the decoded body of a failed response
+
+    :param data: the decoded body of the response
+    :return:
+    """
+    if isinstance(data, dict):
+        return data.get('detail', data)
+
+    return data
+
+
+def raise_for_status(response) -> None:
+    """
+    Raises an APIError in case the status code of the response does not denote success
+
+    :param response:
+    """
+    if response.status_code in SUCCESS_STATUS_CODES:
+        return
+
+    try:
+        detail = get_error_detail(response.json())
+    except ValueError:
+        detail = getattr(response, 'text', None)
+
+    raise APIError(detail=detail, status_code=response.status_code)
+
+
+def models_from_json(data: JSONType, response_class: t.Optional[t.Any] = None, many: bool = False) -> t.Any:
+    """
+    Converts already decoded JSON data into model instances of the provided class (if any)
+
+    :param data:
+    :param response_class: any object exposing a `from_json` method, i.e. a BaseModel subclass
+    :param many: whether data is a list of objects
+    :return:
+    """
+    if response_class is None:
+        return data
+
+    if many:
+        return [response_class.from_json(object_dict) for object_dict in data]
+
+    return response_class.from_json(data)
@@ -0,0 +1,189 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import threading
+import typing as t
+
+from subscription_manager_client.lazy import LazyModelList
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+CREATED = 'created'
+UPDATED = 'updated'
+DELETED = 'deleted'
+
+
+class SubscriptionEvent:
+
+    def __init__(self, type: str, subscription: t.Any, previous: t.Any = None) -> None:
+        """
+        :param type: one of CREATED, UPDATED, DELETED
+        :param subscription: the subscription as it is now, or as it was before being deleted
+        :param previous: the subscription as it was before being updated
+        """
+        self.type = type
+        self.subscription = subscription
+        self.previous = previous
+
+    def __eq__(self, other):
+        if not isinstance(other, SubscriptionEvent):
+            return NotImplemented
+
+        return (self.type, self.subscription, self.previous) == (other.type, other.subscription, other.previous)
+
+    def __repr__(self) -> str:
+        return f'<SubscriptionEvent {self.type} {self.subscription!r}>'
+
+
+def diff_snapshots(previous: LazyModelList, current: LazyModelList) -> t.List[SubscriptionEvent]:
+    """
+    Compares two snapshots of subscriptions by id in linear time. Only the subscriptions involved in the events are
+    built.
+
+    :param previous:
+    :param current:
+    :return: the created, updated and deleted subscriptions, in this order
+    """
+    previous_records = previous.records
+    previous_indexes = {record.get('id'): index for index, record in enumerate(previous_records)}
+
+    created, updated = [], []
+    for index, record in enumerate(current.records):
+        previous_index = previous_indexes.pop(record.get('id'), None)
+        if previous_index is None:
+            created.append(SubscriptionEvent(CREATED, current[index]))
+        elif previous_records[previous_index] != record:
+            updated.append(SubscriptionEvent(UPDATED, current[index], previous=previous[previous_index]))
+
+    deleted = [SubscriptionEvent(DELETED, previous[index]) for index in previous_indexes.values()]
+
+    return created + updated + deleted
+
+
+class AdaptiveInterval:
+
+    def __init__(self, min_interval: float = 1.0, max_interval: float = 60.0, factor: float = 2.0) -> None:
+        """
+        A polling interval which grows while nothing changes and falls back to its minimum after a change
+
+        :param min_interval: the interval in seconds right after a change
+        :param max_interval: the upper bound of the interval in seconds
+        :param factor: the interval is multiplied by it after every poll without changes
+        """
+        if not 0 < min_interval <= max_interval:
+            raise ValueError('intervals should be positive and min_interval should not exceed max_interval')
+        if factor < 1:
+            raise ValueError('factor should be at least 1')
+
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.factor = factor
+        self.current = min_interval
+
+    def next(self, changed: bool) -> float:
+        self.current = self.min_interval if changed else min(self.current * self.factor, self.max_interval)
+
+        return self.current
+
+
+class SubscriptionWatcher:
+
+    def __init__(self,
+                 fetch: t.Callable[[], LazyModelList],
+                 interval: t.Optional[AdaptiveInterval] = None,
+                 emit_initial: bool = False,
+                 on_error: t.Optional[t.Callable[[Exception], None]] = None) -> None:
+        """
+        Polls the subscriptions and yields the changes between successive snapshots
+
+        :param fetch: retrieves a snapshot of the subscriptions
+        :param interval: the polling interval
+        :param emit_initial: if True, the subscriptions of the first snapshot are yielded as created
+        :param on_error: if provided, it is called with the errors of fetch and polling goes on, backing off.
+                         Otherwise the errors are raised
+        """
+        self._fetch = fetch
+        self.interval = interval or AdaptiveInterval()
+        self._emit_initial = emit_initial
+        self._on_error = on_error
+        self._stopped = threading.Event()
+        self._thread: t.Optional[threading.Thread] = None
+
+    def __iter__(self) -> t.Iterator[SubscriptionEvent]:
+        snapshot = None
+
+        while not self._stopped.is_set():
+            try:
+                current = self._fetch()
+            except Exception as e:
+                if self._on_error is None:
+                    raise
+                self._on_error(e)
+                self._stopped.wait(self.interval.next(changed=False))
+                continue
+
+            if snapshot is not None:
+                events = diff_snapshots(snapshot, current)
+            elif self._emit_initial:
+                events = [SubscriptionEvent(CREATED, subscription) for subscription in current]
+            else:
+                events = []
+            snapshot = current
+
+            yield from events
+
+            self._stopped.wait(self.interval.next(changed=bool(events)))
+
+    def start(self, callback: t.Callable[[SubscriptionEvent], t.Any]) -> 'SubscriptionWatcher':
+        """
+        Polls in a background thread, passing every event to the callback
+
+        :param callback:
+        :return: the watcher itself
+        """
+        def run():
+            for event in self:
+                callback(event)
+
+        self._thread = threading.Thread(target=run, name='subscription watcher', daemon=True)
+        self._thread.start()
+
+        return self
+
+    def stop(self, timeout: t.Optional[float] = None) -> None:
+        """
+        Stops polling. If the watcher runs in the background, waits for its thread to finish
+
+        :param timeout: how long to wait for the thread in seconds
+        """
+        self._stopped.set()
+
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
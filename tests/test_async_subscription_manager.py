@@ -0,0 +1,349 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import asyncio
+from unittest.mock import Mock, AsyncMock
+
+import pytest
+from rest_client.errors import APIError
+
+from subscription_manager_client.async_subscription_manager import AsyncSubscriptionManagerClient, AsyncSingleFlight
+from tests.utils import make_topic_list, make_topic, make_subscription_list, make_subscription
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+BASE_URL = 'subscription-manager/api/1.0/'
+
+
+def make_response(status_code, data=None):
+    response = Mock()
+    response.status_code = status_code
+    response.content = data
+    response.json = Mock(return_value=data)
+
+    return response
+
+
+@pytest.mark.parametrize('error_code', [400, 401, 403, 404, 500])
+def test_get_topics__http_error_code__raises_api_error(error_code):
+    request_handler = Mock()
+    request_handler.get = AsyncMock(return_value=make_response(error_code))
+
+    client = AsyncSubscriptionManagerClient(request_handler=request_handler)
+
+    with pytest.raises(APIError):
+        asyncio.run(client.get_topics())
+
+
+def test_get_topics__list_of_topics_is_returned():
+    topic_dict_list, expected_topic_list = make_topic_list()
+
+    request_handler = Mock()
+    request_handler.get = AsyncMock(return_value=make_response(200, topic_dict_list))
+
+    client = AsyncSubscriptionManagerClient(request_handler=request_handler)
+
+    topic_list = asyncio.run(client.get_topics())
+
+    assert expected_topic_list == topic_list
+
+    called_url = request_handler.get.call_args[0][0]
+    assert BASE_URL + 'topics/' == called_url
+
+
+def test_get_topics_own__list_of_topics_is_returned():
+    topic_dict_list, expected_topic_list = make_topic_list()
+
+    request_handler = Mock()
+    request_handler.get = AsyncMock(return_value=make_response(200, topic_dict_list))
+
+    client = AsyncSubscriptionManagerClient(request_handler=request_handler)
+
+    topic_list = asyncio.run(client.get_topics_own())
+
+    assert expected_topic_list == topic_list
+
+    called_url = request_handler.get.call_args[0][0]
+    assert BASE_URL + 'topics/own' == called_url
+
+
+def test_get_topic_by_id__topic_is_returned():
+    topic_dict, expected_topic = make_topic()
+
+    request_handler = Mock()
+    request_handler.get = AsyncMock(return_value=make_response(200, topic_dict))
+
+    client = AsyncSubscriptionManagerClient(request_handler=request_handler)
+
+    topic = asyncio.run(client.get_topic_by_id(1))
+
+    assert expected_topic == topic
+
+    called_url = request_handler.get.call_args[0][0]
+    assert BASE_URL + 'topics/1' == called_url
+
+
+def test_post_topic__topic_object_is_returned():
+    topic_dict, expected_topic = make_topic()
+
+    request_handler = Mock()
+    request_handler.post = AsyncMock(return_value=make_response(201, topic_dict))
+
+    client = AsyncSubscriptionManagerClient(request_handler=request_handler)
+
+    topic = asyncio.run(client.post_topic(expected_topic))
+
+    assert expected_topic == topic
+
+    called_url = request_handler.post.call_args[0][0]
+    assert BASE_URL + 'topics/' == called_url
+    assert topic_dict == request_handler.post.call_args[1]['json']
+
+
+@pytest.mark.parametrize('error_code', [400, 401, 403, 404, 500])
+def test_delete_topic_by_id__http_error_code__raises_api_error(error_code):
+    request_handler = Mock()
+    request_handler.delete = AsyncMock(return_value=make_response(error_code))
+
+    client = AsyncSubscriptionManagerClient(request_handler=request_handler)
+
+    with pytest.raises(APIError):
+        asyncio.run(client.delete_topic_by_id(1))
+
+
+def test_delete_topic_by_id():
+    request_handler = Mock()
+    request_handler.delete = AsyncMock(return_value=make_response(204, {}))
+
+    client = AsyncSubscriptionManagerClient(request_handler=request_handler)
+
+    asyncio.run(client.delete_topic_by_id(1))
+
+    called_url = request_handler.delete.call_args[0][0]
+    assert BASE_URL + 'topics/1' == called_url
+
+
+def test_get_subscriptions__queue_is_passed_as_param():
+    subscription_dict_list, expected_subscription_list = make_subscription_list()
+
+    request_handler = Mock()
+    request_handler.get = AsyncMock(return_value=make_response(200, subscription_dict_list))
+
+    client = AsyncSubscriptionManagerClient(request_handler=request_handler)
+
+    subscription_list = asyncio.run(client.get_subscriptions(queue='queue'))
+
+    assert expected_subscription_list == subscription_list
+
+    called_url = request_handler.get.call_args[0][0]
+    assert BASE_URL + 'subscriptions/' == called_url
+    assert {'queue': 'queue'} == request_handler.get.call_args[1]['params']
+
+
+def test_get_subscription_by_id__subscription_is_returned():
+    subscription_dict, expected_subscription = make_subscription()
+
+    request_handler = Mock()
+    request_handler.get = AsyncMock(return_value=make_response(200, subscription_dict))
+
+    client = AsyncSubscriptionManagerClient(request_handler=request_handler)
+
+    subscription = asyncio.run(client.get_subscription_by_id(1))
+
+    assert expected_subscription == subscription
+
+    called_url = request_handler.get.call_args[0][0]
+    assert BASE_URL + 'subscriptions/1' == called_url
+
+
+@pytest.mark.parametrize('error_code', [400, 401, 403, 404, 500])
+def test_post_subscription__http_error_code__raises_api_error(error_code):
+    request_handler = Mock()
+    request_handler.post = AsyncMock(return_value=make_response(error_code))
+
+    client = AsyncSubscriptionManagerClient(request_handler=request_handler)
+
+    with pytest.raises(APIError):
+        asyncio.run(client.post_subscription(Mock()))
+
+
+def test_post_subscription__subscription_object_is_returned():
+    subscription_dict, expected_subscription = make_subscription()
+
+    request_handler = Mock()
+    request_handler.post = AsyncMock(return_value=make_response(201, subscription_dict))
+
+    client = AsyncSubscriptionManagerClient(request_handler=request_handler)
+
+    subscription = asyncio.run(client.post_subscription(Mock()))
+
+    assert expected_subscription == subscription
+
+    called_url = request_handler.post.call_args[0][0]
+    assert BASE_URL + 'subscriptions/' == called_url
+
+
+def test_put_subscription__subscription_object_is_returned():
+    subscription_dict, expected_subscription = make_subscription()
+
+    request_handler = Mock()
+    request_handler.put = AsyncMock(return_value=make_response(200, subscription_dict))
+
+    client = AsyncSubscriptionManagerClient(request_handler=request_handler)
+
+    subscription = asyncio.run(client.put_subscription(1, {'active': False}))
+
+    assert expected_subscription == subscription
+
+    called_url = request_handler.put.call_args[0][0]
+    assert BASE_URL + 'subscriptions/1' == called_url
+    assert {'active': False} == request_handler.put.call_args[1]['json']
+
+
+def test_delete_subscription_by_id():
+    request_handler = Mock()
+    request_handler.delete = AsyncMock(return_value=make_response(204, {}))
+
+    client = AsyncSubscriptionManagerClient(request_handler=request_handler)
+
+    asyncio.run(client.delete_subscription_by_id(1))
+
+    called_url = request_handler.delete.call_args[0][0]
+    assert BASE_URL + 'subscriptions/1' == called_url
+
+
+def test_requests_are_performed_concurrently():
+    topic_dict, _ = make_topic()
+    in_flight = 0
+    max_in_flight = 0
+
+    async def get(url, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return make_response(200, topic_dict)
+
+    request_handler = Mock()
+    request_handler.get = get
+
+    client = AsyncSubscriptionManagerClient(request_handler=request_handler)
+
+    async def run():
+        return await asyncio.gather(*[client.get_topic_by_id(i) for i in range(10)])
+
+    topics = asyncio.run(run())
+
+    assert 10 == len(topics)
+    assert 10 == max_in_flight
+
+
+def test_get_topic_by_id__coalesce_requests__concurrent_calls_share_a_single_request():
+    topic_dict, expected_topic = make_topic()
+
+    async def get(url, **kwargs):
+        await asyncio.sleep(0.01)
+        return make_response(200, topic_dict)
+
+    request_handler = Mock()
+    request_handler.get = Mock(side_effect=get)
+
+    client = AsyncSubscriptionManagerClient(request_handler=request_handler, coalesce_requests=True)
+
+    async def run():
+        return await asyncio.gather(*[client.get_topic_by_id(1) for _ in range(10)])
+
+    topics = asyncio.run(run())
+
+    assert all(expected_topic == topic for topic in topics)
+    assert 1 == request_handler.get.call_count
+
+
+def test_async_single_flight__concurrent_calls_are_coalesced():
+    single_flight = AsyncSingleFlight()
+    calls = []
+
+    async def func():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return ['result']
+
+    async def run():
+        return await asyncio.gather(*[single_flight.do('key', func) for _ in range(10)])
+
+    results = asyncio.run(run())
+
+    assert 1 == len(calls)
+    assert all(result is results[0] for result in results)
+
+
+def test_async_single_flight__error_is_shared():
+    single_flight = AsyncSingleFlight()
+
+    async def func():
+        await asyncio.sleep(0.01)
+        raise ValueError('boom')
+
+    async def run():
+        return await asyncio.gather(*[single_flight.do('key', func) for _ in range(3)], return_exceptions=True)
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert 0 == len(single_flight)
+
+
+def test_async_single_flight__cancelled_leader__a_follower_performs_the_call():
+    single_flight = AsyncSingleFlight()
+    calls = []
+
+    async def func():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return 'result'
+
+    async def run():
+        leader = asyncio.ensure_future(single_flight.do('key', func))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(single_flight.do('key', func)) for _ in range(3)]
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+        return await asyncio.gather(*followers)
+
+    results = asyncio.run(run())
+
+    assert ['result'] * 3 == results
+    assert 2 == len(calls)
+    assert 0 == len(single_flight)
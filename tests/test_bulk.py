@@ -0,0 +1,87 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import threading
+import time
+
+import pytest
+
+from subscription_manager_client.bulk import run_bulk
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+def test_run_bulk__results_are_returned_in_input_order():
+    results = run_bulk(lambda x: x * 2, [3, 1, 2], max_workers=3)
+
+    assert [3, 1, 2] == [r.item for r in results]
+    assert [6, 2, 4] == [r.result for r in results]
+    assert all(r.ok for r in results)
+
+
+def test_run_bulk__errors_are_reported_per_item():
+    def func(x):
+        if x == 2:
+            raise ValueError('boom')
+        return x
+
+    results = run_bulk(func, [1, 2, 3])
+
+    assert [True, False, True] == [r.ok for r in results]
+    assert isinstance(results[1].error, ValueError)
+    assert results[1].result is None
+
+
+def test_run_bulk__concurrency_is_bounded():
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+
+    def func(x):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+
+    run_bulk(func, range(20), max_workers=4)
+
+    assert 4 == max_in_flight
+
+
+def test_run_bulk__no_items__returns_empty_list():
+    assert [] == run_bulk(lambda x: x, [])
+
+
+@pytest.mark.parametrize('max_workers', [0, -1])
+def test_run_bulk__invalid_max_workers__raises_valueerror(max_workers):
+    with pytest.raises(ValueError):
+        run_bulk(lambda x: x, [1], max_workers=max_workers)
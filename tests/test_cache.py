@@ -0,0 +1,157 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+from unittest.mock import Mock
+
+import pytest
+
+from subscription_manager_client.cache import TTLCache, ValidatedEntry, SQLiteCatalogCache
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_cache__entry_expires_after_ttl():
+    clock = FakeClock()
+    cache = TTLCache(ttl=10, clock=clock)
+
+    cache.set('key', 'value')
+    clock.now = 9.9
+    assert 'value' == cache.get('key')
+
+    clock.now = 10
+    assert cache.get('key') is None
+    assert 0 == len(cache)
+
+
+def test_ttl_cache__least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2)
+
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert 'c' in cache
+
+
+def test_ttl_cache__delete_ignores_missing_keys():
+    cache = TTLCache()
+    cache.set('a', 1)
+
+    cache.delete('a', 'missing')
+
+    assert 'a' not in cache
+
+
+@pytest.mark.parametrize('kwargs', [{'ttl': 0}, {'ttl': -1}, {'maxsize': 0}])
+def test_ttl_cache__invalid_arguments__raise_valueerror(kwargs):
+    with pytest.raises(ValueError):
+        TTLCache(**kwargs)
+
+
+def test_validated_entry__from_response_without_validators__returns_none():
+    response = Mock()
+    response.headers = {}
+
+    assert ValidatedEntry.from_response(response, []) is None
+
+
+def test_validated_entry__conditional_headers():
+    response = Mock()
+    response.headers = {'ETag': '"abc"', 'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+
+    entry = ValidatedEntry.from_response(response, [])
+
+    assert {
+        'If-None-Match': '"abc"',
+        'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT'
+    } == entry.conditional_headers()
+
+
+def test_sqlite_catalog_cache__entries_persist_across_instances(tmp_path):
+    path = str(tmp_path / 'catalog.db')
+    records = [{'id': 1, 'name': 'topic'}]
+
+    cache = SQLiteCatalogCache(path)
+    cache.set('topics', records, etag='"v1"')
+    cache.close()
+
+    entry = SQLiteCatalogCache(path).get('topics')
+
+    assert records == entry.value
+    assert {'If-None-Match': '"v1"'} == entry.conditional_headers()
+
+
+def test_sqlite_catalog_cache__staleness(tmp_path):
+    clock = FakeClock()
+    cache = SQLiteCatalogCache(str(tmp_path / 'catalog.db'), revalidate_after=10, clock=clock)
+
+    entry = cache.set('topics', [])
+    assert not cache.is_stale(entry)
+
+    clock.now += 10
+    assert cache.is_stale(entry)
+
+    cache.touch('topics')
+    assert not cache.is_stale(cache.get('topics'))
+
+
+def test_sqlite_catalog_cache__delete_and_clear(tmp_path):
+    cache = SQLiteCatalogCache(str(tmp_path / 'catalog.db'))
+    cache.set('topics', [])
+    cache.set('subscriptions', [])
+
+    cache.delete('topics', 'unknown')
+    assert cache.get('topics') is None
+    assert 1 == len(cache)
+
+    cache.clear()
+    assert 0 == len(cache)
+
+
+def test_sqlite_catalog_cache__clear_by_prefix(tmp_path):
+    cache = SQLiteCatalogCache(str(tmp_path / 'catalog.db'))
+    cache.set('https://host/|alice|topics/', [])
+    cache.set('https://host/|bob|topics/', [])
+
+    cache.clear(prefix='https://host/|alice|')
+
+    assert cache.get('https://host/|alice|topics/') is None
+    assert cache.get('https://host/|bob|topics/') is not None
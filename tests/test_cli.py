@@ -0,0 +1,149 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import io
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from subscription_manager_client import cli
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+def run(monkeypatch, client, *argv):
+    monkeypatch.setattr(cli, '_create_client', lambda args: client)
+    out = io.StringIO()
+
+    exit_code = cli.main(['--host', 'localhost'] + list(argv), out=out)
+
+    return exit_code, [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def make_model(object_dict):
+    model = Mock()
+    model.to_json = Mock(return_value=object_dict)
+
+    return model
+
+
+def test_parser__command_is_required():
+    with pytest.raises(SystemExit):
+        cli.build_parser().parse_args(['subscriptions'])
+
+
+def test_parser__create_requires_a_topic():
+    with pytest.raises(SystemExit):
+        cli.build_parser().parse_args(['subscriptions', 'create', '--qos', 'EXACTLY_ONCE'])
+
+
+def test_list_subscriptions__are_written_as_json_lines(monkeypatch):
+    client = Mock()
+    client.iter_subscriptions = Mock(return_value=iter([make_model({'id': 1}), make_model({'id': 2})]))
+
+    exit_code, lines = run(monkeypatch, client, 'subscriptions', 'list', '--queue', 'queue')
+
+    assert 0 == exit_code
+    assert [{'id': 1}, {'id': 2}] == lines
+    client.iter_subscriptions.assert_called_once_with(queue='queue')
+
+
+def test_pause__failures_are_reported_per_subscription(monkeypatch):
+    def put_subscription(subscription_id, update_data):
+        if subscription_id == 2:
+            raise ValueError('not found')
+        return make_model({'id': subscription_id, 'active': update_data['active']})
+
+    client = Mock()
+    client.put_subscription = Mock(side_effect=put_subscription)
+
+    exit_code, lines = run(monkeypatch, client, 'subscriptions', 'pause', '1', '2')
+
+    assert 1 == exit_code
+    assert [
+        {'op': 'pause', 'id': 1, 'ok': True, 'result': {'id': 1, 'active': False}},
+        {'op': 'pause', 'id': 2, 'ok': False, 'error': 'not found'},
+    ] == lines
+
+
+def test_bulk__operations_are_read_from_the_file(monkeypatch, tmp_path):
+    path = tmp_path / 'operations.jsonl'
+    path.write_text('{"op": "resume", "id": 1}\n\n{"op": "delete", "id": 2}\n{"op": "rename", "id": 3}\n')
+
+    client = Mock()
+    client.put_subscription = Mock(return_value=make_model({'id': 1, 'active': True}))
+
+    exit_code, lines = run(monkeypatch, client, 'subscriptions', 'bulk', str(path))
+
+    assert 1 == exit_code
+    assert [True, True, False] == [line['ok'] for line in lines]
+    client.put_subscription.assert_called_once_with(1, {'active': True})
+    client.delete_subscription_by_id.assert_called_once_with(2)
+
+
+def test_bulk__invalid_json__outcomes_of_the_previous_operations_are_written_before_exiting(monkeypatch, tmp_path):
+    path = tmp_path / 'operations.jsonl'
+    path.write_text('{"op": "delete", "id": 1}\n{"op": "delete", "id": 2}\n{"op": \n{"op": "delete", "id": 3}\n')
+
+    client = Mock()
+    monkeypatch.setattr(cli, '_create_client', lambda args: client)
+    out = io.StringIO()
+
+    with pytest.raises(SystemExit):
+        cli.main(['--host', 'localhost', 'subscriptions', 'bulk', str(path)], out=out)
+
+    assert [1, 2] == [json.loads(line)['id'] for line in out.getvalue().splitlines()]
+    assert 2 == client.delete_subscription_by_id.call_count
+
+
+def test_run_operations__reads_at_most_max_workers_operations_ahead():
+    out = io.StringIO()
+    written_before_reading = []
+
+    def operations():
+        for id in range(1, 5):
+            written_before_reading.append(len(out.getvalue().splitlines()))
+            yield {'op': 'delete', 'id': id}
+
+    exit_code = cli._run_operations(Mock(), operations(), max_workers=2, out=out)
+
+    assert 0 == exit_code
+    assert 4 == len(out.getvalue().splitlines())
+    assert all(written >= id - 2 for id, written in enumerate(written_before_reading, start=1))
+
+
+def test_main__error_without_message__class_name_is_reported(monkeypatch, capsys):
+    client = Mock()
+    client.iter_topics = Mock(side_effect=ConnectionError())
+
+    exit_code, _ = run(monkeypatch, client, 'topics', 'list')
+
+    assert 1 == exit_code
+    assert 'smc: ConnectionError\n' == capsys.readouterr().err
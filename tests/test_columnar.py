@@ -0,0 +1,133 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from subscription_manager_client.columnar import SubscriptionColumns, DictionaryColumn, NULL
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+def make_records():
+    return [
+        {'id': 1, 'queue': 'q1', 'active': True, 'durable': True, 'qos': 'AT_LEAST_ONCE',
+         'topic': {'id': 10, 'name': 'topic_a'}},
+        {'id': 2, 'queue': 'q2', 'active': False, 'durable': True, 'qos': 'EXACTLY_ONCE',
+         'topic': {'id': 10, 'name': 'topic_a'}},
+        {'id': 3, 'queue': 'q3', 'active': False, 'durable': False, 'qos': 'AT_LEAST_ONCE',
+         'topic': {'id': 20, 'name': 'topic_b'}},
+        {'id': 4, 'queue': 'q4', 'active': False, 'durable': True, 'qos': None,
+         'topic': {'id': 10, 'name': 'topic_a'}},
+    ]
+
+
+def test_dictionary_column__values_are_stored_once():
+    column = DictionaryColumn()
+    for value in ['a', 'b', 'a', None, 'a']:
+        column.append(value)
+
+    assert ['a', 'b'] == column.values
+    assert [0, 1, 0, NULL, 0] == list(column.codes)
+    assert [None, 'a'] == [column[3], column[4]]
+    assert column.code_of('c') is None
+
+
+def test_from_records():
+    columns = SubscriptionColumns.from_records(make_records())
+
+    assert 4 == len(columns)
+    assert [1, 2, 3, 4] == list(columns.id)
+    assert [10, 10, 20, 10] == list(columns.topic_id)
+    assert ['topic_a', 'topic_b'] == columns.topic_name.values
+    assert {'id': 4, 'topic_id': 10, 'active': False, 'durable': True, 'qos': None, 'queue': 'q4',
+            'topic_name': 'topic_a'} == columns.row(3)
+
+
+def test_from_subscriptions__is_equivalent_to_from_records():
+    subscriptions = [
+        SimpleNamespace(id=record['id'], queue=record['queue'], active=record['active'], durable=record['durable'],
+                        qos=record['qos'], topic_id=None, topic=SimpleNamespace(**record['topic']))
+        for record in make_records()
+    ]
+
+    from_models = SubscriptionColumns.from_subscriptions(subscriptions)
+    from_records = SubscriptionColumns.from_records(make_records())
+
+    assert [from_records.row(row) for row in range(4)] == [from_models.row(row) for row in range(4)]
+
+
+@pytest.mark.parametrize('criteria, expected_rows', [
+    ({'active': False, 'durable': True, 'topic_id': 10}, [1, 3]),
+    ({'topic_name': 'topic_b'}, [2]),
+    ({'qos': 'AT_LEAST_ONCE', 'active': True}, [0]),
+    ({'qos': None}, [3]),
+    ({'topic_name': 'unknown'}, []),
+    ({}, [0, 1, 2, 3]),
+])
+def test_where(criteria, expected_rows):
+    columns = SubscriptionColumns.from_records(make_records())
+
+    assert expected_rows == list(columns.where(**criteria))
+
+
+def test_where__unknown_column__raises_value_error():
+    with pytest.raises(ValueError):
+        SubscriptionColumns().where(name='topic')
+
+
+def test_take():
+    columns = SubscriptionColumns.from_records(make_records())
+
+    taken = columns.take(columns.where(active=False, durable=True))
+
+    assert [2, 4] == list(taken.id)
+    assert ['q2', 'q4'] == [taken.queue[0], taken.queue[1]]
+
+
+def test_to_numpy():
+    numpy = pytest.importorskip('numpy')
+    columns = SubscriptionColumns.from_records(make_records())
+
+    arrays = columns.to_numpy()
+
+    assert numpy.array_equal([1, 2, 3, 4], arrays['id'])
+    assert [True, False, False, False] == arrays['active'].astype(bool).tolist()
+    assert ['AT_LEAST_ONCE', 'EXACTLY_ONCE', 'AT_LEAST_ONCE', None] == arrays['qos'].tolist()
+
+
+def test_to_arrow():
+    pytest.importorskip('pyarrow')
+    columns = SubscriptionColumns.from_records(make_records())
+
+    table = columns.to_arrow()
+
+    assert 4 == table.num_rows
+    assert ['AT_LEAST_ONCE', 'EXACTLY_ONCE', 'AT_LEAST_ONCE', None] == table.column('qos').to_pylist()
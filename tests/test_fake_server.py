@@ -0,0 +1,135 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import json
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from subscription_manager_client.testing import FakeSubscriptionManager
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+BASE_URL = 'subscription-manager/api/1.0/'
+
+
+@pytest.fixture
+def fake():
+    with FakeSubscriptionManager(seed=0) as fake:
+        yield fake
+
+
+def request(fake, method, path, data=None):
+    body = json.dumps(data).encode() if data is not None else None
+    http_request = urllib.request.Request(fake.base_url + BASE_URL + path, data=body, method=method,
+                                          headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(http_request) as response:
+            content = response.read()
+            return response.status, json.loads(content) if content else None
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_fake_server__topics(fake):
+    fake.add_topic('not_own', own=False)
+
+    status, topic = request(fake, 'POST', 'topics/', {'name': 'topic'})
+    assert 201 == status
+    assert 'topic' == topic['name']
+
+    assert (200, topic) == request(fake, 'GET', f'topics/{topic["id"]}')
+    assert 2 == len(request(fake, 'GET', 'topics/')[1])
+    assert [topic] == request(fake, 'GET', 'topics/own')[1]
+    assert 409 == request(fake, 'POST', 'topics/', {'name': 'topic'})[0]
+
+    assert (204, None) == request(fake, 'DELETE', f'topics/{topic["id"]}')
+    assert 404 == request(fake, 'GET', f'topics/{topic["id"]}')[0]
+
+
+def test_fake_server__subscriptions(fake):
+    topic = fake.add_topic('topic')
+
+    status, subscription = request(fake, 'POST', 'subscriptions/',
+                                   {'topic_id': topic['id'], 'qos': 'EXACTLY_ONCE', 'durable': True})
+    assert 201 == status
+    assert topic == subscription['topic']
+    assert subscription['active'] is True
+
+    fake.add_subscription(topic['id'])
+
+    assert 2 == len(request(fake, 'GET', 'subscriptions/')[1])
+    assert [subscription] == request(fake, 'GET', f'subscriptions/?queue={subscription["queue"]}')[1]
+
+    status, updated_subscription = request(fake, 'PUT', f'subscriptions/{subscription["id"]}', {'active': False})
+    assert 200 == status
+    assert updated_subscription['active'] is False
+
+    assert (204, None) == request(fake, 'DELETE', f'subscriptions/{subscription["id"]}')
+    assert 404 == request(fake, 'GET', f'subscriptions/{subscription["id"]}')[0]
+
+
+@pytest.mark.parametrize('data', [{'topic_id': 100}, {'topic_id': 1, 'qos': 'invalid'}])
+def test_fake_server__post_invalid_subscription(fake, data):
+    fake.add_topic('topic')
+
+    assert request(fake, 'POST', 'subscriptions/', data)[0] in (400, 404)
+
+
+def test_fake_server__deleting_a_topic_deletes_its_subscriptions(fake):
+    fake.populate(topics_count=2, subscriptions_per_topic=3)
+
+    request(fake, 'DELETE', 'topics/1')
+
+    assert 3 == len(fake.subscriptions)
+
+
+def test_fake_server__ping_credentials(fake):
+    assert (200, None) == request(fake, 'GET', 'ping-credentials')
+
+
+def test_fake_server__injected_errors():
+    with FakeSubscriptionManager(error_rate=1, error_status=503) as fake:
+        assert 503 == request(fake, 'GET', 'topics/')[0]
+
+
+def test_fake_server__injected_latency():
+    with FakeSubscriptionManager(latency=0.05) as fake:
+        start = time.monotonic()
+        request(fake, 'GET', 'topics/')
+
+        assert time.monotonic() - start >= 0.05
+
+
+def test_fake_server__invalid_error_rate__raises_valueerror():
+    with pytest.raises(ValueError):
+        FakeSubscriptionManager(error_rate=2)
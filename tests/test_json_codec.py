@@ -0,0 +1,101 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+from unittest.mock import Mock
+
+import pytest
+
+from subscription_manager_client.json_codec import JSONCodec, OrjsonCodec, UjsonCodec, CodecRequestHandler, \
+    get_codec
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+def available_codecs():
+    codecs = [JSONCodec()]
+    for codec_class in (OrjsonCodec, UjsonCodec):
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            pass
+
+    return codecs
+
+
+@pytest.mark.parametrize('codec', available_codecs(), ids=lambda codec: codec.name)
+def test_codec__round_trip(codec):
+    obj = [{'id': 1, 'name': 'topic ä', 'active': True, 'qos': None}]
+
+    data = codec.dumps(obj)
+
+    assert isinstance(data, bytes)
+    assert obj == codec.loads(data)
+    assert obj == codec.loads(data.decode('utf-8'))
+
+
+def test_get_codec__unknown_name__raises_value_error():
+    with pytest.raises(ValueError):
+        get_codec('simplejson')
+
+
+def test_get_codec__by_name():
+    assert isinstance(get_codec('json'), JSONCodec)
+
+
+def test_get_codec__picks_an_available_codec():
+    assert get_codec().name in [codec.name for codec in available_codecs()]
+
+
+def test_codec_request_handler__body_is_encoded_and_response_decoded_by_the_codec():
+    response = Mock()
+    response.status_code = 201
+    response.content = b'{"id":1}'
+
+    request_handler = Mock()
+    request_handler.post = Mock(return_value=response)
+
+    handler = CodecRequestHandler(request_handler, JSONCodec())
+
+    codec_response = handler.post('url', params={}, json={'name': 'topic'})
+
+    assert 201 == codec_response.status_code
+    assert {'id': 1} == codec_response.json()
+    request_handler.post.assert_called_once_with('url', params={}, data=b'{"name":"topic"}',
+                                                 headers={'Content-Type': 'application/json'})
+
+
+def test_codec_request_handler__streamed_responses_are_not_wrapped():
+    response = Mock()
+
+    request_handler = Mock()
+    request_handler.get = Mock(return_value=response)
+
+    handler = CodecRequestHandler(request_handler, JSONCodec())
+
+    assert response is handler.get('url', params={}, stream=True)
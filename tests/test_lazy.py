@@ -0,0 +1,110 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+from unittest.mock import Mock
+
+import pytest
+
+from subscription_manager_client.lazy import LazySubscriptionList, LazyTopicList, RawRecord
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+class CountingDecoder:
+
+    def __init__(self):
+        self.calls = 0
+
+    def from_json(self, object_dict):
+        self.calls += 1
+        return ('model', object_dict['id'])
+
+
+def make_records(count=5):
+    return [{'id': index, 'queue': f'queue_{index}', 'active': index % 2 == 0,
+             'topic': {'id': index % 2, 'name': f'topic_{index % 2}'}}
+            for index in range(count)]
+
+
+def test_raw_record__returns_the_record_as_is():
+    record = {'id': 1}
+
+    assert record is RawRecord.from_json(record)
+
+
+def test_len__no_model_is_built():
+    decoder = CountingDecoder()
+
+    subscriptions = LazySubscriptionList(make_records(), response_class=decoder)
+
+    assert 5 == len(subscriptions)
+    assert 0 == decoder.calls
+
+
+def test_getitem__models_are_built_once():
+    decoder = CountingDecoder()
+    subscriptions = LazySubscriptionList(make_records(), response_class=decoder)
+
+    assert ('model', 4) == subscriptions[-1]
+    assert ('model', 4) == subscriptions[4]
+    assert 1 == decoder.calls
+
+    with pytest.raises(IndexError):
+        subscriptions[5]
+
+
+def test_slice__is_lazy_and_keeps_the_built_models():
+    decoder = CountingDecoder()
+    subscriptions = LazySubscriptionList(make_records(), response_class=decoder)
+    subscriptions[1]
+
+    sliced = subscriptions[1:4]
+
+    assert isinstance(sliced, LazySubscriptionList)
+    assert 3 == len(sliced)
+    assert 1 == decoder.calls
+    assert [('model', 1), ('model', 2), ('model', 3)] == list(sliced)
+    assert 3 == decoder.calls
+
+
+def test_filter__by_queue_and_topic_id():
+    decoder = CountingDecoder()
+    subscriptions = LazySubscriptionList(make_records(), response_class=decoder)
+
+    assert [('model', 3)] == subscriptions.filter(queue='queue_3')
+    assert [('model', 1), ('model', 3)] == subscriptions.filter(topic_id=1)
+    assert [] == subscriptions.filter(topic_id=1, active=True)
+    assert 3 == decoder.calls
+
+
+def test_filter__unknown_field__raises_value_error():
+    topics = LazyTopicList([{'id': 1, 'name': 'topic'}], response_class=Mock())
+
+    with pytest.raises(ValueError):
+        topics.filter(queue='queue')
@@ -0,0 +1,137 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import pytest
+
+from subscription_manager_client.metrics import Counter, Gauge, Histogram, MetricsRegistry, ClientMetrics, \
+    error_label
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+class HTTPError(Exception):
+
+    def __init__(self, status_code):
+        super().__init__(status_code)
+        self.status_code = status_code
+
+
+class FakeClock:
+
+    def __init__(self, times):
+        self._times = iter(times)
+
+    def __call__(self):
+        return next(self._times)
+
+
+def test_counter__labels_are_validated():
+    counter = Counter('requests_total', 'Requests.', ('endpoint',))
+
+    with pytest.raises(ValueError):
+        counter.inc(queue='q')
+
+
+def test_counter__cannot_be_decreased():
+    counter = Counter('requests_total', 'Requests.')
+
+    with pytest.raises(ValueError):
+        counter.inc(-1)
+
+
+def test_gauge__can_go_up_and_down():
+    gauge = Gauge('in_flight', 'In flight.', ('endpoint',))
+
+    gauge.inc(endpoint='a')
+    gauge.inc(endpoint='a')
+    gauge.dec(endpoint='a')
+
+    assert 1 == gauge.value(endpoint='a')
+    assert 0 == gauge.value(endpoint='b')
+
+
+def test_histogram__render():
+    histogram = Histogram('latency_seconds', 'Latency.', ('endpoint',), buckets=(0.1, 1))
+
+    histogram.observe(0.05, endpoint='get')
+    histogram.observe(0.1, endpoint='get')
+    histogram.observe(0.5, endpoint='get')
+    histogram.observe(2, endpoint='get')
+
+    assert 4 == histogram.count(endpoint='get')
+    assert '# HELP latency_seconds Latency.\n' \
+           '# TYPE latency_seconds histogram\n' \
+           'latency_seconds_bucket{endpoint="get",le="0.1"} 2\n' \
+           'latency_seconds_bucket{endpoint="get",le="1.0"} 3\n' \
+           'latency_seconds_bucket{endpoint="get",le="+Inf"} 4\n' \
+           'latency_seconds_sum{endpoint="get"} 2.65\n' \
+           'latency_seconds_count{endpoint="get"} 4\n' == histogram.render()
+
+
+def test_registry__label_values_are_escaped():
+    registry = MetricsRegistry()
+    counter = registry.register(Counter('errors_total', 'Errors.', ('reason',)))
+
+    counter.inc(reason='say "hi"\n')
+
+    assert 'errors_total{reason="say \\"hi\\"\\n"} 1' in registry.render()
+
+
+def test_registry__names_are_unique():
+    registry = MetricsRegistry()
+    registry.register(Counter('requests_total', 'Requests.'))
+
+    with pytest.raises(ValueError):
+        registry.register(Counter('requests_total', 'Requests.'))
+
+
+@pytest.mark.parametrize('error, expected_label', [
+    (HTTPError(503), '503'),
+    (ConnectionError(), 'ConnectionError'),
+])
+def test_error_label(error, expected_label):
+    assert expected_label == error_label(error)
+
+
+def test_client_metrics__track():
+    metrics = ClientMetrics(clock=FakeClock([0.0, 0.2, 1.0, 1.5]))
+
+    with metrics.track('get_topics'):
+        assert 1 == metrics.in_flight.value(endpoint='get_topics')
+
+    with pytest.raises(ConnectionError):
+        with metrics.track('get_topics'):
+            raise ConnectionError()
+
+    assert 2 == metrics.requests.value(endpoint='get_topics')
+    assert 1 == metrics.errors.value(endpoint='get_topics', status='ConnectionError')
+    assert 0 == metrics.in_flight.value(endpoint='get_topics')
+    assert 2 == metrics.latency.count(endpoint='get_topics')
+    assert 0.7 == pytest.approx(metrics.latency.sum(endpoint='get_topics'))
+    assert 'subscription_manager_client_requests_total{endpoint="get_topics"} 2' in metrics.render()
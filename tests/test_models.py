@@ -29,7 +29,8 @@ Details on EUROCONTROL: http://www.eurocontrol.int
 """
 import pytest
 
-from subscription_manager_client.models import Topic, Subscription, QOS
+from subscription_manager_client.models import Topic, Subscription, QOS, CompactTopic, CompactSubscription, \
+    TopicInterner
 
 __author__ = "EUROCONTROL (SWIM)"
 
@@ -131,3 +132,137 @@ def test_subscription__invalid_qos__raises_valueerror(qos):
     with pytest.raises(ValueError) as e:
         subscription.qos = qos
     assert f'qos should be one of {QOS.all()}' == str(e.value)
+
+
+def test_compact_topic__json_round_trip():
+    topic_dict = {'name': 'topic', 'id': 1}
+
+    topic = CompactTopic.from_json(topic_dict)
+
+    assert CompactTopic(name='topic', id=1) == topic
+    assert topic_dict == topic.to_json()
+    assert not hasattr(topic, '__dict__')
+
+
+def test_compact_subscription__json_round_trip():
+    subscription_dict = {
+        'queue': 'queue name',
+        'topic': {
+            'name': 'topic',
+            'id': 1
+        },
+        'active': True,
+        'qos': 'EXACTLY_ONCE',
+        'durable': True,
+        'id': 1
+    }
+
+    subscription = CompactSubscription.from_json(subscription_dict)
+
+    assert CompactSubscription(
+        queue='queue name',
+        topic=CompactTopic(name='topic', id=1),
+        active=True,
+        qos=QOS.EXACTLY_ONCE.value,
+        durable=True,
+        id=1
+    ) == subscription
+    assert subscription_dict == subscription.to_json()
+    assert not hasattr(subscription, '__dict__')
+
+
+def test_compact_subscription__model_round_trip():
+    subscription = Subscription(queue='queue', topic_id=1, topic=Topic(name='topic', id=1), active=False,
+                                qos=QOS.AT_MOST_ONCE.value, durable=False, id=2)
+
+    compact_subscription = CompactSubscription.from_model(subscription)
+
+    assert subscription.to_json() == compact_subscription.to_json()
+    assert subscription == compact_subscription.to_model()
+
+
+@pytest.mark.parametrize('qos', ['invalid', 1, '', True])
+def test_compact_subscription__invalid_qos__raises_valueerror(qos):
+    subscription = CompactSubscription(queue='queue')
+
+    with pytest.raises(ValueError) as e:
+        subscription.qos = qos
+    assert f'qos should be one of {QOS.all()}' == str(e.value)
+
+
+def test_subscription__from_json_with_topic_interner__topics_are_shared():
+    topic_interner = TopicInterner()
+    subscription_dicts = [
+        {'queue': f'queue_{i}', 'topic': {'name': 'topic', 'id': 1}, 'active': True, 'qos': 'EXACTLY_ONCE',
+         'durable': True, 'id': i}
+        for i in range(3)
+    ]
+
+    subscriptions = [Subscription.from_json(d, topic_interner=topic_interner) for d in subscription_dicts]
+
+    assert Topic(name='topic', id=1) == subscriptions[0].topic
+    assert subscriptions[0].topic is subscriptions[1].topic is subscriptions[2].topic
+    assert 1 == len(topic_interner)
+
+
+def test_topic_interner__least_recently_used_topic_is_dropped():
+    topic_interner = TopicInterner(maxsize=2)
+
+    topic_1 = topic_interner.intern({'name': 'topic_1', 'id': 1})
+    topic_interner.intern({'name': 'topic_2', 'id': 2})
+    topic_interner.intern({'name': 'topic_1', 'id': 1})
+    topic_interner.intern({'name': 'topic_3', 'id': 3})
+
+    assert 2 == len(topic_interner)
+    assert topic_1 is topic_interner.intern({'name': 'topic_1', 'id': 1})
+
+
+def test_topic_interner__topic_class():
+    topic_interner = TopicInterner(topic_class=CompactTopic)
+
+    assert CompactTopic(name='topic', id=1) == topic_interner.intern({'name': 'topic', 'id': 1})
+
+
+@pytest.mark.parametrize('subscription_dict', [
+    {
+        'queue': 'queue name',
+        'topic': {
+            'name': 'topic',
+            'id': 1
+        },
+        'active': True,
+        'qos': 'EXACTLY_ONCE',
+        'durable': True,
+        'id': 1
+    }
+])
+def test_subscription__from_json__trusted_and_validated_paths_are_equal(subscription_dict):
+    subscription = Subscription.from_json(subscription_dict, trusted=True)
+
+    assert Subscription.from_json(subscription_dict) == subscription
+    assert subscription_dict == subscription.to_json()
+
+
+def test_subscription__from_json__trusted_with_topic_interner():
+    topic_interner = TopicInterner()
+    subscription_dict = {'queue': 'queue', 'topic': {'name': 'topic', 'id': 1}, 'active': True,
+                         'qos': 'EXACTLY_ONCE', 'durable': True, 'id': 1}
+
+    subscription_1 = Subscription.from_json(subscription_dict, topic_interner=topic_interner, trusted=True)
+    subscription_2 = Subscription.from_json(subscription_dict, topic_interner=topic_interner, trusted=True)
+
+    assert subscription_1.topic is subscription_2.topic
+
+
+def test_topic__from_json__trusted():
+    assert Topic(name='topic', id=1) == Topic.from_json({'name': 'topic', 'id': 1}, trusted=True)
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('EXACTLY_ONCE', True),
+    ('invalid', False),
+    (1, False),
+    ([], False),
+])
+def test_qos__is_valid(value, expected):
+    assert expected == QOS.is_valid(value)
@@ -0,0 +1,85 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import threading
+
+import pytest
+
+from subscription_manager_client.pagination import iter_pages
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+def make_fetch_page(items, limit):
+    requested_pages = []
+
+    def fetch_page(page):
+        requested_pages.append(page)
+        return items[(page - 1) * limit: page * limit]
+
+    return fetch_page, requested_pages
+
+
+@pytest.mark.parametrize('total, limit, expected_requested_pages', [
+    (0, 10, [1]),
+    (5, 10, [1]),
+    (10, 10, [1, 2]),
+    (25, 10, [1, 2, 3]),
+])
+def test_iter_pages__all_items_are_yielded(total, limit, expected_requested_pages):
+    items = list(range(total))
+    fetch_page, requested_pages = make_fetch_page(items, limit)
+
+    assert items == list(iter_pages(fetch_page, limit=limit))
+    assert expected_requested_pages == requested_pages
+
+
+def test_iter_pages__next_page_is_fetched_while_current_is_consumed():
+    second_page_requested = threading.Event()
+
+    def fetch_page(page):
+        if page == 2:
+            second_page_requested.set()
+            return []
+        return [1, 2]
+
+    pages = iter_pages(fetch_page, limit=2)
+    next(pages)
+
+    assert second_page_requested.wait(timeout=1)
+
+
+@pytest.mark.parametrize('items', [[1, 2, 3], [1, 2]])
+def test_iter_pages__server_without_pagination__items_are_yielded_once(items):
+    assert items == list(iter_pages(lambda page: items, limit=2))
+
+
+def test_iter_pages__invalid_limit__raises_valueerror():
+    with pytest.raises(ValueError):
+        list(iter_pages(lambda page: [], limit=0))
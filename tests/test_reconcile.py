@@ -0,0 +1,136 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+from subscription_manager_client.models import Subscription, Topic
+from subscription_manager_client.reconcile import plan, CREATE, UPDATE, DELETE
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+def make_current(id, topic_id, active=True, qos='AT_LEAST_ONCE', durable=False):
+    return Subscription(queue=f'queue_{id}', topic=Topic(name=f'topic_{topic_id}', id=topic_id), active=active,
+                        qos=qos, durable=durable, id=id)
+
+
+def test_plan__matching_subscriptions_are_unchanged():
+    current = [make_current(1, topic_id=1), make_current(2, topic_id=2)]
+    desired = [Subscription(topic_id=2), Subscription(topic_id=1, qos='AT_LEAST_ONCE', active=True)]
+
+    actions, unchanged = plan(current, desired)
+
+    assert [] == actions
+    assert [current[1], current[0]] == unchanged
+
+
+def test_plan__active_flag_differences_are_updated():
+    current = [make_current(1, topic_id=1, active=True)]
+
+    actions, unchanged = plan(current, [Subscription(topic_id=1, active=False)])
+
+    [(action, subscription)] = actions
+    assert UPDATE == action
+    assert 1 == subscription.id
+    assert subscription.active is False
+    assert [] == unchanged
+
+
+def test_plan__missing_subscriptions_are_created_and_unmatched_ones_deleted():
+    current = [make_current(1, topic_id=1), make_current(2, topic_id=2)]
+    new_subscription = Subscription(topic_id=3)
+
+    actions, _ = plan(current, [Subscription(topic_id=1), new_subscription])
+
+    assert [(CREATE, new_subscription), (DELETE, current[1])] == actions
+
+
+def test_plan__delete_unmatched_is_false__nothing_is_deleted():
+    actions, _ = plan([make_current(1, topic_id=1)], [], delete_unmatched=False)
+
+    assert [] == actions
+
+
+def test_plan__qos_difference__subscription_is_recreated():
+    current = [make_current(1, topic_id=1, qos='AT_LEAST_ONCE')]
+    desired_subscription = Subscription(topic_id=1, qos='EXACTLY_ONCE')
+
+    actions, _ = plan(current, [desired_subscription])
+
+    assert [(CREATE, desired_subscription), (DELETE, current[0])] == actions
+
+
+def test_plan__subscription_is_matched_once():
+    current = [make_current(1, topic_id=1)]
+    second_subscription = Subscription(topic_id=1)
+
+    actions, unchanged = plan(current, [Subscription(topic_id=1), second_subscription])
+
+    assert [(CREATE, second_subscription)] == actions
+    assert current == unchanged
+
+
+def test_plan__matching_by_queue():
+    current = [make_current(1, topic_id=1), make_current(2, topic_id=1)]
+
+    actions, unchanged = plan(current, [Subscription(queue='queue_2', topic_id=1)])
+
+    assert [(DELETE, current[0])] == actions
+    assert [current[1]] == unchanged
+
+
+def test_plan__queue_with_a_different_qos__subscription_is_replaced_even_without_delete_unmatched():
+    current = [make_current(1, topic_id=1, qos='AT_LEAST_ONCE')]
+
+    actions, unchanged = plan(current, [Subscription(queue='queue_1', topic_id=1, qos='EXACTLY_ONCE')],
+                              delete_unmatched=False)
+
+    [(first_action, deleted_subscription), (second_action, created_subscription)] = actions
+    assert [DELETE, CREATE] == [first_action, second_action]
+    assert current[0] is deleted_subscription
+    assert created_subscription.queue is None
+    assert 1 == created_subscription.topic_id
+    assert 'EXACTLY_ONCE' == created_subscription.qos
+    assert [] == unchanged
+
+
+def test_plan__unknown_queue__subscription_is_matched_by_its_attributes():
+    current = [make_current(1, topic_id=1)]
+
+    actions, unchanged = plan(current, [Subscription(queue='unknown_queue', topic_id=1, qos='AT_LEAST_ONCE')])
+
+    assert [] == actions
+    assert current == unchanged
+
+
+def test_plan__queue_of_a_current_subscription__it_is_not_matched_by_the_attributes_of_another_one():
+    current = [make_current(1, topic_id=1), make_current(2, topic_id=1)]
+
+    actions, unchanged = plan(current, [Subscription(topic_id=1), Subscription(queue='queue_1', topic_id=1)])
+
+    assert [] == actions
+    assert [current[1], current[0]] == unchanged
@@ -0,0 +1,238 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+from unittest.mock import Mock
+
+import pytest
+from rest_client.errors import APIError
+
+from subscription_manager_client.resilience import RetryPolicy, CircuitBreaker, ResiliencePolicy, \
+    CircuitOpenError, is_transient_error
+from subscription_manager_client.subscription_manager import SubscriptionManagerClient
+from subscription_manager_client.utils import raise_for_status
+from tests.utils import make_topic_list
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_api_error(status_code):
+    response = Mock()
+    response.status_code = status_code
+    response.json = Mock(return_value={'detail': 'error'})
+
+    try:
+        raise_for_status(response)
+    except APIError as e:
+        return e
+
+
+def failing(*errors, result='result'):
+    return Mock(side_effect=list(errors) + [result])
+
+
+@pytest.mark.parametrize('error, expected', [
+    (make_api_error(500), True),
+    (make_api_error(503), True),
+    (make_api_error(404), False),
+    (ConnectionError(), True),
+    (TimeoutError(), True),
+    (ValueError(), False),
+])
+def test_is_transient_error(error, expected):
+    assert expected == is_transient_error(error)
+
+
+def test_retry_policy__backoff_is_exponential_and_bounded():
+    retry = RetryPolicy(backoff_base=1, backoff_max=5, jitter=False)
+
+    assert [1, 2, 4, 5, 5] == [retry.backoff(n) for n in range(1, 6)]
+
+
+def test_retry_policy__jitter_picks_a_delay_up_to_the_backoff():
+    random_uniform = Mock(return_value=0.3)
+    retry = RetryPolicy(backoff_base=1, random_uniform=random_uniform)
+
+    assert 0.3 == retry.backoff(3)
+    random_uniform.assert_called_once_with(0, 4)
+
+
+def test_resilience_policy__transient_errors_of_idempotent_requests_are_retried():
+    sleep = Mock()
+    policy = ResiliencePolicy(retry=RetryPolicy(max_attempts=3, jitter=False, sleep=sleep))
+    func = failing(make_api_error(503), ConnectionError())
+
+    assert 'result' == policy.call('GET', func)
+    assert 3 == func.call_count
+    assert 2 == sleep.call_count
+
+
+def test_resilience_policy__retries_are_bounded():
+    policy = ResiliencePolicy(retry=RetryPolicy(max_attempts=2, sleep=Mock()))
+    func = failing(make_api_error(500), make_api_error(500))
+
+    with pytest.raises(APIError):
+        policy.call('GET', func)
+    assert 2 == func.call_count
+
+
+@pytest.mark.parametrize('method, error', [
+    ('POST', make_api_error(500)),
+    ('GET', make_api_error(400)),
+])
+def test_resilience_policy__non_idempotent_requests_or_client_errors_are_not_retried(method, error):
+    policy = ResiliencePolicy(retry=RetryPolicy(sleep=Mock()))
+    func = failing(error)
+
+    with pytest.raises(APIError):
+        policy.call(method, func)
+    assert 1 == func.call_count
+
+
+def test_circuit_breaker__opens_after_consecutive_failures_and_fails_fast():
+    clock = FakeClock()
+    policy = ResiliencePolicy(circuit_breaker=CircuitBreaker(failure_threshold=2, recovery_timeout=10, clock=clock))
+    func = Mock(side_effect=ConnectionError())
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            policy.call('GET', func)
+
+    with pytest.raises(CircuitOpenError):
+        policy.call('GET', func)
+    assert 2 == func.call_count
+    assert CircuitBreaker.OPEN == policy.circuit_breaker.state
+
+
+def test_circuit_breaker__closes_when_the_probe_succeeds_after_the_recovery_timeout():
+    clock = FakeClock()
+    circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, clock=clock)
+    policy = ResiliencePolicy(circuit_breaker=circuit_breaker)
+    probe = Mock()
+
+    with pytest.raises(ConnectionError):
+        policy.call('GET', Mock(side_effect=ConnectionError()), probe=probe)
+
+    clock.now = 10
+    assert 'result' == policy.call('GET', Mock(return_value='result'), probe=probe)
+    probe.assert_called_once()
+    assert CircuitBreaker.CLOSED == circuit_breaker.state
+
+
+def test_circuit_breaker__reopens_when_the_probe_fails():
+    clock = FakeClock()
+    circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, clock=clock)
+    policy = ResiliencePolicy(circuit_breaker=circuit_breaker)
+    func = Mock(return_value='result')
+
+    with pytest.raises(ConnectionError):
+        policy.call('GET', Mock(side_effect=ConnectionError()))
+
+    clock.now = 10
+    with pytest.raises(CircuitOpenError):
+        policy.call('GET', func, probe=Mock(side_effect=ConnectionError()))
+
+    func.assert_not_called()
+    assert CircuitBreaker.OPEN == circuit_breaker.state
+
+
+def test_circuit_breaker__client_errors_do_not_open_the_circuit():
+    circuit_breaker = CircuitBreaker(failure_threshold=1)
+    policy = ResiliencePolicy(circuit_breaker=circuit_breaker)
+
+    with pytest.raises(APIError):
+        policy.call('GET', Mock(side_effect=make_api_error(404)))
+
+    assert CircuitBreaker.CLOSED == circuit_breaker.state
+
+
+def test_circuit_breaker__client_errors_reset_the_consecutive_failures():
+    circuit_breaker = CircuitBreaker(failure_threshold=2)
+    policy = ResiliencePolicy(circuit_breaker=circuit_breaker)
+
+    for error in [ConnectionError(), make_api_error(404), ConnectionError()]:
+        with pytest.raises(type(error)):
+            policy.call('GET', Mock(side_effect=error))
+
+    assert CircuitBreaker.CLOSED == circuit_breaker.state
+
+
+def test_subscription_manager_client__with_resilience__server_errors_are_retried():
+    topic_dict_list, expected_topic_list = make_topic_list()
+
+    error_response = Mock()
+    error_response.status_code = 503
+
+    response = Mock()
+    response.status_code = 200
+    response.content = topic_dict_list
+    response.json = Mock(return_value=topic_dict_list)
+
+    request_handler = Mock()
+    request_handler.get = Mock(side_effect=[error_response, response])
+
+    client = SubscriptionManagerClient(request_handler=request_handler,
+                                       resilience=ResiliencePolicy(retry=RetryPolicy(sleep=Mock())))
+
+    assert expected_topic_list == client.get_topics()
+    assert 2 == request_handler.get.call_count
+
+
+def test_subscription_manager_client__with_open_circuit__ping_credentials_is_used_as_probe():
+    clock = FakeClock()
+
+    error_response = Mock()
+    error_response.status_code = 503
+
+    request_handler = Mock()
+    request_handler.get = Mock(return_value=error_response)
+
+    client = SubscriptionManagerClient(
+        request_handler=request_handler,
+        resilience=ResiliencePolicy(circuit_breaker=CircuitBreaker(failure_threshold=1, recovery_timeout=10,
+                                                                   clock=clock))
+    )
+
+    with pytest.raises(APIError):
+        client.get_topics()
+
+    clock.now = 10
+    with pytest.raises(CircuitOpenError):
+        client.get_topics()
+
+    called_urls = [call[0][0] for call in request_handler.get.call_args_list]
+    assert ['subscription-manager/api/1.0/topics/', 'subscription-manager/api/1.0/ping-credentials'] == called_urls
@@ -0,0 +1,109 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import pytest
+
+from subscription_manager_client.serializers import ModelSerializer, Field
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+class Child:
+
+    def __init__(self, name=None):
+        self.name = name
+
+    def to_json(self):
+        return {'name': self.name}
+
+
+class Parent:
+
+    def __init__(self, key=None, value=None, child=None, ignored=None):
+        self.key = key
+        self._value = value
+        self.child = child
+        self.ignored = ignored
+
+
+CHILD_SERIALIZER = ModelSerializer(Child, [Field('name', omit_none=False)])
+PARENT_SERIALIZER = ModelSerializer(Parent, [
+    Field('key', required=True),
+    Field('value', attr='_value'),
+    Field('child', nested=CHILD_SERIALIZER),
+    Field('ignored', load=False),
+])
+
+
+def test_model_serializer__dump():
+    parent = Parent(key='key', value=1, child=Child(name='child'), ignored='ignored')
+
+    assert {
+        'key': 'key',
+        'value': 1,
+        'child': {'name': 'child'},
+        'ignored': 'ignored'
+    } == PARENT_SERIALIZER.dump(parent)
+
+
+def test_model_serializer__dump__none_values_are_omitted_unless_configured_otherwise():
+    assert {'key': 'key'} == PARENT_SERIALIZER.dump(Parent(key='key'))
+    assert {'name': None} == CHILD_SERIALIZER.dump(Child())
+
+
+def test_model_serializer__load_trusted():
+    parent = PARENT_SERIALIZER.load_trusted({'key': 'key', 'value': 1, 'child': {'name': 'child'},
+                                             'ignored': 'ignored'})
+
+    assert isinstance(parent, Parent)
+    assert 'key' == parent.key
+    assert 1 == parent._value
+    assert isinstance(parent.child, Child)
+    assert 'child' == parent.child.name
+    assert parent.ignored is None
+
+
+def test_model_serializer__load_trusted__missing_optional_keys_are_set_to_none():
+    parent = PARENT_SERIALIZER.from_json({'key': 'key'})
+
+    assert parent._value is None
+    assert parent.child is None
+
+
+def test_model_serializer__load_trusted__missing_required_key__raises_keyerror():
+    with pytest.raises(KeyError):
+        PARENT_SERIALIZER.load_trusted({})
+
+
+def test_model_serializer__load_trusted__nested_loader_can_be_overridden():
+    child = Child(name='shared')
+
+    parent = PARENT_SERIALIZER.load_trusted({'key': 'key', 'child': {'name': 'child'}}, child=lambda _: child)
+
+    assert child is parent.child
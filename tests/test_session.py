@@ -0,0 +1,91 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import socket
+from unittest.mock import patch
+
+import requests
+
+from subscription_manager_client.session import create_session, keepalive_socket_options, PooledHTTPAdapter
+from subscription_manager_client.subscription_manager import SubscriptionManagerClient
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+def test_create_session__pool_is_sized():
+    session = create_session('localhost:8080', pool_connections=2, pool_maxsize=50, pool_block=True)
+
+    adapter = session.get_adapter('https://localhost:8080/')
+
+    assert isinstance(adapter, PooledHTTPAdapter)
+    assert 50 == adapter._pool_maxsize
+    assert 2 == adapter._pool_connections
+    assert adapter._pool_block is True
+    assert 50 == adapter.poolmanager.connection_pool_kw['maxsize']
+
+
+def test_create_session__keepalive_socket_options_are_applied():
+    session = create_session('localhost:8080', keepalive=True)
+
+    socket_options = session.get_adapter('https://localhost:8080/').poolmanager.connection_pool_kw['socket_options']
+
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+
+
+def test_create_session__without_keepalive__default_socket_options_are_kept():
+    session = create_session('localhost:8080', keepalive=False)
+
+    assert 'socket_options' not in session.get_adapter('https://localhost:8080/').poolmanager.connection_pool_kw
+
+
+def test_create_session__authentication_and_verification():
+    session = create_session('localhost:8080', verify='/path/to/ca', username='user', password='pass')
+
+    assert ('user', 'pass') == session.auth
+    assert '/path/to/ca' == session.verify
+
+
+def test_pooled_session__url_is_prefixed_with_host_and_default_timeout_is_applied():
+    session = create_session('localhost:8080', https=False, timeout=5)
+
+    with patch.object(requests.Session, 'request') as request:
+        session.get('subscription-manager/api/1.0/topics/')
+
+    assert ('GET', 'http://localhost:8080/subscription-manager/api/1.0/topics/') == request.call_args[0]
+    assert 5 == request.call_args[1]['timeout']
+
+
+def test_keepalive_socket_options__keepalive_is_enabled():
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in keepalive_socket_options()
+
+
+def test_subscription_manager_client__create_pooled():
+    client = SubscriptionManagerClient.create_pooled('localhost:8080', pool_maxsize=20)
+
+    assert 20 == client._request_handler.get_adapter('https://localhost:8080/')._pool_maxsize
@@ -0,0 +1,78 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from subscription_manager_client.singleflight import SingleFlight, request_key
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+def test_request_key__params_order_does_not_matter():
+    assert request_key('GET', 'url', {'a': 1, 'b': 2}) == request_key('GET', 'url', {'b': 2, 'a': 1})
+    assert request_key('GET', 'url', {'a': 1}) != request_key('GET', 'url', {'a': 2})
+    assert request_key('GET', 'url') == request_key('GET', 'url', {})
+
+
+def test_single_flight__concurrent_calls_are_coalesced():
+    single_flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def func():
+        calls.append(1)
+        release.wait(timeout=1)
+        return ['result']
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        futures = [executor.submit(single_flight.do, 'key', func) for _ in range(10)]
+        while len(single_flight) == 0:
+            pass
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert 1 <= len(calls) < 10
+    assert all(result == ['result'] for result in results)
+    assert 0 == len(single_flight)
+
+
+def test_single_flight__error_is_shared_and_key_is_released():
+    single_flight = SingleFlight()
+
+    def func():
+        raise ValueError('boom')
+
+    with pytest.raises(ValueError):
+        single_flight.do('key', func)
+
+    assert 'result' == single_flight.do('key', lambda: 'result')
+
@@ -0,0 +1,69 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import json
+
+import pytest
+
+from subscription_manager_client.streaming import iter_json_array
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+def chunked(data, chunk_size):
+    text = json.dumps(data).encode('utf-8')
+
+    return [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 7, 1024])
+def test_iter_json_array__items_are_decoded_regardless_of_chunk_boundaries(chunk_size):
+    data = [{'id': i, 'queue': f'queue_é_{i}', 'topic': {'name': 'topic', 'id': 1}} for i in range(20)]
+    data += [123456, -0.25, 1.5e10, 'text', True, None, []]
+
+    assert data == list(iter_json_array(chunked(data, chunk_size)))
+
+
+@pytest.mark.parametrize('chunks', [[b'[]'], [b' [', b' ', b'] ']])
+def test_iter_json_array__empty_array(chunks):
+    assert [] == list(iter_json_array(chunks))
+
+
+def test_iter_json_array__items_are_yielded_before_the_end_of_the_input():
+    def chunks():
+        yield b'[{"id": 1}, '
+        raise AssertionError('the first item should have been yielded already')
+
+    assert {'id': 1} == next(iter_json_array(chunks()))
+
+
+@pytest.mark.parametrize('text', [b'{}', b'[', b'[1,', b'[1 2]', b'[1,]', b'[1.]'])
+def test_iter_json_array__invalid_input__raises_valueerror(text):
+    with pytest.raises(ValueError):
+        list(iter_json_array([text]))
@@ -27,13 +27,24 @@ http://opensource.org/licenses/BSD-3-Clause
 
 Details on EUROCONTROL: http://www.eurocontrol.int
 """
-from unittest.mock import Mock
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
 
 import pytest
 from rest_client.errors import APIError
 
-from subscription_manager_client.subscription_manager import SubscriptionManagerClient
-from tests.utils import make_topic_list, make_topic, make_subscription_list, make_subscription
+from subscription_manager_client.cache import TTLCache, SQLiteCatalogCache
+from subscription_manager_client.json_codec import JSONCodec
+from subscription_manager_client.metrics import ClientMetrics
+from subscription_manager_client.models import TopicInterner, Subscription, SUBSCRIPTION_SERIALIZER
+from subscription_manager_client.subscription_manager import SubscriptionManagerClient, _subscription_response_class
+from subscription_manager_client.testing import FakeSubscriptionManager
+from subscription_manager_client.topic_index import TopicIndex
+from subscription_manager_client.tracing import RecordingTracer, phase, DESERIALIZE
+from tests.utils import make_topic_list, make_topic, make_subscription_list, make_subscription, \
+    make_list_response, make_catalog_request_handler, make_reconcile_request_handler, make_fake_request_handler
 
 __author__ = "EUROCONTROL (SWIM)"
 
@@ -416,3 +427,869 @@ def test_delete_subscription_by_id():
 
     called_url = request_handler.delete.call_args[0][0]
     assert BASE_URL + 'subscriptions/1' == called_url
+
+
+def test_post_subscriptions__results_and_errors_are_returned_per_subscription():
+    subscription_dict, expected_subscription = make_subscription()
+
+    success_response = Mock()
+    success_response.status_code = 201
+    success_response.content = subscription_dict
+    success_response.json = Mock(return_value=subscription_dict)
+
+    error_response = Mock()
+    error_response.status_code = 400
+
+    request_handler = Mock()
+    request_handler.post = Mock(side_effect=[success_response, error_response, success_response])
+
+    client = SubscriptionManagerClient(request_handler=request_handler)
+
+    subscriptions = [Mock(), Mock(), Mock()]
+    results = client.post_subscriptions(subscriptions, max_workers=1)
+
+    assert subscriptions == [result.item for result in results]
+    assert [True, False, True] == [result.ok for result in results]
+    assert expected_subscription == results[0].result
+    assert isinstance(results[1].error, APIError)
+    assert 3 == request_handler.post.call_count
+
+
+def test_delete_subscriptions__results_and_errors_are_returned_per_subscription_id():
+    success_response = Mock()
+    success_response.status_code = 204
+    success_response.content = {}
+    success_response.json = Mock(return_value={})
+
+    error_response = Mock()
+    error_response.status_code = 404
+
+    request_handler = Mock()
+    request_handler.delete = Mock(side_effect=[error_response, success_response])
+
+    client = SubscriptionManagerClient(request_handler=request_handler)
+
+    results = client.delete_subscriptions([1, 2], max_workers=1)
+
+    assert [1, 2] == [result.item for result in results]
+    assert [False, True] == [result.ok for result in results]
+
+    called_urls = [call[0][0] for call in request_handler.delete.call_args_list]
+    assert [BASE_URL + 'subscriptions/1', BASE_URL + 'subscriptions/2'] == called_urls
+
+
+def test_get_topics__with_topic_cache__server_is_requested_once():
+    topic_dict_list, expected_topic_list = make_topic_list()
+
+    response = Mock()
+    response.status_code = 200
+    response.content = topic_dict_list
+    response.json = Mock(return_value=topic_dict_list)
+
+    request_handler = Mock()
+    request_handler.get = Mock(return_value=response)
+
+    client = SubscriptionManagerClient(request_handler=request_handler, topic_cache=TTLCache())
+
+    assert expected_topic_list == client.get_topics()
+    assert expected_topic_list == client.get_topics()
+    assert 1 == request_handler.get.call_count
+
+
+def test_get_topic_by_id__with_topic_cache__server_is_requested_once():
+    topic_dict, expected_topic = make_topic()
+
+    response = Mock()
+    response.status_code = 200
+    response.content = topic_dict
+    response.json = Mock(return_value=topic_dict)
+
+    request_handler = Mock()
+    request_handler.get = Mock(return_value=response)
+
+    client = SubscriptionManagerClient(request_handler=request_handler, topic_cache=TTLCache())
+
+    assert expected_topic == client.get_topic_by_id(1)
+    assert expected_topic == client.get_topic_by_id(1)
+    assert 1 == request_handler.get.call_count
+
+
+def test_post_topic__with_topic_cache__topic_lists_are_evicted_and_topic_is_cached():
+    topic_dict, expected_topic = make_topic()
+
+    response = Mock()
+    response.status_code = 201
+    response.content = topic_dict
+    response.json = Mock(return_value=topic_dict)
+
+    request_handler = Mock()
+    request_handler.post = Mock(return_value=response)
+
+    topic_cache = TTLCache()
+    topic_cache.set('topics', [])
+    topic_cache.set('topics_own', [])
+    client = SubscriptionManagerClient(request_handler=request_handler, topic_cache=topic_cache)
+
+    client.post_topic(Mock())
+
+    assert 'topics' not in topic_cache
+    assert 'topics_own' not in topic_cache
+    assert expected_topic == topic_cache.get(('topic', 1))
+
+
+def test_delete_topic_by_id__with_topic_cache__topic_entries_are_evicted():
+    response = Mock()
+    response.status_code = 204
+    response.content = {}
+    response.json = Mock(return_value={})
+
+    request_handler = Mock()
+    request_handler.delete = Mock(return_value=response)
+
+    topic_cache = TTLCache()
+    topic_cache.set('topics', [])
+    topic_cache.set(('topic', 1), Mock())
+    client = SubscriptionManagerClient(request_handler=request_handler, topic_cache=topic_cache)
+
+    client.delete_topic_by_id(1)
+
+    assert 'topics' not in topic_cache
+    assert ('topic', 1) not in topic_cache
+
+
+def test_get_topic_by_name__index_is_built_once():
+    topic_dict_list, expected_topic_list = make_topic_list()
+
+    response = Mock()
+    response.status_code = 200
+    response.content = topic_dict_list
+    response.json = Mock(return_value=topic_dict_list)
+
+    request_handler = Mock()
+    request_handler.get = Mock(return_value=response)
+
+    client = SubscriptionManagerClient(request_handler=request_handler)
+
+    assert expected_topic_list[1] == client.get_topic_by_name('another_topic')
+    assert expected_topic_list[0].id == client.resolve_topic('topic')
+    assert 1 == request_handler.get.call_count
+
+
+def test_get_topic_by_name__unknown_topic__raises_valueerror():
+    topic_dict_list, _ = make_topic_list()
+
+    response = Mock()
+    response.status_code = 200
+    response.content = topic_dict_list
+    response.json = Mock(return_value=topic_dict_list)
+
+    request_handler = Mock()
+    request_handler.get = Mock(return_value=response)
+
+    client = SubscriptionManagerClient(request_handler=request_handler)
+
+    with pytest.raises(ValueError) as e:
+        client.resolve_topic('unknown')
+    assert "no topic named 'unknown'" == str(e.value)
+
+
+def test_get_topic_by_name__repeated_unknown_name__topics_are_retrieved_once():
+    topic_dict_list, _ = make_topic_list()
+
+    response = Mock()
+    response.status_code = 200
+    response.content = topic_dict_list
+    response.json = Mock(return_value=topic_dict_list)
+
+    request_handler = Mock()
+    request_handler.get = Mock(return_value=response)
+
+    client = SubscriptionManagerClient(request_handler=request_handler)
+
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            client.get_topic_by_name('unknown')
+
+    assert 1 == request_handler.get.call_count
+
+
+def test_post_topic__created_topic_is_indexed_by_name():
+    topic_dict, expected_topic = make_topic()
+
+    response = Mock()
+    response.status_code = 201
+    response.content = topic_dict
+    response.json = Mock(return_value=topic_dict)
+
+    request_handler = Mock()
+    request_handler.post = Mock(return_value=response)
+
+    client = SubscriptionManagerClient(request_handler=request_handler)
+    client.post_topic(Mock())
+
+    assert expected_topic == client.get_topic_by_name('topic')
+    request_handler.get.assert_not_called()
+
+
+def test_get_topic_by_name__expired_topic__index_is_rebuilt():
+    topic_dict_list, expected_topic_list = make_topic_list()
+
+    response = Mock()
+    response.status_code = 200
+    response.content = topic_dict_list
+    response.json = Mock(return_value=topic_dict_list)
+
+    deleted_response = Mock()
+    deleted_response.status_code = 200
+    deleted_response.content = topic_dict_list[1:]
+    deleted_response.json = Mock(return_value=topic_dict_list[1:])
+
+    request_handler = Mock()
+    request_handler.get = Mock(side_effect=[response, deleted_response])
+
+    clock = Mock(return_value=0)
+    client = SubscriptionManagerClient(request_handler=request_handler)
+    client._topic_index = TopicIndex(ttl=60, clock=clock)
+
+    assert expected_topic_list[0] == client.get_topic_by_name('topic')
+
+    clock.return_value = 60
+    with pytest.raises(ValueError):
+        client.get_topic_by_name('topic')
+    assert 2 == request_handler.get.call_count
+
+
+def test_get_subscriptions__conditional_requests__not_modified_response_reuses_previous_result():
+    subscription_dict_list, expected_subscription_list = make_subscription_list()
+
+    response = Mock()
+    response.status_code = 200
+    response.headers = {'ETag': '"v1"'}
+    response.json = Mock(return_value=subscription_dict_list)
+
+    not_modified_response = Mock()
+    not_modified_response.status_code = 304
+
+    request_handler = Mock()
+    request_handler.get = Mock(side_effect=[response, not_modified_response])
+
+    client = SubscriptionManagerClient(request_handler=request_handler, conditional_requests=True)
+
+    assert expected_subscription_list == client.get_subscriptions(queue='queue')
+    assert expected_subscription_list == client.get_subscriptions(queue='queue')
+
+    first_call, second_call = request_handler.get.call_args_list
+    assert {} == first_call[1]['headers']
+    assert {'If-None-Match': '"v1"'} == second_call[1]['headers']
+    assert {'queue': 'queue'} == second_call[1]['params']
+    not_modified_response.json.assert_not_called()
+
+
+def test_get_subscriptions__conditional_requests__not_modified_response__models_are_not_decoded_again():
+    subscription_dict_list, expected_subscription_list = make_subscription_list()
+
+    response = Mock()
+    response.status_code = 200
+    response.headers = {'ETag': '"v1"'}
+    response.json = Mock(return_value=subscription_dict_list)
+
+    not_modified_response = Mock()
+    not_modified_response.status_code = 304
+
+    request_handler = Mock()
+    request_handler.get = Mock(side_effect=[response, not_modified_response])
+
+    client = SubscriptionManagerClient(request_handler=request_handler, conditional_requests=True)
+
+    with patch.object(SUBSCRIPTION_SERIALIZER, 'from_json', wraps=SUBSCRIPTION_SERIALIZER.from_json) as from_json:
+        assert expected_subscription_list == client.get_subscriptions()
+        assert len(subscription_dict_list) == from_json.call_count
+
+        assert expected_subscription_list == client.get_subscriptions()
+        assert len(subscription_dict_list) == from_json.call_count
+
+
+def test_conditional_requests__lazy_plain_and_columnar_calls_share_the_validated_records():
+    subscription_dict_list, expected_subscription_list = make_subscription_list()
+
+    response = Mock()
+    response.status_code = 200
+    response.headers = {'ETag': '"v1"'}
+    response.json = Mock(return_value=subscription_dict_list)
+
+    not_modified_response = Mock()
+    not_modified_response.status_code = 304
+
+    request_handler = Mock()
+    request_handler.get = Mock(side_effect=[response, not_modified_response, not_modified_response,
+                                            not_modified_response])
+
+    client = SubscriptionManagerClient(request_handler=request_handler, conditional_requests=True)
+
+    assert expected_subscription_list == list(client.get_subscriptions(lazy=True))
+    assert expected_subscription_list == client.get_subscriptions()
+    assert expected_subscription_list[0] == client.get_subscriptions(lazy=True)[0]
+
+    columns = client.get_subscription_columns()
+    assert [subscription.queue for subscription in expected_subscription_list] == \
+        [columns.queue[row] for row in range(len(columns))]
+    assert 4 == request_handler.get.call_count
+
+
+@pytest.mark.parametrize('error_code', [400, 401, 403, 404, 500])
+def test_get_topics__conditional_requests__http_error_code__raises_api_error(error_code):
+    response = Mock()
+    response.status_code = error_code
+
+    request_handler = Mock()
+    request_handler.get = Mock(return_value=response)
+
+    client = SubscriptionManagerClient(request_handler=request_handler, conditional_requests=True)
+
+    with pytest.raises(APIError):
+        client.get_topics()
+
+
+def test_iter_subscriptions__subscriptions_are_streamed():
+    subscription_dict_list, expected_subscription_list = make_subscription_list()
+    body = json.dumps(subscription_dict_list).encode('utf-8')
+
+    response = Mock()
+    response.status_code = 200
+    response.iter_content = Mock(return_value=[body[:10], body[10:]])
+
+    request_handler = Mock()
+    request_handler.get = Mock(return_value=response)
+
+    client = SubscriptionManagerClient(request_handler=request_handler)
+
+    subscription_list = list(client.iter_subscriptions(queue='queue'))
+
+    assert expected_subscription_list == subscription_list
+
+    called_url = request_handler.get.call_args[0][0]
+    assert BASE_URL + 'subscriptions/' == called_url
+    assert {'queue': 'queue'} == request_handler.get.call_args[1]['params']
+    assert request_handler.get.call_args[1]['stream'] is True
+    response.close.assert_called_once()
+
+
+@pytest.mark.parametrize('error_code', [400, 401, 403, 404, 500])
+def test_iter_topics__http_error_code__raises_api_error(error_code):
+    response = Mock()
+    response.status_code = error_code
+
+    request_handler = Mock()
+    request_handler.get = Mock(return_value=response)
+
+    client = SubscriptionManagerClient(request_handler=request_handler)
+
+    with pytest.raises(APIError):
+        list(client.iter_topics())
+    response.close.assert_called_once()
+
+
+def test_get_subscriptions__page_and_limit_are_passed_as_params():
+    subscription_dict_list, expected_subscription_list = make_subscription_list()
+
+    response = Mock()
+    response.status_code = 200
+    response.content = subscription_dict_list
+    response.json = Mock(return_value=subscription_dict_list)
+
+    request_handler = Mock()
+    request_handler.get = Mock(return_value=response)
+
+    client = SubscriptionManagerClient(request_handler=request_handler)
+
+    assert expected_subscription_list == client.get_subscriptions(queue='queue', page=2, limit=2)
+    assert {'queue': 'queue', 'page': 2, 'limit': 2} == request_handler.get.call_args[1]['params']
+
+
+def test_paginate_topics__pages_are_requested_until_a_partial_one():
+    topic_dict_list, expected_topic_list = make_topic_list()
+
+    full_page_response = Mock()
+    full_page_response.status_code = 200
+    full_page_response.content = topic_dict_list
+    full_page_response.json = Mock(return_value=topic_dict_list)
+
+    partial_page_response = Mock()
+    partial_page_response.status_code = 200
+    partial_page_response.content = topic_dict_list[:1]
+    partial_page_response.json = Mock(return_value=topic_dict_list[:1])
+
+    request_handler = Mock()
+    request_handler.get = Mock(side_effect=[full_page_response, partial_page_response])
+
+    client = SubscriptionManagerClient(request_handler=request_handler)
+
+    topic_list = list(client.paginate_topics(limit=2))
+
+    assert expected_topic_list + expected_topic_list[:1] == topic_list
+    requested_params = [call[1]['params'] for call in request_handler.get.call_args_list]
+    assert [{'page': 1, 'limit': 2}, {'page': 2, 'limit': 2}] == requested_params
+
+
+def test_get_subscriptions__with_topic_interner__subscriptions_share_topics():
+    subscription_dict_list, expected_subscription_list = make_subscription_list()
+
+    response = Mock()
+    response.status_code = 200
+    response.content = subscription_dict_list
+    response.json = Mock(return_value=subscription_dict_list)
+
+    request_handler = Mock()
+    request_handler.get = Mock(return_value=response)
+
+    client = SubscriptionManagerClient(request_handler=request_handler)
+
+    subscription_list = client.get_subscriptions(topic_interner=TopicInterner())
+
+    assert expected_subscription_list == subscription_list
+    assert subscription_list[0].topic is subscription_list[1].topic
+
+
+def test_subscription_response_class__same_topic_interner__decoders_are_equal():
+    topic_interner = TopicInterner()
+
+    decoder = _subscription_response_class(topic_interner)
+
+    assert _subscription_response_class(topic_interner) == decoder
+    assert hash(_subscription_response_class(topic_interner)) == hash(decoder)
+    assert _subscription_response_class(TopicInterner()) != decoder
+
+
+def test_get_topics__coalesce_requests__concurrent_calls_share_a_single_request():
+    topic_dict_list, expected_topic_list = make_topic_list()
+    release = threading.Event()
+
+    response = Mock()
+    response.status_code = 200
+    response.content = topic_dict_list
+    response.json = Mock(return_value=topic_dict_list)
+
+    def get(*args, **kwargs):
+        release.wait(timeout=1)
+        return response
+
+    request_handler = Mock()
+    request_handler.get = Mock(side_effect=get)
+
+    client = SubscriptionManagerClient(request_handler=request_handler, coalesce_requests=True)
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(client.get_topics) for _ in range(5)]
+        while request_handler.get.call_count == 0:
+            pass
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert all(expected_topic_list == result for result in results)
+    assert request_handler.get.call_count < 5
+
+
+def test_get_subscriptions__coalesce_requests__with_topic_interner__concurrent_calls_share_a_single_request():
+    subscription_dict_list, expected_subscription_list = make_subscription_list()
+    topic_interner = TopicInterner()
+    release = threading.Event()
+
+    response = Mock()
+    response.status_code = 200
+    response.content = subscription_dict_list
+    response.json = Mock(return_value=subscription_dict_list)
+
+    def get(*args, **kwargs):
+        release.wait(timeout=1)
+        return response
+
+    request_handler = Mock()
+    request_handler.get = Mock(side_effect=get)
+
+    client = SubscriptionManagerClient(request_handler=request_handler, coalesce_requests=True)
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(client.get_subscriptions, topic_interner=topic_interner) for _ in range(5)]
+        while request_handler.get.call_count == 0:
+            pass
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert all(expected_subscription_list == result for result in results)
+    assert request_handler.get.call_count < 5
+
+
+def test_set_subscriptions_active__subscriptions_already_in_the_target_state_are_skipped():
+    subscription_dict, expected_subscription = make_subscription()
+
+    response = Mock()
+    response.status_code = 200
+    response.content = subscription_dict
+    response.json = Mock(return_value=subscription_dict)
+
+    request_handler = Mock()
+    request_handler.put = Mock(return_value=response)
+
+    client = SubscriptionManagerClient(request_handler=request_handler)
+
+    active_subscription = Subscription(queue='active', active=True, id=2)
+    inactive_subscription = Subscription(queue='inactive', active=False, id=3)
+
+    results = client.set_subscriptions_active([1, active_subscription, inactive_subscription], active=True)
+
+    assert [1, active_subscription, inactive_subscription] == [result.item for result in results]
+    assert [False, True, False] == [result.skipped for result in results]
+    assert active_subscription is results[1].result
+    assert expected_subscription == results[0].result
+
+    called_urls = sorted(call[0][0] for call in request_handler.put.call_args_list)
+    assert [BASE_URL + 'subscriptions/1', BASE_URL + 'subscriptions/3'] == called_urls
+    assert all({'active': True} == call[1]['json'] for call in request_handler.put.call_args_list)
+
+
+def test_reconcile__only_the_needed_requests_are_performed():
+    subscription_dict_list, current_subscriptions = make_subscription_list()
+    subscription_dict, _ = make_subscription(queue='new_queue')
+
+    get_response = Mock()
+    get_response.status_code = 200
+    get_response.content = subscription_dict_list
+    get_response.json = Mock(return_value=subscription_dict_list)
+
+    post_response = Mock()
+    post_response.status_code = 201
+    post_response.content = subscription_dict
+    post_response.json = Mock(return_value=subscription_dict)
+
+    request_handler = Mock()
+    request_handler.get = Mock(return_value=get_response)
+    request_handler.post = Mock(return_value=post_response)
+
+    client = SubscriptionManagerClient(request_handler=request_handler)
+
+    desired = [Subscription(queue='queue', topic_id=1), Subscription(topic_id=2)]
+    report = client.reconcile(desired, delete_unmatched=False)
+
+    assert 1 == len(report.created)
+    assert [current_subscriptions[0]] == report.unchanged
+    assert [] == report.updated
+    assert [] == report.deleted
+    assert [] == report.failed
+    request_handler.get.assert_called_once()
+    request_handler.post.assert_called_once()
+    request_handler.put.assert_not_called()
+    request_handler.delete.assert_not_called()
+
+
+def test_reconcile__dry_run__no_changes_are_applied():
+    subscription_dict_list, current_subscriptions = make_subscription_list()
+
+    get_response = Mock()
+    get_response.status_code = 200
+    get_response.content = subscription_dict_list
+    get_response.json = Mock(return_value=subscription_dict_list)
+
+    request_handler = Mock()
+    request_handler.get = Mock(return_value=get_response)
+
+    client = SubscriptionManagerClient(request_handler=request_handler)
+
+    report = client.reconcile([], dry_run=True)
+
+    assert current_subscriptions == report.deleted
+    request_handler.delete.assert_not_called()
+
+
+def test_reconcile__replaced_subscription_is_deleted_before_being_recreated():
+    subscription_dict, _ = make_subscription(queue='queue')
+    request_handler = make_reconcile_request_handler([subscription_dict])
+
+    calls = []
+    delete, post = request_handler.delete, request_handler.post
+    request_handler.delete = Mock(side_effect=lambda *args, **kwargs: calls.append('delete') or delete(*args))
+    request_handler.post = Mock(side_effect=lambda *args, **kwargs: calls.append('post') or post(*args))
+
+    client = SubscriptionManagerClient(request_handler=request_handler)
+
+    report = client.reconcile([Subscription(queue='queue', topic_id=1, qos='AT_MOST_ONCE')], delete_unmatched=False)
+
+    assert ['delete', 'post'] == calls
+    assert 1 == len(report.deleted)
+    assert 1 == len(report.created)
+    assert [] == report.failed
+
+
+def test_reconcile__second_run__no_actions_are_performed():
+    with FakeSubscriptionManager(seed=0) as fake:
+        topic = fake.add_topic('topic')
+        fake.add_subscription(topic['id'], qos='AT_LEAST_ONCE', queue='queue')
+
+        client = SubscriptionManagerClient(request_handler=make_fake_request_handler(fake))
+
+        desired = [Subscription(queue='queue', topic_id=topic['id'], qos='EXACTLY_ONCE'),
+                   Subscription(queue='unknown_queue', topic_id=topic['id'], qos='AT_MOST_ONCE', durable=True)]
+
+        first_report = client.reconcile(desired)
+        second_report = client.reconcile(desired)
+
+    assert (2, 1, []) == (len(first_report.created), len(first_report.deleted), first_report.failed)
+    assert not second_report.changed
+    assert sorted(subscription.id for subscription in first_report.created) == \
+        sorted(subscription.id for subscription in second_report.unchanged)
+
+
+def test_metrics__requests_and_errors_are_tracked_per_endpoint():
+    topic_dict_list, _ = make_topic_list()
+
+    response = Mock()
+    response.status_code = 200
+    response.content = topic_dict_list
+    response.json = Mock(return_value=topic_dict_list)
+
+    error_response = Mock()
+    error_response.status_code = 404
+
+    request_handler = Mock()
+    request_handler.get = Mock(side_effect=[response, error_response])
+
+    metrics = ClientMetrics()
+    client = SubscriptionManagerClient(request_handler=request_handler, metrics=metrics)
+
+    client.get_topics()
+    with pytest.raises(APIError):
+        client.get_subscription_by_id(1)
+
+    assert 1 == metrics.requests.value(endpoint='get_topics')
+    assert 1 == metrics.requests.value(endpoint='get_subscription_by_id')
+    assert 1 == metrics.errors.value(endpoint='get_subscription_by_id', status='404')
+    assert 0 == metrics.in_flight.value(endpoint='get_topics')
+    assert 1 == metrics.latency.count(endpoint='get_topics')
+    assert 'subscription_manager_client_errors_total{endpoint="get_subscription_by_id",status="404"} 1' \
+        in metrics.render()
+
+
+def test_tracer__calls_are_traced_and_the_trace_context_is_propagated():
+    subscription_dict, expected_subscription = make_subscription()
+
+    response = Mock()
+    response.status_code = 201
+    response.content = subscription_dict
+    response.json = Mock(return_value=subscription_dict)
+
+    request_handler = Mock()
+    request_handler.post = Mock(return_value=response)
+
+    tracer = RecordingTracer()
+    tracer.after_decode = Mock()
+    client = SubscriptionManagerClient(request_handler=request_handler, tracer=tracer)
+
+    subscription = client.post_subscription(expected_subscription)
+
+    assert expected_subscription == subscription
+
+    [span] = tracer.spans
+    assert 'post_subscription' == span.name
+    assert span.error is None
+    assert span.traceparent == request_handler.post.call_args[1]['headers']['traceparent']
+    tracer.after_decode.assert_called_once_with(span, subscription)
+
+
+def test_tracer__list_is_decoded_in_a_single_deserialize_phase():
+    subscription_dict_list, expected_subscription_list = make_subscription_list()
+
+    response = Mock()
+    response.status_code = 200
+    response.content = subscription_dict_list
+    response.json = Mock(return_value=subscription_dict_list)
+
+    request_handler = Mock()
+    request_handler.get = Mock(return_value=response)
+
+    tracer = RecordingTracer()
+    client = SubscriptionManagerClient(request_handler=request_handler, tracer=tracer)
+
+    with patch('subscription_manager_client.subscription_manager.phase', wraps=phase) as traced_phase:
+        assert expected_subscription_list == client.get_subscriptions()
+
+    traced_phase.assert_called_once_with(DESERIALIZE)
+    [span] = tracer.spans
+    assert 'get_subscriptions' == span.name
+
+
+def test_json_codec__responses_are_decoded_from_their_bytes_by_the_codec():
+    subscription_dict_list, expected_subscription_list = make_subscription_list()
+
+    response = Mock()
+    response.status_code = 200
+    response.content = json.dumps(subscription_dict_list).encode('utf-8')
+    response.json = Mock(side_effect=AssertionError('the codec should be used instead'))
+
+    request_handler = Mock()
+    request_handler.get = Mock(return_value=response)
+
+    client = SubscriptionManagerClient(request_handler=request_handler, json_codec=JSONCodec())
+
+    assert expected_subscription_list == client.get_subscriptions()
+
+
+def test_get_subscriptions__lazy__subscriptions_are_built_upon_access():
+    subscription_dict_list, expected_subscription_list = make_subscription_list()
+
+    response = Mock()
+    response.status_code = 200
+    response.content = subscription_dict_list
+    response.json = Mock(return_value=subscription_dict_list)
+
+    request_handler = Mock()
+    request_handler.get = Mock(return_value=response)
+
+    client = SubscriptionManagerClient(request_handler=request_handler)
+
+    subscriptions = client.get_subscriptions(lazy=True)
+
+    assert len(expected_subscription_list) == len(subscriptions)
+    assert expected_subscription_list == list(subscriptions)
+    assert [expected_subscription_list[0]] == subscriptions.filter(queue=expected_subscription_list[0].queue)
+
+
+def test_get_topics__lazy__topics_are_built_upon_access():
+    topic_dict_list, expected_topic_list = make_topic_list()
+
+    response = Mock()
+    response.status_code = 200
+    response.content = topic_dict_list
+    response.json = Mock(return_value=topic_dict_list)
+
+    request_handler = Mock()
+    request_handler.get = Mock(return_value=response)
+
+    client = SubscriptionManagerClient(request_handler=request_handler, topic_cache=TTLCache())
+
+    assert expected_topic_list == list(client.get_topics(lazy=True))
+    assert expected_topic_list[1:] == list(client.get_topics(lazy=True)[1:])
+    request_handler.get.assert_called_once()
+
+
+def test_get_subscription_columns():
+    subscription_dict_list, expected_subscription_list = make_subscription_list()
+
+    response = Mock()
+    response.status_code = 200
+    response.content = subscription_dict_list
+    response.json = Mock(return_value=subscription_dict_list)
+
+    request_handler = Mock()
+    request_handler.get = Mock(return_value=response)
+
+    client = SubscriptionManagerClient(request_handler=request_handler)
+
+    columns = client.get_subscription_columns()
+
+    assert [subscription.id for subscription in expected_subscription_list] == list(columns.id)
+    assert [subscription.queue for subscription in expected_subscription_list] == \
+        [columns.queue[row] for row in range(len(columns))]
+
+
+def test_catalog_cache__lists_are_served_from_the_catalog_of_a_previous_process(tmp_path):
+    topic_dict_list, expected_topic_list = make_topic_list()
+    path = str(tmp_path / 'catalog.db')
+
+    request_handler = make_catalog_request_handler()
+    request_handler.get = Mock(return_value=make_list_response(topic_dict_list, etag='"v1"'))
+    SubscriptionManagerClient(request_handler=request_handler, catalog_cache=SQLiteCatalogCache(path)).get_topics()
+
+    request_handler = make_catalog_request_handler()
+    client = SubscriptionManagerClient(request_handler=request_handler,
+                                       catalog_cache=SQLiteCatalogCache(path, revalidate_after=3600))
+
+    assert expected_topic_list == client.get_topics()
+    request_handler.get.assert_not_called()
+
+
+def test_catalog_cache__stale_entries_are_served_and_revalidated_in_the_background(tmp_path):
+    topic_dict_list, expected_topic_list = make_topic_list()
+    catalog_cache = SQLiteCatalogCache(str(tmp_path / 'catalog.db'), revalidate_after=0)
+
+    request_handler = make_catalog_request_handler()
+    request_handler.get = Mock(side_effect=[make_list_response(topic_dict_list, etag='"v1"'),
+                                            make_list_response([], status_code=304)])
+
+    client = SubscriptionManagerClient(request_handler=request_handler, catalog_cache=catalog_cache)
+
+    assert expected_topic_list == client.get_topics()
+    assert expected_topic_list == client.get_topics()
+
+    for thread in list(client._revalidations.values()):
+        thread.join()
+
+    assert 2 == request_handler.get.call_count
+    assert {'If-None-Match': '"v1"'} == request_handler.get.call_args[1]['headers']
+
+
+def test_catalog_cache__entries_of_other_servers_or_accounts_are_not_served(tmp_path):
+    topic_dict_list, _ = make_topic_list()
+    path = str(tmp_path / 'catalog.db')
+
+    request_handler = make_catalog_request_handler(username='alice')
+    request_handler.get = Mock(return_value=make_list_response(topic_dict_list))
+    SubscriptionManagerClient(request_handler=request_handler,
+                              catalog_cache=SQLiteCatalogCache(path, revalidate_after=3600)).get_topics_own()
+
+    for request_handler in [make_catalog_request_handler(username='bob'),
+                            make_catalog_request_handler(base_url='https://other-host/', username='alice')]:
+        request_handler.get = Mock(return_value=make_list_response([]))
+        client = SubscriptionManagerClient(request_handler=request_handler,
+                                           catalog_cache=SQLiteCatalogCache(path, revalidate_after=3600))
+
+        assert [] == client.get_topics_own()
+        request_handler.get.assert_called_once()
+
+
+def test_catalog_cache__handler_without_base_url__namespace_is_required(tmp_path):
+    catalog_cache = SQLiteCatalogCache(str(tmp_path / 'catalog.db'))
+
+    with pytest.raises(ValueError):
+        SubscriptionManagerClient(request_handler=Mock(), catalog_cache=catalog_cache)
+
+    SubscriptionManagerClient(request_handler=Mock(), catalog_cache=catalog_cache, catalog_namespace='tenant')
+
+
+def test_catalog_cache__is_cleared_upon_changes(tmp_path):
+    subscription_dict_list, _ = make_subscription_list()
+    catalog_cache = SQLiteCatalogCache(str(tmp_path / 'catalog.db'))
+
+    delete_response = Mock()
+    delete_response.status_code = 204
+
+    request_handler = make_catalog_request_handler()
+    request_handler.get = Mock(return_value=make_list_response(subscription_dict_list))
+    request_handler.delete = Mock(return_value=delete_response)
+
+    client = SubscriptionManagerClient(request_handler=request_handler, catalog_cache=catalog_cache)
+    client.get_subscriptions()
+    assert 1 == len(catalog_cache)
+
+    catalog_cache.set('another namespace', [])
+
+    client.delete_subscription_by_id(1)
+
+    assert 1 == len(catalog_cache)
+    assert catalog_cache.get('another namespace') is not None
+
+
+def test_watch_subscriptions__changes_are_emitted():
+    subscription_dict_1, subscription_1 = make_subscription(queue='queue', id=1)
+    subscription_dict_2, _ = make_subscription(queue='another_queue', id=2)
+
+    request_handler = Mock()
+    request_handler.get = Mock(side_effect=[make_list_response([subscription_dict_2]),
+                                            make_list_response([subscription_dict_1, subscription_dict_2])])
+
+    client = SubscriptionManagerClient(request_handler=request_handler)
+
+    watcher = client.watch_subscriptions(min_interval=0.001, max_interval=0.001)
+    event = next(iter(watcher))
+    watcher.stop()
+
+    assert 'created' == event.type
+    assert subscription_1 == event.subscription
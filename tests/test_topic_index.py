@@ -0,0 +1,96 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+from subscription_manager_client.models import Topic
+from subscription_manager_client.topic_index import TopicIndex
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_topic_index__rebuild_replaces_the_indexed_topics():
+    index = TopicIndex()
+    index.add(Topic(name='old', id=1))
+
+    index.rebuild([Topic(name='topic', id=2), Topic(name='another_topic', id=3)])
+
+    assert index.get('old') is None
+    assert Topic(name='topic', id=2) == index.get('topic')
+    assert 2 == len(index)
+
+
+def test_topic_index__remove_by_id():
+    index = TopicIndex()
+    index.rebuild([Topic(name='topic', id=1), Topic(name='another_topic', id=2)])
+
+    index.remove(1)
+
+    assert index.get('topic') is None
+    assert Topic(name='another_topic', id=2) == index.get('another_topic')
+
+
+def test_topic_index__misses_are_remembered_for_a_while():
+    clock = FakeClock()
+    index = TopicIndex(miss_ttl=30, clock=clock)
+
+    index.record_miss('unknown')
+    assert index.is_recent_miss('unknown')
+    assert not index.is_recent_miss('another')
+
+    clock.now += 30
+    assert not index.is_recent_miss('unknown')
+
+
+def test_topic_index__added_topic_is_not_a_miss_anymore():
+    index = TopicIndex()
+    index.record_miss('topic')
+
+    index.add(Topic(name='topic', id=1))
+
+    assert not index.is_recent_miss('topic')
+
+
+def test_topic_index__indexed_topics_expire():
+    clock = FakeClock()
+    index = TopicIndex(ttl=60, clock=clock)
+    index.rebuild([Topic(name='topic', id=1)])
+
+    clock.now += 59
+    assert Topic(name='topic', id=1) == index.get('topic')
+
+    clock.now += 1
+    assert index.get('topic') is None
@@ -0,0 +1,140 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+from unittest.mock import Mock
+
+import pytest
+
+from subscription_manager_client.tracing import Tracer, RecordingTracer, TracedRequestHandler, \
+    traced, phase, current_span, SERIALIZE, NETWORK, DESERIALIZE
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_traced__span_is_current_within_the_block():
+    tracer = RecordingTracer()
+
+    with traced(tracer, 'get_topics') as span:
+        assert span is current_span()
+
+    assert current_span() is None
+    assert [span] == list(tracer.spans)
+
+
+def test_traced__nested_spans_share_the_trace():
+    tracer = Tracer()
+
+    with traced(tracer, 'outer') as outer:
+        with traced(tracer, 'inner') as inner:
+            pass
+
+    assert outer.trace_id == inner.trace_id
+    assert outer.span_id == inner.parent_id
+
+
+def test_traced__error_is_recorded():
+    tracer = RecordingTracer()
+
+    with pytest.raises(ValueError):
+        with traced(tracer, 'get_topics'):
+            raise ValueError()
+
+    [span] = tracer.spans
+    assert isinstance(span.error, ValueError)
+    assert span.end is not None
+
+
+def test_phase__time_is_added_once_for_nested_blocks():
+    clock = FakeClock()
+    tracer = Tracer(clock=clock)
+
+    with traced(tracer, 'get_topics') as span:
+        with phase(DESERIALIZE):
+            clock.now += 1
+            with phase(DESERIALIZE):
+                clock.now += 2
+        with phase(SERIALIZE):
+            clock.now += 4
+
+    assert {SERIALIZE: 4, NETWORK: 0, DESERIALIZE: 3} == span.timings
+    assert 7 == span.duration
+
+
+def test_phase__no_current_span__does_nothing():
+    with phase(NETWORK):
+        pass
+
+
+def test_traced_request_handler__phases_and_headers():
+    clock = FakeClock()
+    tracer = Tracer(clock=clock)
+
+    response = Mock()
+    response.status_code = 200
+
+    def json():
+        clock.now += 2
+        return []
+
+    def get(url, **kwargs):
+        clock.now += 1
+        return response
+
+    response.json = json
+    request_handler = Mock()
+    request_handler.get = Mock(side_effect=get)
+
+    handler = TracedRequestHandler(request_handler, tracer)
+
+    with traced(tracer, 'get_topics') as span:
+        traced_response = handler.get('url', params={}, headers={'Accept': 'application/json'})
+        assert 200 == traced_response.status_code
+        assert [] == traced_response.json()
+
+    assert {SERIALIZE: 0, NETWORK: 1, DESERIALIZE: 2} == span.timings
+    assert {'Accept': 'application/json', 'traceparent': span.traceparent} == \
+        request_handler.get.call_args[1]['headers']
+
+
+def test_traced_request_handler__outside_a_span__request_is_passed_through():
+    request_handler = Mock()
+    handler = TracedRequestHandler(request_handler, Tracer())
+
+    handler.get('url', params={})
+
+    request_handler.get.assert_called_once_with('url', params={})
@@ -0,0 +1,156 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the 
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following 
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following 
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products 
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, 
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, 
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE 
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative: 
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import threading
+
+import pytest
+
+from subscription_manager_client.lazy import LazySubscriptionList, RawRecord
+from subscription_manager_client.watch import diff_snapshots, AdaptiveInterval, SubscriptionWatcher, \
+    SubscriptionEvent, CREATED, UPDATED, DELETED
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+def snapshot(*records):
+    return LazySubscriptionList(list(records), response_class=RawRecord)
+
+
+def record(id, active=True):
+    return {'id': id, 'queue': f'queue_{id}', 'active': active}
+
+
+def fast_interval():
+    return AdaptiveInterval(min_interval=0.001, max_interval=0.001)
+
+
+def test_diff_snapshots():
+    previous = snapshot(record(1), record(2), record(3))
+    current = snapshot(record(4), record(2, active=False), record(1))
+
+    events = diff_snapshots(previous, current)
+
+    assert [
+        SubscriptionEvent(CREATED, record(4)),
+        SubscriptionEvent(UPDATED, record(2, active=False), previous=record(2)),
+        SubscriptionEvent(DELETED, record(3)),
+    ] == events
+
+
+def test_diff_snapshots__unchanged_subscriptions_are_not_built():
+    built = []
+
+    class Decoder:
+        @staticmethod
+        def from_json(object_dict):
+            built.append(object_dict['id'])
+            return object_dict
+
+    previous = LazySubscriptionList([record(1), record(2)], response_class=Decoder)
+    current = LazySubscriptionList([record(1), record(2, active=False)], response_class=Decoder)
+
+    diff_snapshots(previous, current)
+
+    assert sorted(built) == [2, 2]
+
+
+def test_adaptive_interval__backs_off_and_tightens_after_a_change():
+    interval = AdaptiveInterval(min_interval=1, max_interval=5, factor=2)
+
+    assert [2, 4, 5, 1] == [interval.next(changed=False), interval.next(changed=False),
+                            interval.next(changed=False), interval.next(changed=True)]
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'min_interval': 0},
+    {'min_interval': 10, 'max_interval': 1},
+    {'factor': 0.5},
+])
+def test_adaptive_interval__invalid_arguments__raise_value_error(kwargs):
+    with pytest.raises(ValueError):
+        AdaptiveInterval(**kwargs)
+
+
+def test_watcher__yields_the_changes_between_polls():
+    snapshots = iter([snapshot(record(1)), snapshot(record(1)), snapshot(record(1), record(2)), snapshot(record(2))])
+    watcher = SubscriptionWatcher(lambda: next(snapshots), interval=fast_interval())
+
+    events = iter(watcher)
+
+    assert SubscriptionEvent(CREATED, record(2)) == next(events)
+    assert SubscriptionEvent(DELETED, record(1)) == next(events)
+    watcher.stop()
+
+
+def test_watcher__emit_initial():
+    watcher = SubscriptionWatcher(lambda: snapshot(record(1)), interval=fast_interval(), emit_initial=True)
+
+    assert SubscriptionEvent(CREATED, record(1)) == next(iter(watcher))
+
+
+def test_watcher__errors_are_raised_unless_handled():
+    def fetch():
+        raise ConnectionError()
+
+    with pytest.raises(ConnectionError):
+        next(iter(SubscriptionWatcher(fetch, interval=fast_interval())))
+
+
+def test_watcher__handled_errors__polling_goes_on():
+    errors = []
+    snapshots = iter([snapshot(), ConnectionError(), snapshot(record(1))])
+
+    def fetch():
+        result = next(snapshots)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    watcher = SubscriptionWatcher(fetch, interval=fast_interval(), on_error=errors.append)
+
+    assert SubscriptionEvent(CREATED, record(1)) == next(iter(watcher))
+    assert 1 == len(errors)
+
+
+def test_watcher__start__events_are_passed_to_the_callback_until_stopped():
+    received = threading.Event()
+    events = []
+    snapshots = iter([snapshot(), snapshot(record(1))])
+
+    def callback(event):
+        events.append(event)
+        received.set()
+
+    watcher = SubscriptionWatcher(lambda: next(snapshots, snapshot(record(1))), interval=fast_interval())
+    watcher.start(callback)
+
+    assert received.wait(timeout=5)
+    watcher.stop(timeout=5)
+
+    assert [SubscriptionEvent(CREATED, record(1))] == events
@@ -27,6 +27,10 @@ http://opensource.org/licenses/BSD-3-Clause
 
 Details on EUROCONTROL: http://www.eurocontrol.int
 """
+import json
+from unittest.mock import Mock
+from urllib.parse import urlencode
+
 from subscription_manager_client.models import Topic, Subscription
 
 __author__ = "EUROCONTROL (SWIM)"
@@ -50,7 +54,7 @@ def make_topic_list():
     return [topic_dict_1, topic_dict_2], [topic_1, topic_2]
 
 
-def make_subscription(queue='queue'):
+def make_subscription(queue='queue', id=1):
     subscription_dict = {
         'queue': queue,
         'topic': {
@@ -60,7 +64,7 @@ def make_subscription(queue='queue'):
         'active': True,
         'qos': 'EXACTLY_ONCE',
         'durable': True,
-        'id': 1
+        'id': id
     }
 
     subscription = Subscription.from_json(subscription_dict)
@@ -73,3 +77,63 @@ def make_subscription_list():
     subscription_dict_2, subscription_2 = make_subscription(queue='another_queue')
 
     return [subscription_dict_1, subscription_dict_2], [subscription_1, subscription_2]
+
+
+def make_list_response(object_dict_list, status_code=200, etag=None):
+    response = Mock()
+    response.status_code = status_code
+    response.content = object_dict_list
+    response.json = Mock(return_value=object_dict_list)
+    response.headers = {'ETag': etag} if etag else {}
+
+    return response
+
+
+def make_catalog_request_handler(base_url='https://host/', username='user'):
+    request_handler = Mock()
+    request_handler.base_url = base_url
+    request_handler.auth = (username, 'password')
+
+    return request_handler
+
+
+def make_reconcile_request_handler(subscription_dict_list, delete_status_code=204):
+    request_handler = Mock()
+    request_handler.get = Mock(return_value=make_list_response(subscription_dict_list))
+
+    delete_response = Mock()
+    delete_response.status_code = delete_status_code
+    request_handler.delete = Mock(return_value=delete_response)
+
+    post_response = Mock()
+    post_response.status_code = 201
+    post_response.json = Mock(side_effect=lambda: {**subscription_dict_list[0], 'qos': 'AT_MOST_ONCE', 'id': 2})
+    request_handler.post = Mock(return_value=post_response)
+
+    return request_handler
+
+
+def make_fake_request_handler(fake):
+    """
+    Serves the requests of a client from a FakeSubscriptionManager without going through the network
+    """
+    def request(method, url, params=None, **kwargs):
+        data = kwargs.get('json')
+        body = json.dumps(data).encode() if data is not None else None
+        status_code, content = fake.handle(method, '/' + url, urlencode(params or {}), body)
+
+        response = Mock()
+        response.status_code = status_code
+        response.content = content
+        response.json = Mock(side_effect=lambda: json.loads(content))
+        response.headers = {}
+
+        return response
+
+    request_handler = Mock()
+    for method in ('GET', 'POST', 'PUT', 'DELETE'):
+        setattr(request_handler, method.lower(),
+                Mock(side_effect=lambda url, _method=method, **kwargs: request(_method, url, **kwargs)))
+
+    return request_handler
+